@@ -0,0 +1,102 @@
+"""
+Replay a query log and compare cache hit rates by cache-key strategy.
+
+Usage:
+    python -m benchmarks.canonicalization [query_log.txt]
+
+The log holds one address per line. Without a log, a synthetic log is
+generated from common addresses written the ways users type them.
+"""
+
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+from src.core.canonical import AddressCanonicalizer
+
+BASE_ADDRESSES = [
+    ("New York", "NY"),
+    ("Los Angeles", "CA"),
+    ("Chicago", "IL"),
+    ("Houston", "TX"),
+    ("Phoenix", "AZ"),
+    ("Philadelphia", "PA"),
+    ("San Antonio", "TX"),
+    ("San Diego", "CA"),
+    ("Dallas", "TX"),
+    ("Seattle", "WA"),
+]
+STREETS = ["Main St", "Broadway", "5th Ave", "Sunset Blvd", "Elm Rd"]
+
+
+def spellings(place: str, region: str, full_region: str) -> List[str]:
+    return [
+        f"{place}, {region}",
+        f"{place.lower()} {region.lower()}",
+        f"{place},  {region} ",
+        f"{place.upper()}, {region}",
+        f"{place}, {full_region}",
+        f"{place} {region}, USA",
+    ]
+
+
+def synthetic_log(size: int = 2000, seed: int = 7) -> List[str]:
+    canonicalizer = AddressCanonicalizer()
+    rng = random.Random(seed)
+    addresses = []
+    for place, region in BASE_ADDRESSES:
+        full_region = canonicalizer.region_abbreviations[region.lower()].title()
+        addresses.extend(spellings(place, region, full_region))
+        for street in STREETS:
+            number = rng.randint(1, 999)
+            addresses.extend(
+                spellings(f"{number} {street}, {place}", region, full_region)
+            )
+            addresses.append(
+                f"{number} {street.replace('St', 'Street').replace('Ave', 'Avenue')}, {place}, {region}"
+            )
+    # Popular addresses repeat far more often than rare ones.
+    weights = [1 / (rank + 1) for rank in range(len(addresses))]
+    rng.shuffle(addresses)
+    return rng.choices(addresses, weights=weights, k=size)
+
+
+def replay(log: List[str], key: Callable[[str], str]) -> int:
+    """Return the number of cache misses, i.e. upstream geocodes."""
+    seen = set()
+    for address in log:
+        seen.add(key(address))
+    return len(seen)
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding="utf-8") as file:
+            log = [line.strip() for line in file if line.strip()]
+    else:
+        log = synthetic_log()
+
+    canonicalizer = AddressCanonicalizer()
+    strategies: Dict[str, Callable[[str], str]] = {
+        "raw": lambda address: address,
+        "casefold+whitespace": lambda address: " ".join(address.casefold().split()),
+        "canonical": canonicalizer._canonicalize,
+    }
+
+    print(f"Replayed {len(log)} queries")
+    for name, key in strategies.items():
+        misses = replay(log, key)
+        print(
+            f"{name:>20}: hit rate {1 - misses / len(log):6.1%}, "
+            f"{misses} upstream geocodes"
+        )
+
+    start = time.perf_counter()
+    for address in log:
+        canonicalizer._canonicalize(address)
+    elapsed = time.perf_counter() - start
+    print(f"Canonicalization cost: {elapsed / len(log) * 1e6:.1f} us/address (uncached)")
+
+
+if __name__ == "__main__":
+    main()
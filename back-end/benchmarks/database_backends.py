@@ -0,0 +1,134 @@
+"""
+Benchmark of the history write and read paths per database backend.
+
+Usage:
+    python -m benchmarks.database_backends [records] [mongodb_url]
+
+Writes ``records`` history records in the write-behind flush batches, then
+reads keyset pages from the head and from deep in the history, filtered
+pages and exact counts through HistoryService. SQLite always runs, on a
+temporary file; MongoDB runs when ``mongodb_url`` (default
+MONGODB_TEST_URL, then localhost) answers a ping, on a scratch collection
+that is dropped afterwards.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional
+from motor.motor_asyncio import AsyncIOMotorClient
+from src.core.clients.database.base import DatabaseClient
+from src.core.clients.database.indexes import INDEXES
+from src.core.clients.database.mongodb import MongoDBClient
+from src.core.clients.database.sqlite import SQLiteDatabase, SQLiteDatabaseClient
+from src.history.cursor import encode_cursor
+from src.history.schemas import HistoryFilters
+from src.history.service import HistoryService
+
+FLUSH_SIZE = 500
+READS = 300
+
+
+def record(index: int) -> Dict[str, Any]:
+    return {
+        "kilometers": 1234.5678 + index % 5000,
+        "miles": 767.0987 + index % 5000,
+        "address1": f"{index} Main Street, Springfield, IL 62701, United States",
+        "address2": f"{index % 97} Broadway, New York, NY 10007, United States",
+        "address1_key": f"{index} main street springfield il 62701 united states",
+        "address2_key": f"{index % 97} broadway new york ny 10007 united states",
+        "coordinates": {"point1": [39.7817, -89.6501], "point2": [40.7128, -74.006]},
+        "timestamp": datetime(2024, 1, 1) + timedelta(seconds=index),
+        "ip_address": f"203.0.113.{index % 50}",
+    }
+
+
+async def timed(
+    name: str, operations: int, unit: str, function: Callable[[], Awaitable[Any]]
+) -> None:
+    start = time.perf_counter()
+    await function()
+    elapsed = time.perf_counter() - start
+    print(
+        f"  {name:<22} {operations / elapsed:10.0f} {unit}/s "
+        f"({elapsed / operations * 1e3:.3f} ms each)"
+    )
+
+
+async def run(client: DatabaseClient, records: int) -> None:
+    await client.ensure_indexes(INDEXES["queries"])
+    service = HistoryService(client)
+
+    async def write() -> None:
+        for start in range(0, records, FLUSH_SIZE):
+            await client.create_many(
+                [record(index) for index in range(start, min(start + FLUSH_SIZE, records))]
+            )
+
+    await timed("write (batches)", records, "records", write)
+
+    async def write_single() -> None:
+        for index in range(READS):
+            await client.create(record(records + index))
+
+    await timed("write (single)", READS, "records", write_single)
+
+    middle = (await client.find_many(skip=records // 2, limit=1))[0]["_id"]
+    deep = encode_cursor(str(middle))
+
+    async def read(after: Optional[str] = None, **filters: Any) -> None:
+        for _ in range(READS):
+            await service.get_history_page(
+                after=after, page_size=20, filters=HistoryFilters(**filters)
+            )
+
+    await timed("read first page", READS, "pages", lambda: read())
+    await timed("read deep page", READS, "pages", lambda: read(deep))
+    await timed("read by ip", READS, "pages", lambda: read(ip_address="203.0.113.7"))
+    await timed("read by address", READS, "pages", lambda: read(address="12 main"))
+    await timed("read by search", READS, "pages", lambda: read(search="broadway"))
+
+    async def count() -> None:
+        for _ in range(READS // 10):
+            await client.count({"ip_address": "203.0.113.7"})
+
+    await timed("count by ip", READS // 10, "counts", count)
+
+
+async def main() -> None:
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    url = (
+        sys.argv[2]
+        if len(sys.argv) > 2
+        else os.getenv("MONGODB_TEST_URL", "mongodb://localhost:27017")
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = SQLiteDatabase(os.path.join(directory, "benchmark.sqlite3"))
+        print(f"sqlite ({records} records)")
+        try:
+            await run(SQLiteDatabaseClient(database), records)
+        finally:
+            database.close()
+
+    motor = AsyncIOMotorClient(url, serverSelectionTimeoutMS=1000)
+    try:
+        await motor.admin.command("ping")
+    except Exception:
+        print(f"mongodb: skipped, no server at {url}")
+        motor.close()
+        return
+    print(f"mongodb ({records} records)")
+    client = MongoDBClient(motor, "benchmark_queries")
+    try:
+        await run(client, records)
+    finally:
+        await client.collection.drop()
+        motor.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+"""
+Micro-benchmark of the distance engine modes.
+
+Usage:
+    python -m benchmarks.distance_engine [pairs]
+
+Reports the cost per pair of the scalar API and of the batch API for each
+mode, and the worst relative error against geopy's geodesic.
+"""
+
+import sys
+import time
+import numpy as np
+from geopy.distance import geodesic
+from src.distance import engine
+from src.distance.engine import DistanceMode
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    pairs = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rng = np.random.default_rng(1)
+    # Short urban hops around a city center plus long-haul pairs.
+    center = np.array([40.75, -73.98])
+    urban1 = center + rng.normal(0, 0.05, (pairs // 2, 2))
+    urban2 = center + rng.normal(0, 0.05, (pairs // 2, 2))
+    long1 = np.column_stack(
+        [rng.uniform(-70, 70, pairs // 2), rng.uniform(-180, 180, pairs // 2)]
+    )
+    long2 = np.column_stack(
+        [rng.uniform(-70, 70, pairs // 2), rng.uniform(-180, 180, pairs // 2)]
+    )
+    points1 = np.vstack([urban1, long1])
+    points2 = np.vstack([urban2, long2])
+
+    # The baseline the engine replaced: two geodesic calls per pair.
+    sample = min(pairs, 2000)
+    _, double_geodesic = timed(
+        lambda: [
+            (geodesic(a, b).kilometers, geodesic(a, b).miles)
+            for a, b in zip(map(tuple, points1[:sample]), map(tuple, points2[:sample]))
+        ]
+    )
+    print(f"{'2x geodesic':>12}: scalar {double_geodesic / sample * 1e6:8.2f} us/pair")
+
+    reference = engine.pairwise(points1, points2, DistanceMode.GEOPY)
+    for mode in DistanceMode:
+        _, scalar = timed(
+            lambda: [
+                engine.distance(tuple(a), tuple(b), mode)
+                for a, b in zip(points1[:sample], points2[:sample])
+            ]
+        )
+        distances, batch = timed(engine.pairwise, points1, points2, mode)
+        error = np.max(np.abs(distances - reference) / np.maximum(reference, 1e-9))
+        print(
+            f"{mode.value:>12}: scalar {scalar / sample * 1e6:8.2f} us/pair, "
+            f"batch {batch / pairs * 1e6:8.3f} us/pair, "
+            f"max relative error {error:.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
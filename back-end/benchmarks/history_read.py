@@ -0,0 +1,95 @@
+"""
+Micro-benchmark of the history read path.
+
+Usage:
+    python -m benchmarks.history_read [page_size] [pages]
+
+Compares rows per second from BSON bytes to a JSON response body. The
+model path decodes whole documents, builds a pydantic model per row and
+validates the page again as FastAPI does for a response_model. The lean
+path decodes projected documents into tuples and renders the body in one
+json.dumps.
+"""
+
+import json
+import sys
+import time
+from datetime import datetime
+import bson
+from fastapi.encoders import jsonable_encoder
+from src.history.page import HISTORY_FIELDS, HistoryPage, HistoryRow
+from src.history.schemas import HistoryListResponse, HistoryResponse, PaginationInfo
+
+
+def document(index: int) -> dict:
+    return {
+        "_id": bson.ObjectId(),
+        "kilometers": 1234.5678 + index,
+        "miles": 767.0987 + index,
+        "address1": f"{index} Main Street, Springfield, IL 62701, United States",
+        "address2": f"{index} Broadway, New York, NY 10007, United States",
+        "coordinates": {"point1": [39.7817, -89.6501], "point2": [40.7128, -74.006]},
+        "timestamp": datetime(2024, 1, 1),
+        "ip_address": "203.0.113.7",
+    }
+
+
+def model_path(raw_page: list) -> bytes:
+    records = [bson.decode(raw) for raw in raw_page]
+    response = HistoryListResponse(
+        items=[
+            HistoryResponse(
+                query_id=str(record["_id"]),
+                kilometers=record.get("kilometers"),
+                miles=record.get("miles"),
+                address1=record["address1"],
+                address2=record["address2"],
+            )
+            for record in records
+        ],
+        pagination=PaginationInfo(
+            total=1000, page=1, page_size=len(records), total_pages=10
+        ),
+        cursor={"page_size": len(records)},
+    )
+    validated = HistoryListResponse.model_validate(response.model_dump())
+    return json.dumps(jsonable_encoder(validated)).encode()
+
+
+def lean_path(raw_page: list) -> bytes:
+    records = [bson.decode(raw) for raw in raw_page]
+    return HistoryPage(
+        [HistoryRow.from_record(record) for record in records],
+        {"next": None, "previous": None, "page_size": len(records), "total": 1000},
+        {"total": 1000, "page": 1, "page_size": len(records), "total_pages": 10},
+    ).to_json()
+
+
+def main() -> None:
+    page_size = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    pages = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    documents = [document(index) for index in range(page_size)]
+    full = [bson.encode(doc) for doc in documents]
+    projected = [
+        bson.encode({key: doc[key] for key in ["_id", *HISTORY_FIELDS]})
+        for doc in documents
+    ]
+
+    for name, path, raw_page in (
+        ("model", model_path, full),
+        ("lean", lean_path, projected),
+    ):
+        start = time.perf_counter()
+        for _ in range(pages):
+            body = path(raw_page)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:>6}: {page_size * pages / elapsed:10.0f} rows/s "
+            f"({elapsed / pages * 1e3:.3f} ms/page, {len(body)} bytes, "
+            f"{sum(map(len, raw_page))} BSON bytes)"
+        )
+
+
+if __name__ == "__main__":
+    main()
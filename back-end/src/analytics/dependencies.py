@@ -0,0 +1,32 @@
+from typing import Optional
+from src.analytics.service import AnalyticsService
+from src.config import get_settings
+from src.core.dependencies import create_database_client
+
+settings = get_settings()
+
+_analytics_service: Optional[AnalyticsService] = None
+
+
+def get_analytics_service() -> AnalyticsService:
+    """Get the history analytics rollup service."""
+    global _analytics_service
+    if _analytics_service is None:
+        _analytics_service = AnalyticsService(
+            create_database_client("rollups"),
+            flush_interval=settings.ANALYTICS_FLUSH_INTERVAL,
+        )
+    return _analytics_service
+
+
+async def startup() -> None:
+    """Start flushing rollup increments in the background."""
+    get_analytics_service().start()
+
+
+async def shutdown() -> None:
+    """Write pending rollup increments and drop the service."""
+    global _analytics_service
+    if _analytics_service is not None:
+        await _analytics_service.close()
+        _analytics_service = None
@@ -0,0 +1,69 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, status, Request
+from src.analytics.schemas import (
+    DailyCountsResponse,
+    DistanceHistogramResponse,
+    TopRoutesResponse,
+)
+from src.analytics.service import AnalyticsService
+from src.analytics.dependencies import get_analytics_service
+from src.core.security import limiter
+
+router = APIRouter(
+    prefix="/history/stats",
+    tags=["Query History"],
+    responses={
+        400: {"description": "Invalid input"},
+        500: {"description": "Internal server error"},
+    },
+)
+
+
+@router.get(
+    "/daily",
+    response_model=DailyCountsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get queries per day",
+    description="Returns per-day query counts from the daily rollups",
+)
+@limiter.limit("100/minute")
+async def get_daily_counts(
+    request: Request,
+    days: int = Query(30, ge=1, le=366, description="Number of days to include"),
+    service: AnalyticsService = Depends(get_analytics_service),
+) -> DailyCountsResponse:
+    return await service.daily_counts(days=days)
+
+
+@router.get(
+    "/routes",
+    response_model=TopRoutesResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get the most queried routes",
+    description="Returns the most queried address pairs, all time or over recent days",
+)
+@limiter.limit("100/minute")
+async def get_top_routes(
+    request: Request,
+    limit: int = Query(10, ge=1, le=100, description="Number of routes"),
+    days: Optional[int] = Query(
+        None, ge=1, le=31, description="Only count the last N days"
+    ),
+    service: AnalyticsService = Depends(get_analytics_service),
+) -> TopRoutesResponse:
+    return await service.top_routes(limit=limit, days=days)
+
+
+@router.get(
+    "/distances",
+    response_model=DistanceHistogramResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get the distance histogram",
+    description="Returns query counts per distance bucket",
+)
+@limiter.limit("100/minute")
+async def get_distance_histogram(
+    request: Request,
+    service: AnalyticsService = Depends(get_analytics_service),
+) -> DistanceHistogramResponse:
+    return await service.distance_histogram()
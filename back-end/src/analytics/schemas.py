@@ -0,0 +1,38 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class DailyCount(BaseModel):
+    day: str = Field(..., description="UTC day, as YYYY-MM-DD")
+    count: int = Field(..., description="Number of queries that day")
+
+
+class DailyCountsResponse(BaseModel):
+    days: List[DailyCount] = Field(
+        ..., description="Days with queries, oldest first"
+    )
+
+
+class RouteCount(BaseModel):
+    address1: str = Field(..., description="First address of the route")
+    address2: str = Field(..., description="Second address of the route")
+    count: int = Field(..., description="Number of queries for the route")
+    average_kilometers: Optional[float] = Field(
+        None, description="Average calculated distance, for all-time stats"
+    )
+
+
+class TopRoutesResponse(BaseModel):
+    routes: List[RouteCount] = Field(..., description="Routes, most queried first")
+
+
+class DistanceBucket(BaseModel):
+    min_km: float = Field(..., description="Inclusive lower bound in km")
+    max_km: Optional[float] = Field(
+        None, description="Exclusive upper bound in km, null for the last bucket"
+    )
+    count: int = Field(..., description="Number of queries in the bucket")
+
+
+class DistanceHistogramResponse(BaseModel):
+    buckets: List[DistanceBucket] = Field(..., description="Distance buckets")
@@ -0,0 +1,245 @@
+import asyncio
+import bisect
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from src.analytics.schemas import (
+    DailyCount,
+    DailyCountsResponse,
+    DistanceBucket,
+    DistanceHistogramResponse,
+    RouteCount,
+    TopRoutesResponse,
+)
+from src.core.clients.database.base import DatabaseClient
+from src.config import logger
+
+# Lower bounds, in km, of the distance histogram buckets.
+DISTANCE_BUCKETS = [0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 20000]
+
+
+def distance_bucket(kilometers: float) -> int:
+    """The lower bound of the histogram bucket a distance falls in."""
+    return DISTANCE_BUCKETS[bisect.bisect_right(DISTANCE_BUCKETS, kilometers) - 1]
+
+
+class AnalyticsService:
+    """
+    Keeps pre-aggregated rollups of the query history.
+
+    Every persisted query adds to a per-day count, an all-time and a per-day
+    hit count for its address pair, and a distance histogram bucket. Stats are
+    read from those rollup documents only, so their cost depends on the number
+    of buckets asked for rather than on the size of the history.
+
+    Increments are summed in memory and written with one bulk upsert every
+    ``flush_interval`` seconds; reads flush first.
+
+    Top routes over recent days are ranked from the ``route_candidates``
+    busiest pairs of each day, so a read is bounded by the window rather than
+    by the number of distinct pairs. A pair is only counted on the days it
+    is among those candidates, which can understate rarely requested pairs
+    on busy days.
+    """
+
+    def __init__(
+        self,
+        database_client: DatabaseClient,
+        flush_interval: float = 5.0,
+        route_candidates: int = 100,
+    ):
+        self.database_client = database_client
+        self.flush_interval = flush_interval
+        self.route_candidates = route_candidates
+        self._counters: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        self._fields: Dict[str, Dict[str, Any]] = {}
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background flush task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                # Already logged and kept; retry on the next cycle.
+                pass
+
+    async def close(self) -> None:
+        """Stop the flush task and write the pending increments."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    def _add(self, rollup_id: str, fields: Dict[str, Any], **counters: float) -> None:
+        self._fields.setdefault(rollup_id, fields)
+        for name, value in counters.items():
+            self._counters[rollup_id][name] += value
+
+    async def record(self, queries: List[Dict[str, Any]]) -> None:
+        """Add persisted query records to the rollups."""
+        for query in queries:
+            day = query["timestamp"].date().isoformat()
+            kilometers = query["kilometers"]
+            self._add(f"day:{day}", {"kind": "day", "day": day}, count=1)
+
+            key1, key2 = sorted([query["address1_key"], query["address2_key"]])
+            pair = {"address1": query["address1"], "address2": query["address2"]}
+            self._add(
+                f"pair:{key1}|{key2}",
+                {"kind": "pair", **pair},
+                count=1,
+                kilometers=kilometers,
+            )
+            self._add(
+                f"pair_day:{day}:{key1}|{key2}",
+                {"kind": "pair_day", "day": day, "pair": f"{key1}|{key2}", **pair},
+                count=1,
+            )
+
+            bucket = distance_bucket(kilometers)
+            self._add(
+                f"distance:{bucket}", {"kind": "distance", "bucket": bucket}, count=1
+            )
+
+        if self._task is None:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write the pending increments with one bulk upsert."""
+        async with self._lock:
+            if not self._counters:
+                return
+            counters, fields = self._counters, self._fields
+            self._counters = defaultdict(lambda: defaultdict(float))
+            self._fields = {}
+            try:
+                await self.database_client.increment_many(
+                    [
+                        (rollup_id, dict(values), fields[rollup_id])
+                        for rollup_id, values in counters.items()
+                    ]
+                )
+            except Exception as e:
+                # Merge back so no increment is lost.
+                for rollup_id, values in counters.items():
+                    self._fields.setdefault(rollup_id, fields[rollup_id])
+                    for name, value in values.items():
+                        self._counters[rollup_id][name] += value
+                logger.error(f"Failed to flush analytics rollups: {str(e)}")
+                raise
+
+    async def daily_counts(self, days: int = 30) -> DailyCountsResponse:
+        """Queries per day for the last ``days`` days, oldest first."""
+        await self.flush()
+        since = datetime.utcnow().date() - timedelta(days=days - 1)
+        rollups = await self.database_client.find_many(
+            limit=0,
+            sort_by="day",
+            sort_order="asc",
+            filters={"kind": "day", "day": {"$gte": since.isoformat()}},
+        )
+        return DailyCountsResponse(
+            days=[
+                DailyCount(day=rollup["day"], count=int(rollup["count"]))
+                for rollup in rollups
+            ]
+        )
+
+    async def top_routes(
+        self, limit: int = 10, days: Optional[int] = None
+    ) -> TopRoutesResponse:
+        """
+        The most requested address pairs, all time or over the last ``days``
+        days. Pairs are counted regardless of direction.
+        """
+        await self.flush()
+        if days is None:
+            rollups = await self.database_client.find_many(
+                limit=limit,
+                sort_by="count",
+                sort_order="desc",
+                filters={"kind": "pair"},
+            )
+            routes = [
+                RouteCount(
+                    address1=rollup["address1"],
+                    address2=rollup["address2"],
+                    count=int(rollup["count"]),
+                    average_kilometers=round(
+                        rollup["kilometers"] / rollup["count"], 2
+                    ),
+                )
+                for rollup in rollups
+            ]
+            return TopRoutesResponse(routes=routes)
+
+        since = datetime.utcnow().date() - timedelta(days=days - 1)
+        candidates = max(limit, self.route_candidates)
+        per_day = await asyncio.gather(
+            *(
+                self.database_client.find_many(
+                    limit=candidates,
+                    sort_by="count",
+                    sort_order="desc",
+                    filters={
+                        "kind": "pair_day",
+                        "day": (since + timedelta(days=offset)).isoformat(),
+                    },
+                )
+                for offset in range(days)
+            )
+        )
+        totals: Dict[str, Tuple[Dict[str, Any], int]] = {}
+        for rollups in per_day:
+            for rollup in rollups:
+                first, count = totals.get(rollup["pair"], (rollup, 0))
+                totals[rollup["pair"]] = (first, count + int(rollup["count"]))
+        ranked = sorted(totals.values(), key=lambda item: item[1], reverse=True)
+        return TopRoutesResponse(
+            routes=[
+                RouteCount(
+                    address1=rollup["address1"],
+                    address2=rollup["address2"],
+                    count=count,
+                )
+                for rollup, count in ranked[:limit]
+            ]
+        )
+
+    async def expire(self, before: datetime) -> int:
+        """
+        Delete the per-day rollups of days before ``before``; returns the
+        number deleted. All-time rollups are kept.
+        """
+        await self.flush()
+        return await self.database_client.delete_many(
+            {
+                "kind": {"$in": ["day", "pair_day"]},
+                "day": {"$lt": before.date().isoformat()},
+            }
+        )
+
+    async def distance_histogram(self) -> DistanceHistogramResponse:
+        """Query counts per distance bucket."""
+        await self.flush()
+        rollups = await self.database_client.find_many(
+            limit=0, sort_by="bucket", sort_order="asc", filters={"kind": "distance"}
+        )
+        counts = {rollup["bucket"]: int(rollup["count"]) for rollup in rollups}
+        upper_bounds = DISTANCE_BUCKETS[1:] + [None]
+        return DistanceHistogramResponse(
+            buckets=[
+                DistanceBucket(min_km=lower, max_km=upper, count=counts.get(lower, 0))
+                for lower, upper in zip(DISTANCE_BUCKETS, upper_bounds)
+            ]
+        )
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Dict, List
 import logging
 import sys
 
@@ -8,13 +9,80 @@ class Settings(BaseSettings):
     APP_NAME: str = "Address Distance API"
     VERSION: str = "1.0.0"
     API_PREFIX: str = "/api/v1"
+    DATABASE_BACKEND: str = "mongodb"  # mongodb or sqlite
+    SQLITE_DATABASE_PATH: str = "address_mapping.sqlite3"
     MONGODB_URL: str
     MONGODB_PASSWORD: str
     MONGODB_USERNAME: str
+    MONGODB_MAX_POOL_SIZE: int = 100
+    MONGODB_MIN_POOL_SIZE: int = 0
+    MONGODB_MAX_IDLE_TIME: float = 300.0
+    MONGODB_CONNECT_TIMEOUT: float = 5.0
+    MONGODB_SERVER_SELECTION_TIMEOUT: float = 5.0
+    MONGODB_WAIT_QUEUE_TIMEOUT: float = 5.0
+    MONGODB_ENSURE_INDEXES: bool = True
+    HISTORY_STORAGE: str = "queries"  # queries or pairs
+    HISTORY_RECENT_LIMIT: int = 20
+    HISTORY_WRITE_BEHIND: bool = True
+    HISTORY_FLUSH_SIZE: int = 500
+    HISTORY_FLUSH_INTERVAL: float = 1.0
+    HISTORY_MAX_PENDING: int = 10000
+    RETENTION_DAYS: int = 0  # 0 keeps the history forever
+    RETENTION_TTL_INDEX: bool = False
+    RETENTION_ARCHIVE_PATH: str = ""  # empty deletes without archiving
+    RETENTION_SEGMENT_RECORDS: int = 100000
+    RETENTION_INTERVAL: float = 3600.0
+    RETENTION_BATCH_SIZE: int = 500
+    RETENTION_DUTY_CYCLE: float = 0.1
+    RETENTION_LEASE_SECONDS: float = 300.0
+    ANALYTICS_ENABLED: bool = True
+    ANALYTICS_FLUSH_INTERVAL: float = 5.0
     NOMINATIM_BASE_URL: str = "https://nominatim.openstreetmap.org"
     NOMINATIM_USER_AGENT: str = "AddressDistanceAPI/1.0"
+    NOMINATIM_MIRROR_URLS: List[str] = []
     NOMINATIM_TIMEOUT: int = 10
+    NOMINATIM_CONNECT_TIMEOUT: float = 3.0
+    NOMINATIM_POOL_TIMEOUT: float = 5.0
+    NOMINATIM_MAX_CONNECTIONS: int = 20
+    NOMINATIM_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    NOMINATIM_KEEPALIVE_EXPIRY: float = 30.0
+    NOMINATIM_HTTP2: bool = False
+    NOMINATIM_RATE_LIMIT: float = 1.0
+    NOMINATIM_RATE_BURST: int = 1
+    GEOCODE_HEDGE_PERCENTILE: float = 0.95
+    GEOCODE_HEDGE_INITIAL_DELAY: float = 1.0
+    GEOCODE_HEDGE_MIN_DELAY: float = 0.05
+    GEOCODE_FUZZY_ENABLED: bool = True
+    GEOCODE_FUZZY_THRESHOLD: float = 0.9
+    GEOCODE_FUZZY_MAX_ENTRIES: int = 50000
+    GEOCODE_NEGATIVE_CACHE_TTL: int = 300
+    GEOCODE_RETRIES: int = 2
+    GEOCODE_RETRY_BASE_DELAY: float = 0.5
+    GEOCODE_RETRY_MAX_DELAY: float = 10.0
+    GEOCODE_BREAKER_WINDOW: int = 20
+    GEOCODE_BREAKER_MIN_CALLS: int = 5
+    GEOCODE_BREAKER_ERROR_RATE: float = 0.5
+    GEOCODE_BREAKER_RESET_TIMEOUT: float = 30.0
+    GEOCODE_QUEUE_SIZE: int = 100
+    GEOCODE_INTERACTIVE_MAX_WAIT: float = 5.0
+    GEOCODE_BATCH_MAX_WAIT: float = 300.0
+    GEOCODER_BACKEND: str = "nominatim"  # nominatim, gazetteer or tiered
+    GAZETTEER_PATH: str = "gazetteer.csv"
+    GEOCODE_CACHE_PATH: str = "geocode_cache.sqlite3"
+    GEOCODE_CACHE_TTL: int = 2592000
+    GEOCODE_CACHE_MAXSIZE: int = 100000
     HISTORY_LIMIT: int = 100
+    BATCH_GEOCODE_CONCURRENCY: int = 8
+    STREAM_CHUNK_SIZE: int = 100
+    JOB_WORKERS: int = 2
+    JOB_CHUNK_SIZE: int = 100
+    JOB_CONCURRENCY: int = 4
+    JOB_MAX_PAIRS: int = 10000
+    JOB_LEASE_SECONDS: float = 60.0
+    DISTANCE_MODE: str = "geopy"  # haversine, vincenty or geopy
+    DISTANCE_POOL_WORKERS: int = 2
+    DISTANCE_OFFLOAD_THRESHOLD: int = 50000
+    ADDRESS_SYNONYMS: Dict[str, str] = {}
     PUBLIC_API_URL: str
 
     class Config:
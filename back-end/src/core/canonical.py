@@ -0,0 +1,270 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Optional
+
+TOKEN_PATTERN = re.compile(r"\w+")
+INITIALISM_PATTERN = re.compile(r"\b(?:\w\.){2,}")
+
+# Street-level abbreviations are expanded wherever they appear.
+STREET_ABBREVIATIONS: Dict[str, str] = {
+    "st": "street",
+    "ave": "avenue",
+    "av": "avenue",
+    "rd": "road",
+    "blvd": "boulevard",
+    "dr": "drive",
+    "ln": "lane",
+    "ct": "court",
+    "pl": "place",
+    "sq": "square",
+    "hwy": "highway",
+    "pkwy": "parkway",
+    "ter": "terrace",
+    "cir": "circle",
+    "apt": "apartment",
+    "ste": "suite",
+    "fl": "floor",
+    "mt": "mount",
+    "ft": "fort",
+    "n": "north",
+    "s": "south",
+    "e": "east",
+    "w": "west",
+    "ne": "northeast",
+    "nw": "northwest",
+    "se": "southeast",
+    "sw": "southwest",
+    "usa": "united states",
+    "us": "united states",
+    "uk": "united kingdom",
+}
+
+# Street types, after which a token is a suffix such as a directional rather
+# than a region code: "Main St NE" is northeast, not Nebraska.
+STREET_TYPES = {
+    "st",
+    "street",
+    "ave",
+    "av",
+    "avenue",
+    "rd",
+    "road",
+    "blvd",
+    "boulevard",
+    "dr",
+    "drive",
+    "ln",
+    "lane",
+    "ct",
+    "court",
+    "pl",
+    "place",
+    "sq",
+    "square",
+    "hwy",
+    "highway",
+    "pkwy",
+    "parkway",
+    "ter",
+    "terrace",
+    "cir",
+    "circle",
+}
+
+# Region codes are only expanded in the region slot: the last token that is
+# not a postcode or country, and never the first token. This keeps words such
+# as "in", "me" or "ct" (court) intact elsewhere in the address. A code that
+# is also a street abbreviation must follow a comma to count as a region, and
+# no code directly after a street type does.
+COUNTRY_TOKENS = {"usa", "us"}
+
+REGION_ABBREVIATIONS: Dict[str, str] = {
+    "al": "alabama",
+    "ak": "alaska",
+    "az": "arizona",
+    "ar": "arkansas",
+    "ca": "california",
+    "co": "colorado",
+    "ct": "connecticut",
+    "de": "delaware",
+    "dc": "district of columbia",
+    "fl": "florida",
+    "ga": "georgia",
+    "hi": "hawaii",
+    "id": "idaho",
+    "il": "illinois",
+    "in": "indiana",
+    "ia": "iowa",
+    "ks": "kansas",
+    "ky": "kentucky",
+    "la": "louisiana",
+    "me": "maine",
+    "md": "maryland",
+    "ma": "massachusetts",
+    "mi": "michigan",
+    "mn": "minnesota",
+    "ms": "mississippi",
+    "mo": "missouri",
+    "mt": "montana",
+    "ne": "nebraska",
+    "nv": "nevada",
+    "nh": "new hampshire",
+    "nj": "new jersey",
+    "nm": "new mexico",
+    "ny": "new york",
+    "nc": "north carolina",
+    "nd": "north dakota",
+    "oh": "ohio",
+    "ok": "oklahoma",
+    "or": "oregon",
+    "pa": "pennsylvania",
+    "ri": "rhode island",
+    "sc": "south carolina",
+    "sd": "south dakota",
+    "tn": "tennessee",
+    "tx": "texas",
+    "ut": "utah",
+    "vt": "vermont",
+    "va": "virginia",
+    "wa": "washington",
+    "wv": "west virginia",
+    "wi": "wisconsin",
+    "wy": "wyoming",
+}
+
+
+class AddressCanonicalizer:
+    """
+    Reduce an address to a canonical form used for cache keys and lookups.
+
+    The pipeline applies Unicode compatibility normalization with accents
+    stripped, case folding, joining of dotted initialisms (N.Y.), punctuation
+    and whitespace collapsing, abbreviation expansion and finally the synonym
+    table, whose entries may span several words.
+    """
+
+    def __init__(
+        self,
+        synonyms: Optional[Dict[str, str]] = None,
+        street_abbreviations: Dict[str, str] = STREET_ABBREVIATIONS,
+        region_abbreviations: Dict[str, str] = REGION_ABBREVIATIONS,
+    ):
+        self.street_abbreviations = street_abbreviations
+        self.region_abbreviations = region_abbreviations
+        self.synonyms = {
+            " ".join(self._tokens(phrase)): " ".join(self._tokens(replacement))
+            for phrase, replacement in (synonyms or {}).items()
+        }
+        self._synonym_pattern = None
+        if self.synonyms:
+            phrases = sorted(self.synonyms, key=len, reverse=True)
+            self._synonym_pattern = re.compile(
+                r"\b(" + "|".join(re.escape(phrase) for phrase in phrases) + r")\b"
+            )
+        self.canonicalize = lru_cache(maxsize=10000)(self._canonicalize)
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(char for char in text if not unicodedata.combining(char))
+        text = INITIALISM_PATTERN.sub(lambda match: match.group(0).replace(".", ""), text)
+        return text.casefold()
+
+    @classmethod
+    def _tokens(cls, text: str):
+        return TOKEN_PATTERN.findall(cls._normalize(text))
+
+    @classmethod
+    def _tokens_with_commas(cls, text: str):
+        """The tokens, each with whether a comma separates it from the last."""
+        text = cls._normalize(text)
+        tokens, commas, end = [], [], 0
+        for match in TOKEN_PATTERN.finditer(text):
+            tokens.append(match.group(0))
+            commas.append("," in text[end : match.start()])
+            end = match.end()
+        return tokens, commas
+
+    @staticmethod
+    def _region_slot(tokens) -> int:
+        for position in range(len(tokens) - 1, 0, -1):
+            token = tokens[position]
+            if not token.isdigit() and token not in COUNTRY_TOKENS:
+                return position
+        return -1
+
+    def _is_region(self, tokens, commas, position: int) -> bool:
+        token = tokens[position]
+        if token not in self.region_abbreviations or tokens[position - 1] in STREET_TYPES:
+            return False
+        return commas[position] or token not in self.street_abbreviations
+
+    @staticmethod
+    def _is_saint(tokens, commas, position: int) -> bool:
+        """Whether "st" starts a name, as in "St Louis" or "12 St Marks Pl"."""
+        if position + 1 >= len(tokens) or tokens[position + 1].isdigit():
+            return False
+        return (
+            position == 0
+            or commas[position]
+            or any(char.isdigit() for char in tokens[position - 1])
+        )
+
+    def _canonicalize(self, address: str, partial: bool = False) -> str:
+        tokens, commas = self._tokens_with_commas(address)
+        region_slot = self._region_slot(tokens)
+        last = tokens[-1] if partial and tokens else None
+        expanded = []
+        for position, token in enumerate(tokens[:-1] if last else tokens):
+            if position == region_slot and self._is_region(tokens, commas, position):
+                expanded.append(self.region_abbreviations[token])
+            elif token == "st" and self._is_saint(tokens, commas, position):
+                expanded.append("saint")
+            else:
+                expanded.append(self.street_abbreviations.get(token, token))
+        canonical = " ".join(expanded)
+
+        if self._synonym_pattern is not None:
+            canonical = self._synonym_pattern.sub(
+                lambda match: self.synonyms[match.group(0)], canonical
+            )
+        if last is not None:
+            canonical = f"{canonical} {last}" if canonical else last
+        return canonical
+
+    def prefix(self, address: str) -> str:
+        """
+        Canonicalize the start of an address, such as a search prefix.
+
+        A last word the text ends in may be incomplete ("Main S"), so it is
+        only normalized, never expanded; a trailing space or punctuation
+        marks it as complete.
+        """
+        partial = bool(TOKEN_PATTERN.search(address[-1:])) if address else False
+        return self._canonicalize(address, partial=partial)
+
+    def __call__(self, address: str) -> str:
+        return self.canonicalize(address)
+
+
+_canonicalizer: Optional[AddressCanonicalizer] = None
+
+
+def _get_canonicalizer() -> AddressCanonicalizer:
+    global _canonicalizer
+    if _canonicalizer is None:
+        from src.config import get_settings
+
+        _canonicalizer = AddressCanonicalizer(get_settings().ADDRESS_SYNONYMS)
+    return _canonicalizer
+
+
+def canonicalize_address(address: str) -> str:
+    """Canonicalize an address with the synonym table from the settings."""
+    return _get_canonicalizer()(address)
+
+
+def canonicalize_prefix(address: str) -> str:
+    """Canonicalize an address prefix, leaving a last partial word as typed."""
+    return _get_canonicalizer().prefix(address)
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+from .base import BaseCacheClient
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteCacheClient(BaseCacheClient):
+    """
+    SQLite implementation of the cache client.
+
+    The cache lives in a single file, so every worker process pointing at the
+    same path shares entries and they survive restarts. Values must be JSON
+    serializable.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        maxsize: int = 100000,
+        ttl: int = 3600,
+        evict_interval: int = 100,
+    ):
+        """
+        Initialize the cache client.
+
+        Args:
+            path: Path of the SQLite database file
+            maxsize: Maximum number of items per namespace
+            ttl: Default time-to-live in seconds
+            evict_interval: Number of writes between size-bound evictions
+        """
+        self._path = path
+        self._maxsize = maxsize
+        self._default_ttl = ttl
+        self._evict_interval = evict_interval
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        self._setup()
+
+    def _setup(self) -> None:
+        """Create the cache table and enable WAL for concurrent workers."""
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_expiry "
+                "ON cache (namespace, expires_at)"
+            )
+            self._conn.commit()
+
+    def _get(self, key: str, namespace: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+        if row is None or row[1] <= time.time():
+            return None
+        return json.loads(row[0])
+
+    def _set(self, key: str, value: Any, namespace: str, ttl: int) -> None:
+        payload = json.dumps(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (namespace, key, payload, time.time() + ttl),
+            )
+            self._writes += 1
+            if self._writes % self._evict_interval == 0:
+                self._evict(namespace)
+            self._conn.commit()
+
+    def _evict(self, namespace: str) -> None:
+        """Drop expired entries, then the ones closest to expiry above maxsize."""
+        self._conn.execute(
+            "DELETE FROM cache WHERE namespace = ? AND expires_at <= ?",
+            (namespace, time.time()),
+        )
+        self._conn.execute(
+            """
+            DELETE FROM cache WHERE namespace = ? AND key IN (
+                SELECT key FROM cache WHERE namespace = ?
+                ORDER BY expires_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (namespace, namespace, self._maxsize),
+        )
+
+    def _execute(self, sql: str, params: tuple = ()) -> None:
+        with self._lock:
+            self._conn.execute(sql, params)
+            self._conn.commit()
+
+    async def get(self, key: str, namespace: str) -> Optional[Any]:
+        """Get a value from cache."""
+        try:
+            return await asyncio.to_thread(self._get, key, namespace)
+        except Exception as e:
+            logger.error(f"Error getting from cache: {str(e)}")
+            return None
+
+    async def set(
+        self, key: str, value: Any, namespace: str, ttl: Optional[int] = None
+    ) -> None:
+        """Set a value in cache with optional TTL."""
+        try:
+            await asyncio.to_thread(
+                self._set, key, value, namespace, ttl or self._default_ttl
+            )
+        except Exception as e:
+            logger.error(f"Error setting cache: {str(e)}")
+
+    async def delete(self, key: str, namespace: str) -> None:
+        """Delete a specific key from cache."""
+        try:
+            await asyncio.to_thread(
+                self._execute,
+                "DELETE FROM cache WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            )
+        except Exception as e:
+            logger.error(f"Error deleting from cache: {str(e)}")
+
+    async def clear_namespace(self, namespace: str) -> None:
+        """Clear all keys in a namespace."""
+        try:
+            await asyncio.to_thread(
+                self._execute, "DELETE FROM cache WHERE namespace = ?", (namespace,)
+            )
+        except Exception as e:
+            logger.error(f"Error clearing namespace: {str(e)}")
+
+    async def clear_all(self) -> None:
+        """Clear all cache entries."""
+        try:
+            await asyncio.to_thread(self._execute, "DELETE FROM cache")
+        except Exception as e:
+            logger.error(f"Error clearing all cache: {str(e)}")
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,5 +1,30 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
+from src.core.clients.database.indexes import IndexSpec
+
+
+@dataclass
+class Upsert:
+    """
+    An atomic update of one record that creates the record when it is missing.
+
+    Each field maps to the MongoDB update operator of the same name; ``push``
+    appends to arrays and keeps only their last ``push_limit`` elements, or
+    all of them when it is 0. The upsert is skipped when the record exists
+    and matches the ``unless`` filters, which makes it safe to retry when
+    they recognize an update already applied.
+    """
+
+    record_id: str
+    increment: Dict[str, float] = field(default_factory=dict)
+    set: Dict[str, Any] = field(default_factory=dict)
+    set_on_insert: Dict[str, Any] = field(default_factory=dict)
+    minimum: Dict[str, Any] = field(default_factory=dict)
+    maximum: Dict[str, Any] = field(default_factory=dict)
+    push: Dict[str, List[Any]] = field(default_factory=dict)
+    push_limit: int = 0
+    unless: Dict[str, Any] = field(default_factory=dict)
 
 
 class DatabaseClient(ABC):
@@ -18,30 +43,99 @@ class DatabaseClient(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_many(self, data: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create several records in one bulk write.
+
+        Args:
+            data: List of dictionaries containing the record data
+
+        Returns:
+            List[str]: IDs of the created records, in input order
+        """
+        pass
+
     @abstractmethod
     async def find_many(
         self,
         skip: int = 0,
         limit: int = 10,
-        sort_by: str = "created_at",
+        sort_by: str = "_id",
         sort_order: str = "desc",
         filters: Optional[Dict[str, Any]] = None,
+        projection: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Find multiple records with pagination and sorting.
 
         Args:
             skip: Number of records to skip
-            limit: Maximum number of records to return
+            limit: Maximum number of records to return, 0 for no limit
             sort_by: Field to sort by
             sort_order: Sort order ('asc' or 'desc')
             filters: Optional filters to apply
+            projection: Fields to return besides the ID; all fields if None
 
         Returns:
             List of records
         """
         pass
 
+    @abstractmethod
+    async def find_by_id(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a single record by its ID.
+
+        Args:
+            record_id: ID of the record
+
+        Returns:
+            The record, or None if it does not exist
+        """
+        pass
+
+    @abstractmethod
+    async def update(self, record_id: str, data: Dict[str, Any]) -> None:
+        """
+        Set fields on an existing record.
+
+        Args:
+            record_id: ID of the record
+            data: Dictionary of fields to set
+        """
+        pass
+
+    @abstractmethod
+    async def update_if(
+        self, record_id: str, filters: Dict[str, Any], data: Dict[str, Any]
+    ) -> bool:
+        """
+        Set fields on a record only if it matches the filters, atomically.
+
+        Args:
+            record_id: ID of the record
+            filters: Conditions the record must match
+            data: Dictionary of fields to set
+
+        Returns:
+            Whether the record matched and was updated
+        """
+        pass
+
+    @abstractmethod
+    async def delete_many(self, filters: Dict[str, Any]) -> int:
+        """
+        Delete every record matching the filters.
+
+        Args:
+            filters: Filters selecting the records to delete
+
+        Returns:
+            Number of deleted records
+        """
+        pass
+
     @abstractmethod
     async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """
@@ -55,6 +149,65 @@ class DatabaseClient(ABC):
         """
         pass
 
+    @abstractmethod
+    async def increment_many(
+        self, updates: List[Tuple[str, Dict[str, float], Dict[str, Any]]]
+    ) -> None:
+        """
+        Add to counters on records, creating the records that do not exist.
+
+        Args:
+            updates: (record ID, counter increments, fields set only when the
+                record is created) for each record
+        """
+        pass
+
+    @abstractmethod
+    async def upsert_many(self, updates: List[Upsert]) -> None:
+        """
+        Apply several upserts, each atomically on its own record.
+
+        Args:
+            updates: The upserts to apply, at most one per record
+        """
+        pass
+
+    async def estimated_count(self) -> int:
+        """
+        Estimate the total number of records cheaply, e.g. from collection
+        metadata. Defaults to an exact count.
+        """
+        return await self.count()
+
+    async def ensure_indexes(self, indexes: List[IndexSpec]) -> None:
+        """
+        Create the given indexes if they do not exist. Databases without
+        secondary indexes may ignore this.
+        """
+        pass
+
+    async def drop_indexes(self, names: List[str]) -> None:
+        """
+        Drop the named indexes that exist. Databases without secondary
+        indexes may ignore this.
+        """
+        pass
+
+    async def explain(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "_id",
+        sort_order: str = "desc",
+        limit: int = 10,
+    ) -> Dict[str, Any]:
+        """
+        Describe how the database would run a find_many query.
+
+        Returns:
+            The database's query plan; empty if it cannot explain queries
+        """
+        return {}
+
     @abstractmethod
     async def close(self) -> None:
         """Close the database connection."""
@@ -0,0 +1,210 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from bson import ObjectId
+from src.core.clients.database.base import DatabaseClient, Upsert
+from src.core.clients.database.indexes import IndexSpec
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedDatabaseClient(DatabaseClient):
+    """
+    Write-behind database client.
+
+    ``create`` and ``create_many`` assign client-generated ObjectIds, queue the
+    records and return immediately. A background task writes the queue to the
+    wrapped client with ``create_many`` once ``flush_size`` records are
+    pending or ``flush_interval`` seconds have passed. Reads and other writes
+    flush first, so the process always sees its own records.
+
+    A failed flush is retried on the next cycle with the same records and
+    IDs, so the wrapped client's ``create_many`` must be idempotent for them:
+    the MongoDB and SQLite clients ignore records whose ID is already stored,
+    and PairDatabaseClient skips pairs that already recorded the queries.
+    Once ``max_pending`` records are queued, writers wait for the next flush.
+    """
+
+    def __init__(
+        self,
+        client: DatabaseClient,
+        flush_size: int = 500,
+        flush_interval: float = 1.0,
+        max_pending: int = 10000,
+    ):
+        self.client = client
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: List[Dict[str, Any]] = []
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._flushes = 0
+        self._flushed = 0
+        self._failures = 0
+        self._last_flush_size = 0
+        self._last_flush_latency = 0.0
+        self._max_flush_latency = 0.0
+        self._total_flush_latency = 0.0
+
+    def start(self) -> None:
+        """Start the background flush task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                # Already logged and requeued; retry on the next cycle.
+                pass
+
+    async def flush(self) -> None:
+        """Write every pending record to the wrapped client."""
+        async with self._lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, []
+            started = time.perf_counter()
+            try:
+                await self.client.create_many(batch)
+            except Exception as e:
+                self._failures += 1
+                self._pending = batch + self._pending
+                logger.error(f"Failed to flush {len(batch)} records: {str(e)}")
+                raise
+            latency = time.perf_counter() - started
+            self._flushes += 1
+            self._flushed += len(batch)
+            self._last_flush_size = len(batch)
+            self._last_flush_latency = latency
+            self._max_flush_latency = max(self._max_flush_latency, latency)
+            self._total_flush_latency += latency
+
+    async def _enqueue(self, records: List[Dict[str, Any]]) -> List[str]:
+        ids = []
+        for record in records:
+            record.setdefault("_id", ObjectId())
+            ids.append(str(record["_id"]))
+
+        if self._task is None:
+            await self.client.create_many(records)
+            return ids
+
+        while len(self._pending) >= self.max_pending:
+            await self.flush()
+        self._pending.extend(records)
+        if len(self._pending) >= self.flush_size:
+            self._wakeup.set()
+        return ids
+
+    async def create(self, data: Dict[str, Any]) -> str:
+        """Queue a record; returns its ID before it is written."""
+        return (await self._enqueue([data]))[0]
+
+    async def create_many(self, data: List[Dict[str, Any]]) -> List[str]:
+        """Queue several records; returns their IDs before they are written."""
+        return await self._enqueue(data)
+
+    async def find_many(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        sort_by: str = "_id",
+        sort_order: str = "desc",
+        filters: Optional[Dict[str, Any]] = None,
+        projection: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        await self.flush()
+        return await self.client.find_many(
+            skip=skip,
+            limit=limit,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            filters=filters,
+            projection=projection,
+        )
+
+    async def find_by_id(self, record_id: str) -> Optional[Dict[str, Any]]:
+        await self.flush()
+        return await self.client.find_by_id(record_id)
+
+    async def update(self, record_id: str, data: Dict[str, Any]) -> None:
+        await self.flush()
+        await self.client.update(record_id, data)
+
+    async def update_if(
+        self, record_id: str, filters: Dict[str, Any], data: Dict[str, Any]
+    ) -> bool:
+        await self.flush()
+        return await self.client.update_if(record_id, filters, data)
+
+    async def delete_many(self, filters: Dict[str, Any]) -> int:
+        await self.flush()
+        return await self.client.delete_many(filters)
+
+    async def increment_many(
+        self, updates: List[Tuple[str, Dict[str, float], Dict[str, Any]]]
+    ) -> None:
+        await self.flush()
+        await self.client.increment_many(updates)
+
+    async def upsert_many(self, updates: List[Upsert]) -> None:
+        await self.flush()
+        await self.client.upsert_many(updates)
+
+    async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        await self.flush()
+        return await self.client.count(filters)
+
+    async def estimated_count(self) -> int:
+        return await self.client.estimated_count() + len(self._pending)
+
+    async def ensure_indexes(self, indexes: List[IndexSpec]) -> None:
+        await self.client.ensure_indexes(indexes)
+
+    async def drop_indexes(self, names: List[str]) -> None:
+        await self.client.drop_indexes(names)
+
+    async def explain(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "_id",
+        sort_order: str = "desc",
+        limit: int = 10,
+    ) -> Dict[str, Any]:
+        return await self.client.explain(filters, sort_by, sort_order, limit)
+
+    async def close(self) -> None:
+        """Stop the flush task and write everything still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        try:
+            await self.flush()
+        finally:
+            await self.client.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "flushes": self._flushes,
+            "flushed_records": self._flushed,
+            "failed_flushes": self._failures,
+            "last_flush_size": self._last_flush_size,
+            "last_flush_latency": round(self._last_flush_latency, 4),
+            "max_flush_latency": round(self._max_flush_latency, 4),
+            "mean_flush_latency": round(
+                self._total_flush_latency / self._flushes if self._flushes else 0.0,
+                4,
+            ),
+        }
@@ -0,0 +1,74 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple, Union
+
+ASCENDING = 1
+DESCENDING = -1
+TEXT = "text"
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """A named index: ordered (field, direction or type) keys plus driver options."""
+
+    name: str
+    keys: List[Tuple[str, Union[int, str]]]
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+# Indexes ensured at startup, by collection. History is read newest first by
+# _id, alone or narrowed by the history filters. Equality filters get compound
+# indexes ending in _id, which serve the filter and the sort together; range,
+# prefix and text filters get an index on their field, and their matches are
+# sorted after the index scan.
+INDEXES: Dict[str, List[IndexSpec]] = {
+    "queries": [
+        IndexSpec("timestamp_desc", [("timestamp", DESCENDING)]),
+        IndexSpec(
+            "address1_key_id", [("address1_key", ASCENDING), ("_id", DESCENDING)]
+        ),
+        IndexSpec(
+            "address2_key_id", [("address2_key", ASCENDING), ("_id", DESCENDING)]
+        ),
+        IndexSpec("address_text", [("address1", TEXT), ("address2", TEXT)]),
+        IndexSpec("ip_address_id", [("ip_address", ASCENDING), ("_id", DESCENDING)]),
+        IndexSpec("kilometers", [("kilometers", ASCENDING)]),
+    ],
+    # One record per address pair; history is read newest first by the ID of
+    # each pair's latest query.
+    "query_pairs": [
+        IndexSpec("last_query_id_desc", [("last_query_id", DESCENDING)]),
+        IndexSpec(
+            "address1_key_last_query_id",
+            [("address1_key", ASCENDING), ("last_query_id", DESCENDING)],
+        ),
+        IndexSpec(
+            "address2_key_last_query_id",
+            [("address2_key", ASCENDING), ("last_query_id", DESCENDING)],
+        ),
+        IndexSpec("address_text", [("address1", TEXT), ("address2", TEXT)]),
+        IndexSpec(
+            "recent_ip_address_last_query_id",
+            [("recent.ip_address", ASCENDING), ("last_query_id", DESCENDING)],
+        ),
+        IndexSpec("kilometers", [("kilometers", ASCENDING)]),
+        IndexSpec("last_seen_desc", [("last_seen", DESCENDING)]),
+    ],
+    "rollups": [
+        IndexSpec("kind_day", [("kind", ASCENDING), ("day", ASCENDING)]),
+        IndexSpec(
+            "kind_day_count",
+            [("kind", ASCENDING), ("day", ASCENDING), ("count", DESCENDING)],
+        ),
+        IndexSpec("kind_count", [("kind", ASCENDING), ("count", DESCENDING)]),
+    ],
+    "jobs": [
+        IndexSpec("status_id", [("status", ASCENDING), ("_id", ASCENDING)]),
+    ],
+    "job_results": [
+        IndexSpec(
+            "job_id_index",
+            [("job_id", ASCENDING), ("index", ASCENDING)],
+            {"unique": True},
+        ),
+    ],
+}
@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+from src.core.clients.database.base import DatabaseClient
+
+EPOCH = datetime(1970, 1, 1)
+
+
+class Lease:
+    """
+    A named, expiring lock held in a database collection.
+
+    ``acquire`` takes the lease when it is free or expired, or renews it when
+    this process already holds it, with one conditional update, so at most
+    one process holds it at a time. A holder that stops renewing loses the
+    lease once ``seconds`` have passed.
+    """
+
+    def __init__(self, client: DatabaseClient, name: str, seconds: float = 300.0):
+        self.client = client
+        self.name = name
+        self.seconds = seconds
+        self.owner = uuid4().hex
+
+    async def acquire(self) -> bool:
+        """Take or renew the lease; returns whether this process holds it."""
+        if await self._take():
+            return True
+        # The lease record may not exist yet. Whichever process creates it
+        # first wins; the others' inserts are ignored as duplicates.
+        await self.client.create_many(
+            [{"_id": self.name, "owner": None, "expires": EPOCH}]
+        )
+        return await self._take()
+
+    async def _take(self) -> bool:
+        now = datetime.utcnow()
+        return await self.client.update_if(
+            self.name,
+            {"$or": [{"owner": self.owner}, {"expires": {"$lt": now}}]},
+            {"owner": self.owner, "expires": now + timedelta(seconds=self.seconds)},
+        )
+
+    async def release(self) -> None:
+        """Give the lease up early, if this process holds it."""
+        await self.client.update_if(
+            self.name, {"owner": self.owner}, {"owner": None, "expires": EPOCH}
+        )
@@ -1,18 +1,102 @@
+from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import IndexModel, UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
 from src.config import get_settings
-from src.core.clients.database.base import DatabaseClient
-from typing import List, Dict, Any, Optional
+from src.core.clients.database.base import DatabaseClient, Upsert
+from src.core.clients.database.indexes import IndexSpec
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+NAMESPACE_NOT_FOUND = 26
+INDEX_NOT_FOUND = 27
+INDEX_OPTIONS_CONFLICT = 85
+
+
+def to_object_id(record_id: str):
+    """Convert a string ID to an ObjectId when it is one."""
+    return ObjectId(record_id) if ObjectId.is_valid(record_id) else record_id
+
+
+def create_motor_client(**kwargs) -> AsyncIOMotorClient:
+    """Create the pooled Motor client from the MongoDB settings."""
+    return AsyncIOMotorClient(
+        settings.MONGODB_URL,
+        maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+        minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+        maxIdleTimeMS=int(settings.MONGODB_MAX_IDLE_TIME * 1000),
+        connectTimeoutMS=int(settings.MONGODB_CONNECT_TIMEOUT * 1000),
+        serverSelectionTimeoutMS=int(settings.MONGODB_SERVER_SELECTION_TIMEOUT * 1000),
+        waitQueueTimeoutMS=int(settings.MONGODB_WAIT_QUEUE_TIMEOUT * 1000),
+        **kwargs,
+    )
+
+
+def convert_id_filter(filters: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert string IDs in an ``_id`` condition, including operators, to ObjectIds."""
+    if "_id" not in filters:
+        return filters
+    condition = filters["_id"]
+    if isinstance(condition, dict):
+        condition = {
+            operator: (
+                [to_object_id(value) for value in operand]
+                if isinstance(operand, list)
+                else to_object_id(operand)
+            )
+            for operator, operand in condition.items()
+        }
+    else:
+        condition = to_object_id(condition)
+    return {**filters, "_id": condition}
+
+
+def update_document(update: Upsert) -> Dict[str, Any]:
+    """Build the MongoDB update operators of an upsert."""
+    operators = {
+        "$inc": update.increment,
+        "$set": update.set,
+        "$setOnInsert": update.set_on_insert,
+        "$min": update.minimum,
+        "$max": update.maximum,
+        "$push": {
+            name: {"$each": items, "$slice": -update.push_limit}
+            if update.push_limit
+            else {"$each": items}
+            for name, items in update.push.items()
+        },
+    }
+    return {operator: fields for operator, fields in operators.items() if fields}
+
+
+def upsert_filter(update: Upsert) -> Dict[str, Any]:
+    """Select the record of an upsert unless it matches the upsert's ``unless``."""
+    query = {"_id": to_object_id(update.record_id)}
+    if update.unless:
+        query["$nor"] = [update.unless]
+    return query
+
 
 class MongoDBClient(DatabaseClient):
-    def __init__(self):
-        self.client = AsyncIOMotorClient(settings.MONGODB_URL)
+    """
+    MongoDB implementation of the database client.
+
+    Pass the process-wide Motor client to share its connection pool; without
+    one the client creates, and on close releases, a pool of its own.
+    """
+
+    def __init__(
+        self,
+        client: Optional[AsyncIOMotorClient] = None,
+        collection: str = "queries",
+    ):
+        self._owns_client = client is None
+        self.client = client or create_motor_client()
         self.db = self.client.address_distance
-        self.collection = self.db.queries
+        self.collection = self.db[collection]
 
     async def create(self, data: Dict[str, Any]) -> str:
         """Create a new record in MongoDB."""
@@ -23,37 +107,230 @@ class MongoDBClient(DatabaseClient):
             logger.error(f"Failed to create record: {str(e)}")
             raise
 
+    async def create_many(self, data: List[Dict[str, Any]]) -> List[str]:
+        """Create several records in MongoDB with one insert_many."""
+        if not data:
+            return []
+        try:
+            result = await self.collection.insert_many(data, ordered=False)
+            return [str(inserted_id) for inserted_id in result.inserted_ids]
+        except BulkWriteError as e:
+            # Records with caller-assigned IDs may be retried after a partial
+            # write; the ones already stored are rejected as duplicates.
+            errors = e.details.get("writeErrors", [])
+            if errors and all(error.get("code") == 11000 for error in errors):
+                return [str(record["_id"]) for record in data]
+            logger.error(f"Failed to create records: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to create records: {str(e)}")
+            raise
+
     async def find_many(
         self,
         skip: int = 0,
         limit: int = 10,
-        sort_by: str = "created_at",
+        sort_by: str = "_id",
         sort_order: str = "desc",
         filters: Optional[Dict[str, Any]] = None,
+        projection: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """Find multiple records with pagination and sorting."""
         try:
             sort_direction = -1 if sort_order.lower() == "desc" else 1
-            query = filters or {}
+            query = convert_id_filter(filters or {})
+
+            fields = {field: 1 for field in projection} if projection else None
 
-            cursor = self.collection.find(query)
+            cursor = self.collection.find(query, fields)
             cursor = cursor.sort(sort_by, sort_direction)
             cursor = cursor.skip(skip).limit(limit)
 
-            return await cursor.to_list(length=limit)
+            return await cursor.to_list(length=limit or None)
         except Exception as e:
             logger.error(f"Failed to find records: {str(e)}")
             raise
 
+    async def find_by_id(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """Find a single record by its ID."""
+        try:
+            return await self.collection.find_one({"_id": to_object_id(record_id)})
+        except Exception as e:
+            logger.error(f"Failed to find record: {str(e)}")
+            raise
+
+    async def update(self, record_id: str, data: Dict[str, Any]) -> None:
+        """Set fields on an existing record."""
+        try:
+            await self.collection.update_one(
+                {"_id": to_object_id(record_id)}, {"$set": data}
+            )
+        except Exception as e:
+            logger.error(f"Failed to update record: {str(e)}")
+            raise
+
+    async def update_if(
+        self, record_id: str, filters: Dict[str, Any], data: Dict[str, Any]
+    ) -> bool:
+        """Set fields on a record if it matches the filters, with one update_one."""
+        try:
+            result = await self.collection.update_one(
+                {**filters, "_id": to_object_id(record_id)}, {"$set": data}
+            )
+            return result.matched_count > 0
+        except Exception as e:
+            logger.error(f"Failed to update record: {str(e)}")
+            raise
+
+    async def delete_many(self, filters: Dict[str, Any]) -> int:
+        """Delete every record matching the filters."""
+        try:
+            result = await self.collection.delete_many(convert_id_filter(filters))
+            return result.deleted_count
+        except Exception as e:
+            logger.error(f"Failed to delete records: {str(e)}")
+            raise
+
+    async def increment_many(
+        self, updates: List[Tuple[str, Dict[str, float], Dict[str, Any]]]
+    ) -> None:
+        """Upsert records with $inc counters, in one unordered bulk write."""
+        if not updates:
+            return
+        try:
+            await self.collection.bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": to_object_id(record_id)},
+                        {"$inc": counters, "$setOnInsert": data}
+                        if data
+                        else {"$inc": counters},
+                        upsert=True,
+                    )
+                    for record_id, counters, data in updates
+                ],
+                ordered=False,
+            )
+        except Exception as e:
+            logger.error(f"Failed to increment records: {str(e)}")
+            raise
+
+    async def upsert_many(self, updates: List[Upsert]) -> None:
+        """Apply the upserts in one unordered bulk write."""
+        if not updates:
+            return
+        try:
+            try:
+                await self.collection.bulk_write(
+                    [
+                        UpdateOne(
+                            upsert_filter(update), update_document(update), upsert=True
+                        )
+                        for update in updates
+                    ],
+                    ordered=False,
+                )
+            except BulkWriteError as e:
+                errors = e.details.get("writeErrors", [])
+                if not errors or any(error.get("code") != 11000 for error in errors):
+                    raise
+                # An upsert skipped by ``unless`` tries to insert its record
+                # again and is rejected as a duplicate, as is one that lost a
+                # race to create the record. Plain updates apply the latter
+                # and still skip the former.
+                await self.collection.bulk_write(
+                    [
+                        UpdateOne(
+                            upsert_filter(updates[error["index"]]),
+                            update_document(updates[error["index"]]),
+                        )
+                        for error in errors
+                    ],
+                    ordered=False,
+                )
+        except Exception as e:
+            logger.error(f"Failed to upsert records: {str(e)}")
+            raise
+
     async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Count total number of records."""
         try:
-            query = filters or {}
+            query = convert_id_filter(filters or {})
             return await self.collection.count_documents(query)
         except Exception as e:
             logger.error(f"Failed to count records: {str(e)}")
             raise
 
+    async def estimated_count(self) -> int:
+        """Estimate the number of records from collection metadata."""
+        try:
+            return await self.collection.estimated_document_count()
+        except Exception as e:
+            logger.error(f"Failed to estimate record count: {str(e)}")
+            raise
+
+    async def ensure_indexes(self, indexes: List[IndexSpec]) -> None:
+        """
+        Create the given indexes; existing ones are left as they are, except
+        that the expiry of an existing TTL index is updated in place.
+        """
+        if not indexes:
+            return
+        try:
+            try:
+                await self.collection.create_indexes(
+                    [
+                        IndexModel(index.keys, name=index.name, **index.options)
+                        for index in indexes
+                    ]
+                )
+            except OperationFailure as e:
+                ttl = [
+                    index for index in indexes if "expireAfterSeconds" in index.options
+                ]
+                if e.code != INDEX_OPTIONS_CONFLICT or not ttl:
+                    raise
+                for index in ttl:
+                    await self.db.command(
+                        "collMod",
+                        self.collection.name,
+                        index={
+                            "name": index.name,
+                            "expireAfterSeconds": index.options["expireAfterSeconds"],
+                        },
+                    )
+        except Exception as e:
+            logger.error(f"Failed to create indexes: {str(e)}")
+            raise
+
+    async def drop_indexes(self, names: List[str]) -> None:
+        """Drop the named indexes; missing ones are skipped."""
+        for name in names:
+            try:
+                await self.collection.drop_index(name)
+            except OperationFailure as e:
+                if e.code not in (INDEX_NOT_FOUND, NAMESPACE_NOT_FOUND):
+                    logger.error(f"Failed to drop index {name}: {str(e)}")
+                    raise
+
+    async def explain(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "_id",
+        sort_order: str = "desc",
+        limit: int = 10,
+    ) -> Dict[str, Any]:
+        """Explain the plan MongoDB picks for a find_many query."""
+        try:
+            sort_direction = -1 if sort_order.lower() == "desc" else 1
+            cursor = self.collection.find(convert_id_filter(filters or {}))
+            cursor = cursor.sort(sort_by, sort_direction).limit(limit)
+            return await cursor.explain()
+        except Exception as e:
+            logger.error(f"Failed to explain query: {str(e)}")
+            raise
+
     async def close(self) -> None:
-        """Close the MongoDB connection."""
-        self.client.close()
+        """Close the MongoDB connection if this client created it."""
+        if self._owns_client:
+            self.client.close()
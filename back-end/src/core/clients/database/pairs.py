@@ -0,0 +1,169 @@
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+from bson import ObjectId
+from src.core.clients.database.base import DatabaseClient, Upsert
+from src.core.clients.database.indexes import IndexSpec
+
+
+def pair_id(address1_key: str, address2_key: str) -> str:
+    """The record ID of an address pair, the same in either direction."""
+    key1, key2 = sorted([address1_key, address2_key])
+    return hashlib.sha1(f"{key1}|{key2}".encode()).hexdigest()
+
+
+class PairDatabaseClient(DatabaseClient):
+    """
+    Stores query records as one record per canonical address pair.
+
+    ``create`` and ``create_many`` take the query records DistanceService
+    builds and upsert the record of each pair instead of inserting them: the
+    ``hits`` counter is incremented, ``first_seen`` and ``last_seen`` bound
+    the query timestamps, ``last_query_id`` holds the newest query's ID, and
+    ``recent`` logs the last ``recent_limit`` queries with their requester
+    IP. Queries for the same pair in one call are coalesced into a single
+    upsert. The distance fields follow the newest query.
+
+    The query IDs returned are ObjectIds assigned here unless the records
+    carry one, so they order pairs by their latest query. Everything else is
+    passed to the wrapped client, which holds the pair records.
+
+    Writing the same queries again, as when a failed write is retried,
+    skips every pair whose ``recent`` log already holds one of them, so a
+    partly applied write can be retried without counting its queries twice.
+    A retry is only recognized while fewer than ``recent_limit`` newer
+    queries have been recorded on the pair.
+    """
+
+    def __init__(self, client: DatabaseClient, recent_limit: int = 20):
+        self.client = client
+        self.recent_limit = recent_limit
+
+    def _upserts(self, records: List[Dict[str, Any]]) -> Tuple[List[str], List[Upsert]]:
+        ids = []
+        upserts: Dict[str, Upsert] = {}
+        for record in records:
+            query_id = str(record.get("_id") or ObjectId())
+            ids.append(query_id)
+            record_id = pair_id(record["address1_key"], record["address2_key"])
+            upsert = upserts.get(record_id)
+            if upsert is None:
+                upsert = upserts[record_id] = Upsert(
+                    record_id,
+                    increment={"hits": 0},
+                    set_on_insert={
+                        "address1": record["address1"],
+                        "address2": record["address2"],
+                        "address1_key": record["address1_key"],
+                        "address2_key": record["address2_key"],
+                    },
+                    minimum={"first_seen": record["timestamp"]},
+                    maximum={
+                        "last_seen": record["timestamp"],
+                        "last_query_id": query_id,
+                    },
+                    push={"recent": []},
+                    push_limit=self.recent_limit,
+                )
+            upsert.increment["hits"] += 1
+            upsert.set = {
+                "kilometers": record["kilometers"],
+                "miles": record["miles"],
+                "coordinates": record["coordinates"],
+            }
+            upsert.minimum["first_seen"] = min(
+                upsert.minimum["first_seen"], record["timestamp"]
+            )
+            upsert.maximum["last_seen"] = max(
+                upsert.maximum["last_seen"], record["timestamp"]
+            )
+            upsert.maximum["last_query_id"] = max(
+                upsert.maximum["last_query_id"], query_id
+            )
+            upsert.push["recent"].append(
+                {
+                    "query_id": query_id,
+                    "timestamp": record["timestamp"],
+                    "ip_address": record.get("ip_address"),
+                }
+            )
+        for upsert in upserts.values():
+            upsert.unless = {
+                "recent.query_id": {
+                    "$in": [entry["query_id"] for entry in upsert.push["recent"]]
+                }
+            }
+        return ids, list(upserts.values())
+
+    async def create(self, data: Dict[str, Any]) -> str:
+        """Record a query on its pair; returns the query's ID."""
+        return (await self.create_many([data]))[0]
+
+    async def create_many(self, data: List[Dict[str, Any]]) -> List[str]:
+        """Record queries on their pairs; returns the queries' IDs."""
+        ids, upserts = self._upserts(data)
+        await self.client.upsert_many(upserts)
+        return ids
+
+    async def find_many(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        sort_by: str = "_id",
+        sort_order: str = "desc",
+        filters: Optional[Dict[str, Any]] = None,
+        projection: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        return await self.client.find_many(
+            skip=skip,
+            limit=limit,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            filters=filters,
+            projection=projection,
+        )
+
+    async def find_by_id(self, record_id: str) -> Optional[Dict[str, Any]]:
+        return await self.client.find_by_id(record_id)
+
+    async def update(self, record_id: str, data: Dict[str, Any]) -> None:
+        await self.client.update(record_id, data)
+
+    async def update_if(
+        self, record_id: str, filters: Dict[str, Any], data: Dict[str, Any]
+    ) -> bool:
+        return await self.client.update_if(record_id, filters, data)
+
+    async def delete_many(self, filters: Dict[str, Any]) -> int:
+        return await self.client.delete_many(filters)
+
+    async def increment_many(
+        self, updates: List[Tuple[str, Dict[str, float], Dict[str, Any]]]
+    ) -> None:
+        await self.client.increment_many(updates)
+
+    async def upsert_many(self, updates: List[Upsert]) -> None:
+        await self.client.upsert_many(updates)
+
+    async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        return await self.client.count(filters)
+
+    async def estimated_count(self) -> int:
+        return await self.client.estimated_count()
+
+    async def ensure_indexes(self, indexes: List[IndexSpec]) -> None:
+        await self.client.ensure_indexes(indexes)
+
+    async def drop_indexes(self, names: List[str]) -> None:
+        await self.client.drop_indexes(names)
+
+    async def explain(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "_id",
+        sort_order: str = "desc",
+        limit: int = 10,
+    ) -> Dict[str, Any]:
+        return await self.client.explain(filters, sort_by, sort_order, limit)
+
+    async def close(self) -> None:
+        await self.client.close()
@@ -0,0 +1,77 @@
+import threading
+from collections import defaultdict
+from typing import Any, Dict
+from pymongo import monitoring
+
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """
+    Tracks connection pool usage per server from pymongo's pool events.
+
+    Events arrive on driver threads, so counters are guarded by a lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+
+    def _count(self, event: Any, counter: str, delta: int = 1) -> None:
+        host, port = event.address
+        with self._lock:
+            self._counters[f"{host}:{port}"][counter] += delta
+
+    def pool_created(self, event):
+        self._count(event, "pools_created")
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._count(event, "pools_cleared")
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._count(event, "open")
+        self._count(event, "created")
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._count(event, "open", -1)
+
+    def connection_check_out_started(self, event):
+        self._count(event, "waiting")
+
+    def connection_check_out_failed(self, event):
+        self._count(event, "waiting", -1)
+        self._count(event, "check_out_failures")
+
+    def connection_checked_out(self, event):
+        self._count(event, "waiting", -1)
+        self._count(event, "in_use")
+        self._count(event, "checked_out")
+
+    def connection_checked_in(self, event):
+        self._count(event, "in_use", -1)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Pool counters by server address."""
+        with self._lock:
+            return {
+                address: {
+                    "open": counters["open"],
+                    "in_use": counters["in_use"],
+                    "available": counters["open"] - counters["in_use"],
+                    "waiting": counters["waiting"],
+                    "created": counters["created"],
+                    "checked_out": counters["checked_out"],
+                    "check_out_failures": counters["check_out_failures"],
+                    "pools_cleared": counters["pools_cleared"],
+                }
+                for address, counters in self._counters.items()
+            }
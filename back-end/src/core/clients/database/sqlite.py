@@ -0,0 +1,688 @@
+import asyncio
+import json
+import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from bson import ObjectId
+from src.core.clients.database.base import DatabaseClient, Upsert
+from src.core.clients.database.indexes import INDEXES, TEXT, IndexSpec
+import logging
+
+logger = logging.getLogger(__name__)
+
+FIELD_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*$")
+# The highest code point; appended to a prefix it bounds every string
+# starting with that prefix.
+MAX_CHAR = "\U0010ffff"
+COMPARISONS = {"$lt": "<", "$lte": "<=", "$gt": ">", "$gte": ">="}
+
+
+def encode_value(value: Any) -> Any:
+    """JSON-encode the values JSON has no type for."""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        return {"$date": value.strftime("%Y-%m-%dT%H:%M:%S.%f")}
+    if isinstance(value, tuple):
+        return list(value)
+    raise TypeError(f"Cannot store {type(value).__name__}")
+
+
+def decode_object(value: Dict[str, Any]) -> Any:
+    if len(value) == 1 and "$date" in value:
+        return datetime.strptime(value["$date"], "%Y-%m-%dT%H:%M:%S.%f")
+    return value
+
+
+def dumps(data: Dict[str, Any]) -> str:
+    return json.dumps(data, default=encode_value, separators=(",", ":"))
+
+
+def loads(data: str) -> Dict[str, Any]:
+    return json.loads(data, object_hook=decode_object)
+
+
+def sql_value(value: Any) -> Any:
+    """
+    Convert a filter operand to what json_extract returns for it: scalars as
+    themselves, anything else as its minified JSON text.
+    """
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, bool):
+        return int(value)
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    return json.dumps(value, default=encode_value, separators=(",", ":"))
+
+
+def regexp(pattern: str, value: Any) -> bool:
+    return isinstance(value, str) and re.search(pattern, value) is not None
+
+
+def literal_prefix(pattern: str) -> Optional[str]:
+    """The literal a ``^prefix`` pattern matches, if it has no other syntax."""
+    if not pattern.startswith("^"):
+        return None
+    prefix = re.sub(r"\\(.)", r"\1", pattern[1:])
+    if re.escape(prefix) != pattern[1:]:
+        return None
+    return prefix
+
+
+class SQLiteDatabase:
+    """
+    A SQLite database file shared by the collection clients built on it.
+
+    Every statement runs on one dedicated I/O thread that owns the
+    connection, so the event loop never blocks on disk and statements never
+    contend for the connection. sqlite3 keeps the compiled form of recently
+    used statements, so repeated queries are prepared once.
+    """
+
+    def __init__(self, path: str, cached_statements: int = 256):
+        self.path = path
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sqlite-io"
+        )
+        self._conn: Optional[sqlite3.Connection] = None
+        self._cached_statements = cached_statements
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(
+                self.path,
+                timeout=5.0,
+                isolation_level=None,
+                cached_statements=self._cached_statements,
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.create_function("REGEXP", 2, regexp, deterministic=True)
+        return self._conn
+
+    async def run(self, function: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run ``function`` with the connection on the I/O thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, lambda: function(self._connect())
+        )
+
+    async def transaction(
+        self, function: Callable[[sqlite3.Connection], Any]
+    ) -> Any:
+        """Run ``function`` on the I/O thread inside a write transaction."""
+
+        def run(conn: sqlite3.Connection) -> Any:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = function(conn)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            return result
+
+        return await self.run(run)
+
+    def close(self) -> None:
+        """Close the connection and stop the I/O thread."""
+
+        def close() -> None:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+        self._executor.submit(close).result()
+        self._executor.shutdown()
+
+
+class SQLiteDatabaseClient(DatabaseClient):
+    """
+    SQLite implementation of the database client.
+
+    Each collection is a table of JSON documents keyed by ID. Filters use the
+    MongoDB query syntax the services issue: equality (on a dotted path also
+    matching the elements of an array), $lt/$lte/$gt/$gte, $ne, $in,
+    $or/$and, $regex (a literal ``^prefix`` becomes an indexable range) and
+    $text. Declared indexes become expression indexes on the JSON
+    fields, which the translated filters and sorts use, and a text index
+    becomes an FTS5 table kept in step by triggers. The collection's declared
+    indexes are created with its table.
+
+    IDs are ObjectId strings unless the record brings its own, so newest-first
+    ordering by ID matches MongoDB's.
+    """
+
+    def __init__(self, database: SQLiteDatabase, collection: str = "queries"):
+        if not re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", collection):
+            raise ValueError(f"Invalid collection name: {collection}")
+        self.database = database
+        self.table = collection
+        self.indexes = INDEXES.get(collection, [])
+        self.text_index: Optional[str] = None
+        for index in self.indexes:
+            if self._is_text(index):
+                self.text_index = f"{self.table}_{index.name}"
+        self._created = False
+
+    def _ensure_table(self, conn: sqlite3.Connection) -> None:
+        if self._created:
+            return
+        # Reads run outside a transaction; create the schema in one.
+        begin = not conn.in_transaction
+        if begin:
+            conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                "(id TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+            self._create_indexes(conn, self.indexes)
+        except BaseException:
+            if begin:
+                conn.execute("ROLLBACK")
+            raise
+        if begin:
+            conn.execute("COMMIT")
+        self._created = True
+
+    @staticmethod
+    def _is_text(index: IndexSpec) -> bool:
+        return any(direction == TEXT for _, direction in index.keys)
+
+    def _create_indexes(
+        self, conn: sqlite3.Connection, indexes: List[IndexSpec]
+    ) -> None:
+        for index in indexes:
+            name = f"{self.table}_{index.name}"
+            if self._is_text(index):
+                self._create_text_index(conn, name, [field for field, _ in index.keys])
+                continue
+            columns = ", ".join(
+                f"{self._field(field)} {'DESC' if direction == -1 else 'ASC'}"
+                for field, direction in index.keys
+            )
+            unique = "UNIQUE " if index.options.get("unique") else ""
+            conn.execute(
+                f"CREATE {unique}INDEX IF NOT EXISTS {name} ON {self.table} ({columns})"
+            )
+
+    def _create_text_index(
+        self, conn: sqlite3.Connection, name: str, fields: List[str]
+    ) -> None:
+        """
+        Create a contentless FTS5 table over ``fields``, maintained by triggers
+        on the collection table and filled from the rows already stored.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+        ).fetchone()
+        if exists:
+            return
+        columns = [f"c{position}" for position in range(len(fields))]
+        names = ", ".join(columns)
+
+        def values(row: str) -> str:
+            for field in fields:
+                self._field(field)
+            return ", ".join(
+                f"json_extract({row}.data, '$.{field}')" for field in fields
+            )
+
+        insert = f"INSERT INTO {name} (rowid, {names}) VALUES (new.rowid, {values('new')});"
+        delete = (
+            f"INSERT INTO {name} ({name}, rowid, {names}) "
+            f"VALUES ('delete', old.rowid, {values('old')});"
+        )
+        conn.execute(
+            f"CREATE VIRTUAL TABLE {name} USING fts5({names}, content='', "
+            "tokenize='porter unicode61')"
+        )
+        conn.execute(
+            f"CREATE TRIGGER {name}_insert AFTER INSERT ON {self.table} BEGIN {insert} END"
+        )
+        conn.execute(
+            f"CREATE TRIGGER {name}_delete AFTER DELETE ON {self.table} BEGIN {delete} END"
+        )
+        conn.execute(
+            f"CREATE TRIGGER {name}_update AFTER UPDATE ON {self.table} "
+            f"BEGIN {delete} {insert} END"
+        )
+        conn.execute(
+            f"INSERT INTO {name} (rowid, {names}) "
+            f"SELECT rowid, {', '.join(self._field(field) for field in fields)} "
+            f"FROM {self.table}"
+        )
+
+    @staticmethod
+    def _field(name: str) -> str:
+        if name == "_id":
+            return "id"
+        if not FIELD_PATTERN.match(name):
+            raise ValueError(f"Invalid field name: {name}")
+        # Inlined rather than bound so that it matches the index expressions.
+        return f"json_extract(data, '$.{name}')"
+
+    def _where(self, filters: Optional[Dict[str, Any]]) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        for key, condition in (filters or {}).items():
+            if key in ("$or", "$and"):
+                parts = [self._where(part) for part in condition]
+                joiner = " OR " if key == "$or" else " AND "
+                clauses.append(
+                    "(" + joiner.join(f"({sql})" for sql, _ in parts) + ")"
+                )
+                params.extend(param for _, part in parts for param in part)
+            elif key == "$text":
+                if self.text_index is None:
+                    raise ValueError(f"No text index on {self.table}")
+                words = condition["$search"].split()
+                if not words:
+                    clauses.append("0")
+                    continue
+                # Any of the words, as MongoDB matches a $text search.
+                clauses.append(
+                    f"rowid IN (SELECT rowid FROM {self.text_index} "
+                    f"WHERE {self.text_index} MATCH ?)"
+                )
+                params.append(
+                    " OR ".join('"' + word.replace('"', '""') + '"' for word in words)
+                )
+            elif "." in key and condition is not None and (
+                not self._is_operator(condition) or set(condition) == {"$in"}
+            ):
+                # As in MongoDB, a path through an array matches any element.
+                array, _, rest = key.partition(".")
+                direct, direct_params = self._condition(self._field(key), condition)
+                element, element_params = self._condition(
+                    f"json_extract(value, '$.{rest}')", condition
+                )
+                clauses.append(
+                    f"({direct} OR EXISTS (SELECT 1 FROM "
+                    f"json_each(data, '$.{array}') WHERE type = 'object' "
+                    f"AND {element}))"
+                )
+                params.extend(direct_params + element_params)
+            else:
+                sql, values = self._condition(self._field(key), condition)
+                clauses.append(sql)
+                params.extend(values)
+        return " AND ".join(clauses) or "1", params
+
+    @staticmethod
+    def _is_operator(condition: Any) -> bool:
+        return isinstance(condition, dict) and any(
+            key.startswith("$") for key in condition
+        )
+
+    def _condition(self, field: str, condition: Any) -> Tuple[str, List[Any]]:
+        if not self._is_operator(condition):
+            if condition is None:
+                return f"{field} IS NULL", []
+            return f"{field} = ?", [sql_value(condition)]
+
+        clauses: List[str] = []
+        params: List[Any] = []
+        for operator, operand in condition.items():
+            if operator in COMPARISONS:
+                clauses.append(f"{field} {COMPARISONS[operator]} ?")
+                params.append(sql_value(operand))
+            elif operator == "$ne":
+                if operand is None:
+                    clauses.append(f"{field} IS NOT NULL")
+                else:
+                    clauses.append(f"({field} IS NULL OR {field} != ?)")
+                    params.append(sql_value(operand))
+            elif operator == "$in":
+                placeholders = ", ".join("?" for _ in operand) or "NULL"
+                clauses.append(f"{field} IN ({placeholders})")
+                params.extend(sql_value(value) for value in operand)
+            elif operator == "$regex":
+                prefix = literal_prefix(operand)
+                if prefix:
+                    clauses.append(f"({field} >= ? AND {field} < ?)")
+                    params.extend([prefix, prefix + MAX_CHAR])
+                else:
+                    clauses.append(f"{field} REGEXP ?")
+                    params.append(operand)
+            else:
+                raise ValueError(f"Unsupported query operator: {operator}")
+        return " AND ".join(clauses), params
+
+    def _select(
+        self,
+        columns: str,
+        filters: Optional[Dict[str, Any]],
+        sort_by: Optional[str] = None,
+        sort_order: str = "desc",
+        skip: int = 0,
+        limit: int = 0,
+    ) -> Tuple[str, List[Any]]:
+        where, params = self._where(filters)
+        sql = f"SELECT {columns} FROM {self.table} WHERE {where}"
+        if sort_by:
+            direction = "DESC" if sort_order.lower() == "desc" else "ASC"
+            sql += f" ORDER BY {self._field(sort_by)} {direction}"
+        if limit or skip:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit or -1, skip]
+        return sql, params
+
+    @staticmethod
+    def _record(row: Tuple[str, str]) -> Dict[str, Any]:
+        record = loads(row[1])
+        record["_id"] = row[0]
+        return record
+
+    async def create(self, data: Dict[str, Any]) -> str:
+        """Create a new record."""
+        return (await self.create_many([data]))[0]
+
+    async def create_many(self, data: List[Dict[str, Any]]) -> List[str]:
+        """Create several records in one transaction."""
+        if not data:
+            return []
+        rows = []
+        for record in data:
+            record_id = str(record.get("_id") or ObjectId())
+            fields = {key: value for key, value in record.items() if key != "_id"}
+            rows.append((record_id, dumps(fields)))
+
+        def insert(conn: sqlite3.Connection) -> None:
+            self._ensure_table(conn)
+            # Retried writes of records that are already stored are ignored,
+            # as MongoDBClient does with duplicate keys.
+            conn.executemany(
+                f"INSERT OR IGNORE INTO {self.table} (id, data) VALUES (?, ?)", rows
+            )
+
+        try:
+            await self.database.transaction(insert)
+            return [record_id for record_id, _ in rows]
+        except Exception as e:
+            logger.error(f"Failed to create records: {str(e)}")
+            raise
+
+    async def find_many(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        sort_by: str = "_id",
+        sort_order: str = "desc",
+        filters: Optional[Dict[str, Any]] = None,
+        projection: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Find multiple records with pagination and sorting."""
+        sql, params = self._select("id, data", filters, sort_by, sort_order, skip, limit)
+
+        def select(conn: sqlite3.Connection) -> List[Tuple[str, str]]:
+            self._ensure_table(conn)
+            return conn.execute(sql, params).fetchall()
+
+        try:
+            records = [self._record(row) for row in await self.database.run(select)]
+        except Exception as e:
+            logger.error(f"Failed to find records: {str(e)}")
+            raise
+        if projection:
+            fields = set(projection) | {"_id"}
+            records = [
+                {key: value for key, value in record.items() if key in fields}
+                for record in records
+            ]
+        return records
+
+    async def find_by_id(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """Find a single record by its ID."""
+        records = await self.find_many(limit=1, filters={"_id": str(record_id)})
+        return records[0] if records else None
+
+    async def update(self, record_id: str, data: Dict[str, Any]) -> None:
+        """Set fields on an existing record."""
+
+        def update(conn: sqlite3.Connection) -> None:
+            self._ensure_table(conn)
+            row = conn.execute(
+                f"SELECT id, data FROM {self.table} WHERE id = ?", (str(record_id),)
+            ).fetchone()
+            if row is None:
+                return
+            record = loads(row[1])
+            record.update(data)
+            conn.execute(
+                f"UPDATE {self.table} SET data = ? WHERE id = ?",
+                (dumps(record), row[0]),
+            )
+
+        try:
+            await self.database.transaction(update)
+        except Exception as e:
+            logger.error(f"Failed to update record: {str(e)}")
+            raise
+
+    async def update_if(
+        self, record_id: str, filters: Dict[str, Any], data: Dict[str, Any]
+    ) -> bool:
+        """Set fields on a record if it matches the filters, in one transaction."""
+        where, params = self._where(filters)
+
+        def update(conn: sqlite3.Connection) -> bool:
+            self._ensure_table(conn)
+            row = conn.execute(
+                f"SELECT id, data FROM {self.table} WHERE id = ? AND {where}",
+                [str(record_id)] + params,
+            ).fetchone()
+            if row is None:
+                return False
+            record = loads(row[1])
+            record.update(data)
+            conn.execute(
+                f"UPDATE {self.table} SET data = ? WHERE id = ?",
+                (dumps(record), row[0]),
+            )
+            return True
+
+        try:
+            return await self.database.transaction(update)
+        except Exception as e:
+            logger.error(f"Failed to update record: {str(e)}")
+            raise
+
+    async def delete_many(self, filters: Dict[str, Any]) -> int:
+        """Delete every record matching the filters."""
+        where, params = self._where(filters)
+
+        def delete(conn: sqlite3.Connection) -> int:
+            self._ensure_table(conn)
+            return conn.execute(
+                f"DELETE FROM {self.table} WHERE {where}", params
+            ).rowcount
+
+        try:
+            return await self.database.transaction(delete)
+        except Exception as e:
+            logger.error(f"Failed to delete records: {str(e)}")
+            raise
+
+    async def increment_many(
+        self, updates: List[Tuple[str, Dict[str, float], Dict[str, Any]]]
+    ) -> None:
+        """Add to counters on records, creating missing ones, in one transaction."""
+
+        def increment(conn: sqlite3.Connection) -> None:
+            self._ensure_table(conn)
+            for record_id, counters, data in updates:
+                row = conn.execute(
+                    f"SELECT data FROM {self.table} WHERE id = ?", (record_id,)
+                ).fetchone()
+                record = loads(row[0]) if row else dict(data)
+                for name, value in counters.items():
+                    record[name] = record.get(name, 0) + value
+                if row:
+                    conn.execute(
+                        f"UPDATE {self.table} SET data = ? WHERE id = ?",
+                        (dumps(record), record_id),
+                    )
+                else:
+                    conn.execute(
+                        f"INSERT INTO {self.table} (id, data) VALUES (?, ?)",
+                        (record_id, dumps(record)),
+                    )
+
+        if not updates:
+            return
+        try:
+            await self.database.transaction(increment)
+        except Exception as e:
+            logger.error(f"Failed to increment records: {str(e)}")
+            raise
+
+    async def upsert_many(self, updates: List[Upsert]) -> None:
+        """Apply the upserts in one transaction."""
+        unless = [self._where(update.unless) for update in updates]
+
+        def upsert(conn: sqlite3.Connection) -> None:
+            self._ensure_table(conn)
+            for update, (skip_where, skip_params) in zip(updates, unless):
+                if update.unless and conn.execute(
+                    f"SELECT 1 FROM {self.table} WHERE id = ? AND {skip_where}",
+                    [update.record_id] + skip_params,
+                ).fetchone():
+                    continue
+                row = conn.execute(
+                    f"SELECT data FROM {self.table} WHERE id = ?", (update.record_id,)
+                ).fetchone()
+                record = loads(row[0]) if row else dict(update.set_on_insert)
+                record.update(update.set)
+                for name, value in update.increment.items():
+                    record[name] = record.get(name, 0) + value
+                for name, value in update.minimum.items():
+                    if record.get(name) is None or value < record[name]:
+                        record[name] = value
+                for name, value in update.maximum.items():
+                    if record.get(name) is None or value > record[name]:
+                        record[name] = value
+                for name, items in update.push.items():
+                    values = record.get(name, []) + list(items)
+                    record[name] = values[-update.push_limit :] if update.push_limit else values
+                if row:
+                    conn.execute(
+                        f"UPDATE {self.table} SET data = ? WHERE id = ?",
+                        (dumps(record), update.record_id),
+                    )
+                else:
+                    conn.execute(
+                        f"INSERT INTO {self.table} (id, data) VALUES (?, ?)",
+                        (update.record_id, dumps(record)),
+                    )
+
+        if not updates:
+            return
+        try:
+            await self.database.transaction(upsert)
+        except Exception as e:
+            logger.error(f"Failed to upsert records: {str(e)}")
+            raise
+
+    async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Count total number of records."""
+        sql, params = self._select("count(*)", filters)
+
+        def count(conn: sqlite3.Connection) -> int:
+            self._ensure_table(conn)
+            return conn.execute(sql, params).fetchone()[0]
+
+        try:
+            return await self.database.run(count)
+        except Exception as e:
+            logger.error(f"Failed to count records: {str(e)}")
+            raise
+
+    async def ensure_indexes(self, indexes: List[IndexSpec]) -> None:
+        """
+        Create the given indexes; a text index is the one $text searches.
+        SQLite has no TTL indexes, so their expiry is not enforced.
+        """
+        for index in indexes:
+            if self._is_text(index):
+                self.text_index = f"{self.table}_{index.name}"
+
+        def create(conn: sqlite3.Connection) -> None:
+            self._ensure_table(conn)
+            self._create_indexes(conn, indexes)
+
+        try:
+            await self.database.transaction(create)
+        except Exception as e:
+            logger.error(f"Failed to create indexes: {str(e)}")
+            raise
+
+    async def drop_indexes(self, names: List[str]) -> None:
+        """Drop the named indexes; missing ones are skipped."""
+
+        def drop(conn: sqlite3.Connection) -> None:
+            self._ensure_table(conn)
+            for name in names:
+                if not re.match(r"^[A-Za-z0-9_]+$", name):
+                    raise ValueError(f"Invalid index name: {name}")
+                conn.execute(f"DROP INDEX IF EXISTS {self.table}_{name}")
+
+        try:
+            await self.database.transaction(drop)
+        except Exception as e:
+            logger.error(f"Failed to drop indexes: {str(e)}")
+            raise
+
+    async def explain(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "_id",
+        sort_order: str = "desc",
+        limit: int = 10,
+    ) -> Dict[str, Any]:
+        """
+        Explain the plan SQLite picks for a find_many query, in the shape of a
+        MongoDB explain(): table scans are COLLSCAN stages, index searches
+        IXSCAN stages and temporary sort trees SORT stages.
+        """
+        sql, params = self._select("id, data", filters, sort_by, sort_order, 0, limit)
+
+        def explain(conn: sqlite3.Connection) -> List[Tuple]:
+            self._ensure_table(conn)
+            return conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+
+        stages: List[Dict[str, Any]] = []
+        union = sort = False
+        for row in await self.database.run(explain):
+            detail = row[-1]
+            index = re.search(r"USING (?:COVERING )?INDEX (\S+)", detail)
+            if detail.startswith("MULTI-INDEX OR"):
+                union = True
+            elif "TEMP B-TREE" in detail:
+                sort = True
+            elif "VIRTUAL TABLE" in detail:
+                stages.append({"stage": "TEXT_MATCH", "indexName": detail.split()[1]})
+            elif "USING INTEGER PRIMARY KEY" in detail:
+                stages.append({"stage": "FETCH"})
+            elif index:
+                stages.append({"stage": "IXSCAN", "indexName": index.group(1)})
+            elif detail.startswith(("SCAN", "SEARCH")):
+                stages.append({"stage": "COLLSCAN"})
+
+        if union:
+            plan: Dict[str, Any] = {"stage": "OR", "inputStages": stages}
+        else:
+            plan = {}
+            for stage in reversed(stages):
+                plan = {**stage, "inputStage": plan} if plan else stage
+        if sort:
+            plan = {"stage": "SORT", "inputStage": plan}
+        return {"queryPlanner": {"winningPlan": plan}, "sqlite": sql}
+
+    async def close(self) -> None:
+        """The shared SQLiteDatabase is closed by its owner."""
+        pass
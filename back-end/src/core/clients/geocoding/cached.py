@@ -0,0 +1,54 @@
+from src.core.canonical import canonicalize_address
+from src.core.clients.cache.base import BaseCacheClient
+from src.core.clients.geocoding.base import GeocodingClient
+from src.core.clients.geocoding.exceptions import AddressNotFoundError
+from src.distance.schemas import GeoLocation
+
+CACHE_NAMESPACE = "geocode"
+NEGATIVE_CACHE_NAMESPACE = "geocode_not_found"
+
+
+def cache_key(address: str) -> str:
+    """Build the per-address cache key."""
+    return canonicalize_address(address)
+
+
+class CachedGeocodingClient(GeocodingClient):
+    """
+    Geocoding client that serves repeated addresses from a shared cache.
+
+    Addresses the provider could not resolve are remembered for
+    ``negative_ttl`` seconds so that retries are not sent upstream again.
+    """
+
+    def __init__(
+        self,
+        client: GeocodingClient,
+        cache: BaseCacheClient,
+        ttl: int = None,
+        negative_ttl: int = 300,
+    ):
+        self.client = client
+        self.cache = cache
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+    async def geocode(self, address: str) -> GeoLocation:
+        key = cache_key(address)
+        cached = await self.cache.get(key, CACHE_NAMESPACE)
+        if cached:
+            return GeoLocation(**cached)
+
+        not_found = await self.cache.get(key, NEGATIVE_CACHE_NAMESPACE)
+        if not_found:
+            raise AddressNotFoundError(not_found)
+
+        try:
+            location = await self.client.geocode(address)
+        except AddressNotFoundError as ex:
+            await self.cache.set(
+                key, str(ex), NEGATIVE_CACHE_NAMESPACE, ttl=self.negative_ttl
+            )
+            raise
+        await self.cache.set(key, location.model_dump(), CACHE_NAMESPACE, ttl=self.ttl)
+        return location
@@ -1,51 +1,108 @@
 import httpx
-from typing import Dict, Any
+import importlib.util
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
 from src.config import get_settings
 from src.core.clients.geocoding.base import GeocodingClient
-from src.core.clients.geocoding.exceptions import GeocodingError
+from src.core.clients.geocoding.exceptions import (
+    AddressNotFoundError,
+    GeocodingError,
+    RetryableGeocodingError,
+)
 from src.config import logger
 from src.distance.schemas import GeoLocation
 
 settings = get_settings()
 
+RETRYABLE_STATUS_CODES = {429, 503}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create the pooled HTTP client shared by every geocoding request.
+
+    HTTP/2 is only enabled when requested and the optional ``h2`` package is
+    installed; otherwise the client falls back to HTTP/1.1 keep-alive.
+    """
+    http2 = settings.NOMINATIM_HTTP2
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("NOMINATIM_HTTP2 is enabled but h2 is not installed")
+        http2 = False
+
+    return httpx.AsyncClient(
+        http2=http2,
+        timeout=httpx.Timeout(
+            settings.NOMINATIM_TIMEOUT,
+            connect=settings.NOMINATIM_CONNECT_TIMEOUT,
+            pool=settings.NOMINATIM_POOL_TIMEOUT,
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.NOMINATIM_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.NOMINATIM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.NOMINATIM_KEEPALIVE_EXPIRY,
+        ),
+    )
+
 
 class NominatimClient(GeocodingClient):
-    def __init__(self):
-        self.base_url = settings.NOMINATIM_BASE_URL
+    def __init__(self, client: httpx.AsyncClient, base_url: Optional[str] = None):
+        self.client = client
+        self.base_url = base_url or settings.NOMINATIM_BASE_URL
         self.headers = {"User-Agent": settings.NOMINATIM_USER_AGENT}
-        self.timeout = settings.NOMINATIM_TIMEOUT
 
     async def geocode(self, address: str) -> GeoLocation:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/search",
-                    params={"q": address, "format": "json", "limit": 1},
-                    headers=self.headers,
-                )
-
-                logger.info(f"Response Status: {response.status_code}")
-                logger.info(f"Response Headers: {dict(response.headers)}")
-                logger.info(f"Response URL: {response.url}")
-                logger.info(f"Response Content: {response.text}")
+        try:
+            response = await self.client.get(
+                f"{self.base_url}/search",
+                params={"q": address, "format": "json", "limit": 1},
+                headers=self.headers,
+            )
 
-                response.raise_for_status()
-                results = response.json()
+            logger.info(f"Response Status: {response.status_code}")
+            logger.info(f"Response Headers: {dict(response.headers)}")
+            logger.info(f"Response URL: {response.url}")
+            logger.info(f"Response Content: {response.text}")
 
-                if not results:
-                    print("NO RESULTSS")
-                    raise GeocodingError(
-                        f"No results found for address: {address}. The GeoCoding Client cannot code this address."
-                    )
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                raise RetryableGeocodingError(
+                    f"Geocoding service unavailable: HTTP {response.status_code}",
+                    retry_after=parse_retry_after(response.headers.get("Retry-After")),
+                )
 
-                result = results[0]
+            response.raise_for_status()
+            results = response.json()
 
-                return GeoLocation(
-                    latitude=float(result["lat"]),
-                    longitude=float(result["lon"]),
-                    address=result["display_name"],
+            if not results:
+                raise AddressNotFoundError(
+                    f"No results found for address: {address}. The GeoCoding Client cannot code this address."
                 )
-            except httpx.HTTPError as e:
-                raise GeocodingError(f"Geocoding service error: {str(e)}")
-            except (KeyError, ValueError) as e:
-                raise GeocodingError(f"Invalid response format: {str(e)}")
+
+            result = results[0]
+
+            return GeoLocation(
+                latitude=float(result["lat"]),
+                longitude=float(result["lon"]),
+                address=result["display_name"],
+            )
+        except httpx.TransportError as e:
+            raise RetryableGeocodingError(f"Geocoding service error: {str(e)}")
+        except httpx.HTTPError as e:
+            raise GeocodingError(f"Geocoding service error: {str(e)}")
+        except (KeyError, ValueError) as e:
+            raise GeocodingError(f"Invalid response format: {str(e)}")
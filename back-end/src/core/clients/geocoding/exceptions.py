@@ -1,2 +1,23 @@
+from typing import Optional
+
+
 class GeocodingError(Exception):
     pass
+
+
+class AddressNotFoundError(GeocodingError):
+    pass
+
+
+class RetryableGeocodingError(GeocodingError):
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class SchedulerRejectedError(GeocodingError):
+    pass
+
+
+class CircuitOpenError(GeocodingError):
+    pass
@@ -0,0 +1,218 @@
+import re
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional, Set
+from src.core.clients.geocoding.base import GeocodingClient
+from src.core.clients.geocoding.cached import cache_key
+from src.distance.schemas import GeoLocation
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Tokens that tell otherwise similar addresses apart, mapped to one spelling.
+DIRECTIONALS = {
+    "n": "n",
+    "north": "n",
+    "s": "s",
+    "south": "s",
+    "e": "e",
+    "east": "e",
+    "w": "w",
+    "west": "w",
+    "ne": "ne",
+    "northeast": "ne",
+    "nw": "nw",
+    "northwest": "nw",
+    "se": "se",
+    "southeast": "se",
+    "sw": "sw",
+    "southwest": "sw",
+}
+UNITS = {
+    "apt": "apt",
+    "apartment": "apt",
+    "unit": "unit",
+    "suite": "suite",
+    "ste": "suite",
+    "fl": "floor",
+    "floor": "floor",
+    "bldg": "building",
+    "building": "building",
+    "rm": "room",
+    "room": "room",
+}
+STREET_TYPES = {
+    "st": "st",
+    "street": "st",
+    "av": "ave",
+    "ave": "ave",
+    "avenue": "ave",
+    "rd": "rd",
+    "road": "rd",
+    "blvd": "blvd",
+    "boulevard": "blvd",
+    "dr": "dr",
+    "drive": "dr",
+    "ln": "ln",
+    "lane": "ln",
+    "ct": "ct",
+    "court": "ct",
+    "pl": "pl",
+    "place": "pl",
+    "sq": "sq",
+    "square": "sq",
+    "ter": "ter",
+    "terrace": "ter",
+    "cir": "cir",
+    "circle": "cir",
+    "pkwy": "pkwy",
+    "parkway": "pkwy",
+    "hwy": "hwy",
+    "highway": "hwy",
+    "way": "way",
+}
+DISTINGUISHING_TOKENS = {**DIRECTIONALS, **UNITS, **STREET_TYPES}
+
+
+def trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def distinguishing_tokens(address: str) -> List[str]:
+    """
+    The numbers, directionals, unit designators and street types of an
+    address, in order and with one spelling each.
+    """
+    tokens = []
+    for token in TOKEN_PATTERN.findall(address.casefold()):
+        if any(char.isdigit() for char in token):
+            tokens.append(token)
+        elif token in DISTINGUISHING_TOKENS:
+            tokens.append(DISTINGUISHING_TOKENS[token])
+    return tokens
+
+
+def similarity(a: str, b: str, minimum: float = 0.0) -> float:
+    """
+    Levenshtein similarity in [0, 1], i.e. 1 - distance / longest length.
+
+    Rows are abandoned as soon as the similarity can no longer reach
+    ``minimum``, which returns 0.0.
+    """
+    longest = max(len(a), len(b))
+    if longest == 0:
+        return 1.0
+    budget = int((1 - minimum) * longest)
+    if abs(len(a) - len(b)) > budget:
+        return 0.0
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_a != char_b),
+                )
+            )
+        if min(current) > budget:
+            return 0.0
+        previous = current
+    return 1 - previous[-1] / longest
+
+
+class FuzzyAddressIndex:
+    """
+    Bounded approximate-match index over previously geocoded addresses.
+
+    Candidates are found through a character trigram inverted index and then
+    verified by edit distance. House numbers, postcodes, directionals, unit
+    designators and street types must match exactly, so "10 Main Street" is
+    never reused for "12 Main Street", "10 Main Road" or "10 N Main Street".
+    The index keeps at most ``max_entries`` addresses and evicts the least
+    recently used.
+    """
+
+    def __init__(
+        self, threshold: float = 0.9, max_entries: int = 50000, max_candidates: int = 20
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.max_candidates = max_candidates
+        self._entries: "OrderedDict[str, GeoLocation]" = OrderedDict()
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def insert(self, address: str, location: GeoLocation) -> None:
+        if address in self._entries:
+            self._entries.move_to_end(address)
+            self._entries[address] = location
+            return
+
+        self._entries[address] = location
+        for gram in trigrams(address):
+            self._postings[gram].add(address)
+
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            for gram in trigrams(evicted):
+                postings = self._postings[gram]
+                postings.discard(evicted)
+                if not postings:
+                    del self._postings[gram]
+
+    def lookup(self, address: str) -> Optional[GeoLocation]:
+        if address in self._entries:
+            self._entries.move_to_end(address)
+            return self._entries[address]
+
+        grams = trigrams(address)
+        shared: Dict[str, int] = defaultdict(int)
+        for gram in grams:
+            for candidate in self._postings.get(gram, ()):
+                shared[candidate] += 1
+        if not shared:
+            return None
+
+        tokens = distinguishing_tokens(address)
+        best, best_score = None, self.threshold
+        ranked = sorted(shared, key=shared.get, reverse=True)
+        for candidate in ranked[: self.max_candidates]:
+            if distinguishing_tokens(candidate) != tokens:
+                continue
+            score = similarity(address, candidate, best_score)
+            if score >= best_score:
+                best, best_score = candidate, score
+
+        if best is None:
+            return None
+        self._entries.move_to_end(best)
+        return self._entries[best]
+
+
+class FuzzyMatchGeocodingClient(GeocodingClient):
+    """Geocoding client that reuses the location of a near-duplicate address."""
+
+    def __init__(self, client: GeocodingClient, index: FuzzyAddressIndex):
+        self.client = client
+        self.index = index
+        self.hits = 0
+        self.misses = 0
+
+    async def geocode(self, address: str) -> GeoLocation:
+        key = cache_key(address)
+        location = self.index.lookup(key)
+        if location is not None:
+            self.hits += 1
+            return location
+
+        self.misses += 1
+        location = await self.client.geocode(address)
+        self.index.insert(key, location)
+        return location
+
+    def stats(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.index)}
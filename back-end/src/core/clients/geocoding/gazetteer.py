@@ -0,0 +1,174 @@
+import csv
+import re
+from array import array
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List
+from src.core.clients.geocoding.base import GeocodingClient
+from src.core.clients.geocoding.exceptions import (
+    AddressNotFoundError,
+    GeocodingError,
+)
+from src.distance.schemas import GeoLocation
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.casefold())
+
+
+def is_abbreviation(token: str) -> bool:
+    """Whether a token is a region or country code like "ny" or "uk"."""
+    return len(token) <= 2 and token.isalpha()
+
+
+class GazetteerIndex:
+    """
+    Compact in-memory index over a gazetteer of named places.
+
+    Coordinates, importance and name-token counts live in typed arrays indexed
+    by row number. Two inverted indexes map tokens to row numbers: one over the
+    place name, used to find candidates, and one over the full display name,
+    used to rank them.
+    """
+
+    def __init__(self):
+        self.latitudes = array("d")
+        self.longitudes = array("d")
+        self.importance = array("f")
+        self.name_token_counts = array("H")
+        self.display_names: List[str] = []
+        self.name_postings: Dict[str, array] = {}
+        self.display_postings: Dict[str, array] = {}
+
+    def __len__(self) -> int:
+        return len(self.display_names)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, str]]) -> "GazetteerIndex":
+        """
+        Build the index from rows with ``name``, ``lat`` and ``lon`` columns
+        and optional ``display_name`` and ``importance`` columns.
+        """
+        index = cls()
+        name_postings = defaultdict(lambda: array("I"))
+        display_postings = defaultdict(lambda: array("I"))
+
+        for row_id, row in enumerate(rows):
+            name = row["name"]
+            display_name = row.get("display_name") or name
+            name_tokens = set(tokenize(name))
+
+            index.latitudes.append(float(row["lat"]))
+            index.longitudes.append(float(row["lon"]))
+            index.importance.append(float(row.get("importance") or 0.0))
+            index.name_token_counts.append(len(name_tokens))
+            index.display_names.append(display_name)
+
+            for token in name_tokens:
+                name_postings[token].append(row_id)
+            for token in set(tokenize(display_name)) | name_tokens:
+                display_postings[token].append(row_id)
+
+        index.name_postings = dict(name_postings)
+        index.display_postings = dict(display_postings)
+        return index
+
+    @classmethod
+    def from_csv(cls, path: str) -> "GazetteerIndex":
+        with open(path, newline="", encoding="utf-8") as file:
+            return cls.from_rows(csv.DictReader(file))
+
+    def search(self, address: str) -> int:
+        """
+        Return the row id of the best match, or -1.
+
+        A row is a candidate only if every token of its name appears in the
+        address, and its display name covers every address token except short
+        abbreviations such as state codes. Anything more specific than a
+        place, like a house number or a street, is left to the next tier.
+        Candidates are ranked by how many address tokens their display name
+        covers, then by importance.
+        """
+        tokens = set(tokenize(address))
+        required = {token for token in tokens if not is_abbreviation(token)}
+
+        matched: Dict[int, int] = defaultdict(int)
+        for token in tokens:
+            for row_id in self.name_postings.get(token, ()):
+                matched[row_id] += 1
+        candidates = [
+            row_id
+            for row_id, count in matched.items()
+            if count == self.name_token_counts[row_id]
+        ]
+        if not candidates:
+            return -1
+
+        coverage: Dict[int, int] = defaultdict(int)
+        required_coverage: Dict[int, int] = defaultdict(int)
+        candidate_set = set(candidates)
+        for token in tokens:
+            for row_id in self.display_postings.get(token, ()):
+                if row_id in candidate_set:
+                    coverage[row_id] += 1
+                    if token in required:
+                        required_coverage[row_id] += 1
+        candidates = [
+            row_id
+            for row_id in candidates
+            if required_coverage[row_id] == len(required)
+        ]
+        if not candidates:
+            return -1
+
+        return max(
+            candidates, key=lambda row_id: (coverage[row_id], self.importance[row_id])
+        )
+
+    def location(self, row_id: int) -> GeoLocation:
+        return GeoLocation(
+            latitude=self.latitudes[row_id],
+            longitude=self.longitudes[row_id],
+            address=self.display_names[row_id],
+        )
+
+
+class GazetteerClient(GeocodingClient):
+    """Geocoding client that answers from a local gazetteer without network calls."""
+
+    def __init__(self, index: GazetteerIndex):
+        self.index = index
+
+    async def geocode(self, address: str) -> GeoLocation:
+        row_id = self.index.search(address)
+        if row_id < 0:
+            raise AddressNotFoundError(
+                f"No results found for address: {address}. The local gazetteer cannot code this address."
+            )
+        return self.index.location(row_id)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"places": len(self.index), "tokens": len(self.index.display_postings)}
+
+
+class TieredGeocodingClient(GeocodingClient):
+    """Geocoding client that tries a local tier before the wrapped client."""
+
+    def __init__(self, local: GeocodingClient, client: GeocodingClient):
+        self.local = local
+        self.client = client
+        self.local_hits = 0
+        self.local_misses = 0
+
+    async def geocode(self, address: str) -> GeoLocation:
+        try:
+            location = await self.local.geocode(address)
+        except GeocodingError:
+            self.local_misses += 1
+            return await self.client.geocode(address)
+        self.local_hits += 1
+        return location
+
+    def stats(self) -> Dict[str, Any]:
+        return {"local_hits": self.local_hits, "local_misses": self.local_misses}
@@ -0,0 +1,137 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+from src.core.clients.geocoding.base import GeocodingClient
+from src.core.clients.geocoding.exceptions import AddressNotFoundError
+from src.distance.schemas import GeoLocation
+
+
+class LatencyTracker:
+    """Sliding window of successful call latencies for one provider."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.samples = deque(maxlen=window)
+        self.min_samples = min_samples
+        self.requests = 0
+        self.successes = 0
+        self.errors = 0
+        self.wins = 0
+
+    def record(self, latency: float) -> None:
+        self.samples.append(latency)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        if len(self.samples) < self.min_samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(percentile * len(ordered)))]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "successes": self.successes,
+            "errors": self.errors,
+            "wins": self.wins,
+            "p50_seconds": self.percentile(0.5),
+            "p95_seconds": self.percentile(0.95),
+        }
+
+
+class HedgedGeocodingClient(GeocodingClient):
+    """
+    Geocoding client that spreads one lookup over several providers.
+
+    Providers are tried in order. When the current attempt has not answered
+    within the configured latency percentile of the previous provider, the
+    next provider is started in parallel; when an attempt fails, the next
+    provider is started immediately. The first successful answer wins and
+    the remaining attempts are cancelled. AddressNotFoundError is an answer
+    too, not a failure: it is raised at once without trying other providers.
+    If every provider fails, the last error is raised.
+    """
+
+    def __init__(
+        self,
+        providers: List[Tuple[str, GeocodingClient]],
+        hedge_percentile: float = 0.95,
+        initial_hedge_delay: float = 1.0,
+        min_hedge_delay: float = 0.05,
+    ):
+        self.providers = providers
+        self.hedge_percentile = hedge_percentile
+        self.initial_hedge_delay = initial_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.trackers = {name: LatencyTracker() for name, _ in providers}
+        self.hedges = 0
+        self.failovers = 0
+
+    def hedge_delay(self, name: str) -> float:
+        delay = self.trackers[name].percentile(self.hedge_percentile)
+        if delay is None:
+            return self.initial_hedge_delay
+        return max(self.min_hedge_delay, delay)
+
+    async def _attempt(self, name: str, client: GeocodingClient, address: str):
+        tracker = self.trackers[name]
+        tracker.requests += 1
+        start = time.monotonic()
+        try:
+            location = await client.geocode(address)
+        except (asyncio.CancelledError, AddressNotFoundError):
+            raise
+        except Exception:
+            tracker.errors += 1
+            raise
+        tracker.successes += 1
+        tracker.record(time.monotonic() - start)
+        return location
+
+    async def geocode(self, address: str) -> GeoLocation:
+        attempts: Dict[asyncio.Task, str] = {}
+        remaining = list(self.providers)
+        last_error: Optional[Exception] = None
+
+        def launch() -> str:
+            name, client = remaining.pop(0)
+            task = asyncio.create_task(self._attempt(name, client, address))
+            attempts[task] = name
+            return name
+
+        current = launch()
+        try:
+            while attempts:
+                timeout = self.hedge_delay(current) if remaining else None
+                done, _ = await asyncio.wait(
+                    attempts, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    self.hedges += 1
+                    current = launch()
+                    continue
+
+                for task in done:
+                    name = attempts.pop(task)
+                    if task.exception() is None:
+                        self.trackers[name].wins += 1
+                        return task.result()
+                    if isinstance(task.exception(), AddressNotFoundError):
+                        raise task.exception()
+                    last_error = task.exception()
+
+                if remaining:
+                    self.failovers += 1
+                    current = launch()
+        finally:
+            for task in attempts:
+                task.cancel()
+
+        raise last_error
+
+    def stats(self) -> Dict[str, Any]:
+        providers = {}
+        for name, client in self.providers:
+            providers[name] = self.trackers[name].stats()
+            if hasattr(client, "stats"):
+                providers[name]["client"] = client.stats()
+        return {"hedges": self.hedges, "failovers": self.failovers, "providers": providers}
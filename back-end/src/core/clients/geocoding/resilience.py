@@ -0,0 +1,157 @@
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any, Dict
+from src.core.clients.geocoding.base import GeocodingClient
+from src.core.clients.geocoding.exceptions import (
+    AddressNotFoundError,
+    CircuitOpenError,
+    RetryableGeocodingError,
+    SchedulerRejectedError,
+)
+from src.distance.schemas import GeoLocation
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker driven by the error rate over a sliding window of calls.
+
+    The breaker opens when at least ``min_calls`` outcomes are recorded and the
+    share of failures (errors and timeouts) reaches ``error_rate``. While open,
+    calls fail immediately. After ``reset_timeout`` seconds one trial call is
+    let through in the half-open state: success closes the breaker, failure
+    opens it again.
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_calls: int = 5,
+        error_rate: float = 0.5,
+        reset_timeout: float = 30.0,
+    ):
+        self.outcomes = deque(maxlen=window)
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+        self.times_opened = 0
+
+    def before_call(self) -> None:
+        if self.state == OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                raise CircuitOpenError("Geocoding service is unavailable")
+            self.state = HALF_OPEN
+            self.trial_in_flight = False
+
+        if self.state == HALF_OPEN:
+            if self.trial_in_flight:
+                raise CircuitOpenError("Geocoding service is unavailable")
+            self.trial_in_flight = True
+
+    def release(self) -> None:
+        """Forget a call that ended without reaching the provider."""
+        self.trial_in_flight = False
+
+    def record_success(self) -> None:
+        if self.state == HALF_OPEN:
+            self.state = CLOSED
+            self.outcomes.clear()
+        self.trial_in_flight = False
+        self.outcomes.append(True)
+
+    def record_failure(self) -> None:
+        self.trial_in_flight = False
+        self.outcomes.append(False)
+        if self.state == HALF_OPEN or self._error_rate_exceeded():
+            self._open()
+
+    def _error_rate_exceeded(self) -> bool:
+        if len(self.outcomes) < self.min_calls:
+            return False
+        failures = self.outcomes.count(False)
+        return failures / len(self.outcomes) >= self.error_rate
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.times_opened += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "recent_failures": self.outcomes.count(False),
+            "recent_calls": len(self.outcomes),
+            "times_opened": self.times_opened,
+        }
+
+
+class ResilientGeocodingClient(GeocodingClient):
+    """
+    Geocoding client that retries transient failures behind a circuit breaker.
+
+    Retryable errors (429/503 responses, timeouts and connection errors) are
+    retried with full-jitter exponential backoff, or after the provider's
+    Retry-After delay when one is given. A delay longer than ``max_delay`` is
+    not waited out; the error is raised instead. An unresolvable address is
+    a valid answer from the provider, and scheduler rejections never reach it,
+    so neither counts against the breaker.
+    """
+
+    def __init__(
+        self,
+        client: GeocodingClient,
+        breaker: CircuitBreaker,
+        retries: int = 2,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+    ):
+        self.client = client
+        self.breaker = breaker
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retried = 0
+
+    def backoff(self, attempt: int, error: RetryableGeocodingError) -> float:
+        if error.retry_after is not None:
+            return error.retry_after
+        return random.uniform(0, self.base_delay * 2**attempt)
+
+    async def geocode(self, address: str) -> GeoLocation:
+        attempt = 0
+        while True:
+            self.breaker.before_call()
+            try:
+                location = await self.client.geocode(address)
+            except AddressNotFoundError:
+                self.breaker.record_success()
+                raise
+            except (SchedulerRejectedError, asyncio.CancelledError):
+                self.breaker.release()
+                raise
+            except RetryableGeocodingError as error:
+                self.breaker.record_failure()
+                delay = self.backoff(attempt, error)
+                if attempt >= self.retries or delay > self.max_delay:
+                    raise
+                attempt += 1
+                self.retried += 1
+                await asyncio.sleep(delay)
+                continue
+            except Exception:
+                self.breaker.record_failure()
+                raise
+
+            self.breaker.record_success()
+            return location
+
+    def stats(self) -> Dict[str, Any]:
+        return {"retried": self.retried, "breaker": self.breaker.stats()}
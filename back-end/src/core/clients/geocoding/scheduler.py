@@ -0,0 +1,189 @@
+import asyncio
+import heapq
+import itertools
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Dict, List, Optional
+from src.core.clients.geocoding.base import GeocodingClient
+from src.core.clients.geocoding.exceptions import SchedulerRejectedError
+from src.distance.schemas import GeoLocation
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+# Priority of the geocode calls made by the current request or job.
+geocode_priority: ContextVar[Priority] = ContextVar(
+    "geocode_priority", default=Priority.INTERACTIVE
+)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``rate`` tokens per second."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_take(self) -> bool:
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def delay(self) -> float:
+        """Seconds until the next token is available."""
+        self._refill()
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    sequence: int
+    deadline: float = field(compare=False)
+    enqueued: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class RateScheduler:
+    """
+    Paces outbound calls to one upstream with a token bucket.
+
+    Callers that cannot take a token immediately wait in a bounded priority
+    queue. Callers whose deadline would pass before their turn are rejected
+    up front instead of waiting only to time out. The queue bound counts live
+    waiters only; a caller that is cancelled or times out stops counting at
+    once, although its entry stays in the heap until the dispatcher pops it.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, max_queue: int = 100):
+        self.bucket = TokenBucket(rate, burst)
+        self.max_queue = max_queue
+        self._queue: List[_Waiter] = []
+        self._waiting = 0
+        self._sequence = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self.granted = 0
+        self.rejected_queue_full = 0
+        self.rejected_deadline = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _ahead_of(self, priority: Priority) -> int:
+        return sum(
+            1
+            for waiter in self._queue
+            if waiter.priority <= priority and not waiter.future.done()
+        )
+
+    def _grant(self, waited: float) -> None:
+        self.granted += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    async def acquire(self, priority: Priority, deadline: float) -> None:
+        """Wait for a token, or raise SchedulerRejectedError."""
+        if not self._waiting and self.bucket.try_take():
+            self._grant(0.0)
+            return
+
+        if self._waiting >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise SchedulerRejectedError("Geocoding queue is full")
+
+        now = time.monotonic()
+        estimate = self.bucket.delay() + self._ahead_of(priority) / self.bucket.rate
+        if now + estimate > deadline:
+            self.rejected_deadline += 1
+            raise SchedulerRejectedError(
+                "Geocoding request would exceed its deadline while queued"
+            )
+
+        waiter = _Waiter(
+            priority=priority,
+            sequence=next(self._sequence),
+            deadline=deadline,
+            enqueued=now,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(self._queue, waiter)
+        self._waiting += 1
+        waiter.future.add_done_callback(self._finished)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        await waiter.future
+
+    def _finished(self, future: asyncio.Future) -> None:
+        self._waiting -= 1
+
+    async def _dispatch(self) -> None:
+        while self._queue:
+            delay = self.bucket.delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            waiter = heapq.heappop(self._queue)
+            if waiter.future.done():
+                continue
+
+            now = time.monotonic()
+            if now > waiter.deadline:
+                self.rejected_deadline += 1
+                waiter.future.set_exception(
+                    SchedulerRejectedError("Geocoding request expired while queued")
+                )
+                continue
+
+            self.bucket.try_take()
+            self._grant(now - waiter.enqueued)
+            waiter.future.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self._waiting,
+            "granted": self.granted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_deadline": self.rejected_deadline,
+            "average_wait_seconds": self.total_wait / self.granted
+            if self.granted
+            else 0.0,
+            "max_wait_seconds": self.max_wait,
+        }
+
+
+class ScheduledGeocodingClient(GeocodingClient):
+    """Geocoding client whose upstream calls are paced by a RateScheduler."""
+
+    def __init__(
+        self,
+        client: GeocodingClient,
+        scheduler: RateScheduler,
+        max_wait: Dict[Priority, float],
+    ):
+        self.client = client
+        self.scheduler = scheduler
+        self.max_wait = max_wait
+
+    async def geocode(self, address: str) -> GeoLocation:
+        priority = geocode_priority.get()
+        deadline = time.monotonic() + self.max_wait[priority]
+        await self.scheduler.acquire(priority, deadline)
+        return await self.client.geocode(address)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.scheduler.stats()
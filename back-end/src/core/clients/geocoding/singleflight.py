@@ -0,0 +1,73 @@
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+from src.core.clients.geocoding.base import GeocodingClient
+from src.core.clients.geocoding.cached import cache_key
+from src.core.clients.geocoding.exceptions import SchedulerRejectedError
+from src.core.clients.geocoding.scheduler import Priority, geocode_priority
+from src.distance.schemas import GeoLocation
+
+
+class SingleFlightGeocodingClient(GeocodingClient):
+    """
+    Geocoding client that coalesces concurrent lookups of the same address.
+
+    The first caller starts the upstream lookup as a task; callers arriving
+    while it is in flight await the same task and receive its result or
+    exception. Cancelling one caller never cancels the shared lookup.
+
+    Lookups are only shared between callers of the same geocode priority, so
+    an interactive request never waits behind a batch lookup queued at batch
+    priority. With ``max_wait``, a caller joining a lookup waits at most
+    ``max_wait[priority]`` seconds for it before giving up with
+    SchedulerRejectedError.
+    """
+
+    def __init__(
+        self,
+        client: GeocodingClient,
+        max_wait: Optional[Dict[Priority, float]] = None,
+    ):
+        self.client = client
+        self.max_wait = max_wait or {}
+        self._inflight: Dict[Tuple[str, Priority], asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+        self.expired = 0
+
+    async def geocode(self, address: str) -> GeoLocation:
+        priority = geocode_priority.get()
+        key = (cache_key(address), priority)
+        self.calls += 1
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self.client.geocode(address))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+            return await asyncio.shield(task)
+
+        self.coalesced += 1
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(task), self.max_wait.get(priority)
+            )
+        except asyncio.TimeoutError:
+            self.expired += 1
+            raise SchedulerRejectedError(
+                "Geocoding request exceeded its deadline while coalesced"
+            )
+
+    def _finish(self, key: Tuple[str, Priority], task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved in case every waiter was cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "expired": self.expired,
+            "in_flight": len(self._inflight),
+        }
@@ -1,9 +1,270 @@
+from typing import Callable, Optional
+import httpx
+from motor.motor_asyncio import AsyncIOMotorClient
+from src.config import get_settings, logger
 from src.core.clients.cache.cache import TTLCacheClient
+from src.core.clients.cache.sqlite import SQLiteCacheClient
+from src.core.clients.database.base import DatabaseClient
+from src.core.clients.database.buffered import BufferedDatabaseClient
+from src.core.clients.database.indexes import INDEXES
+from src.core.clients.database.mongodb import MongoDBClient, create_motor_client
+from src.core.clients.database.pairs import PairDatabaseClient
+from src.core.clients.database.pool import PoolStatsListener
+from src.core.clients.database.sqlite import SQLiteDatabase, SQLiteDatabaseClient
+from src.core.clients.geocoding.base import GeocodingClient
+from src.core.clients.geocoding.cached import CachedGeocodingClient
+from src.core.clients.geocoding.fuzzy import (
+    FuzzyAddressIndex,
+    FuzzyMatchGeocodingClient,
+)
+from src.core.clients.geocoding.gazetteer import (
+    GazetteerClient,
+    GazetteerIndex,
+    TieredGeocodingClient,
+)
+from src.core.clients.geocoding.hedged import HedgedGeocodingClient
+from src.core.clients.geocoding.client import NominatimClient, create_http_client
+from src.core.clients.geocoding.resilience import (
+    CircuitBreaker,
+    ResilientGeocodingClient,
+)
+from src.core.clients.geocoding.scheduler import (
+    Priority,
+    RateScheduler,
+    ScheduledGeocodingClient,
+)
+from src.core.clients.geocoding.singleflight import SingleFlightGeocodingClient
+
+settings = get_settings()
 
 # Create a singleton instance
 _cache_client = TTLCacheClient(maxsize=1000, ttl=3600)
+_geocode_cache: Optional[SQLiteCacheClient] = None
+_http_client: Optional[httpx.AsyncClient] = None
+_mongo_client: Optional[AsyncIOMotorClient] = None
+_mongo_pool_stats = PoolStatsListener()
+_sqlite_database: Optional[SQLiteDatabase] = None
+_history_database: Optional[DatabaseClient] = None
+_geocoding_client: Optional[GeocodingClient] = None
 
 
 def get_cache_client() -> TTLCacheClient:
     """Get the cache client instance."""
     return _cache_client
+
+
+def get_geocode_cache() -> SQLiteCacheClient:
+    """Get the on-disk geocode cache shared by all workers."""
+    global _geocode_cache
+    if _geocode_cache is None:
+        _geocode_cache = SQLiteCacheClient(
+            settings.GEOCODE_CACHE_PATH,
+            maxsize=settings.GEOCODE_CACHE_MAXSIZE,
+            ttl=settings.GEOCODE_CACHE_TTL,
+        )
+    return _geocode_cache
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the pooled HTTP client, creating it outside the lifespan if needed."""
+    global _http_client
+    if _http_client is None:
+        _http_client = create_http_client()
+    return _http_client
+
+
+def get_mongo_client() -> AsyncIOMotorClient:
+    """Get the pooled Motor client, creating it outside the lifespan if needed."""
+    global _mongo_client
+    if _mongo_client is None:
+        _mongo_client = create_motor_client(event_listeners=[_mongo_pool_stats])
+    return _mongo_client
+
+
+def get_mongo_pool_stats() -> PoolStatsListener:
+    """Get the listener tracking the Motor client's connection pools."""
+    return _mongo_pool_stats
+
+
+def get_sqlite_database() -> SQLiteDatabase:
+    """Get the embedded SQLite database used when DATABASE_BACKEND is sqlite."""
+    global _sqlite_database
+    if _sqlite_database is None:
+        _sqlite_database = SQLiteDatabase(settings.SQLITE_DATABASE_PATH)
+    return _sqlite_database
+
+
+def create_database_client(collection: str = "queries") -> DatabaseClient:
+    """Create a client for a collection on the configured database backend."""
+    if settings.DATABASE_BACKEND == "mongodb":
+        return MongoDBClient(get_mongo_client(), collection)
+    if settings.DATABASE_BACKEND == "sqlite":
+        return SQLiteDatabaseClient(get_sqlite_database(), collection)
+
+    raise ValueError(f"Unknown database backend: {settings.DATABASE_BACKEND}")
+
+
+def get_history_database() -> DatabaseClient:
+    """
+    Get the database client for the query history: one record per query, or
+    per address pair when HISTORY_STORAGE is pairs. Writes are buffered
+    behind the response when HISTORY_WRITE_BEHIND is enabled.
+    """
+    global _history_database
+    if _history_database is None:
+        if settings.HISTORY_STORAGE == "pairs":
+            _history_database = PairDatabaseClient(
+                create_database_client("query_pairs"),
+                recent_limit=settings.HISTORY_RECENT_LIMIT,
+            )
+        else:
+            _history_database = create_database_client("queries")
+        if settings.HISTORY_WRITE_BEHIND:
+            _history_database = BufferedDatabaseClient(
+                _history_database,
+                flush_size=settings.HISTORY_FLUSH_SIZE,
+                flush_interval=settings.HISTORY_FLUSH_INTERVAL,
+                max_pending=settings.HISTORY_MAX_PENDING,
+            )
+    return _history_database
+
+
+def create_scheduled_client(base_url: str) -> GeocodingClient:
+    """
+    Create a Nominatim client paced by its own rate scheduler, with retries
+    and a circuit breaker for that upstream.
+    """
+    scheduler = RateScheduler(
+        rate=settings.NOMINATIM_RATE_LIMIT,
+        burst=settings.NOMINATIM_RATE_BURST,
+        max_queue=settings.GEOCODE_QUEUE_SIZE,
+    )
+    scheduled = ScheduledGeocodingClient(
+        NominatimClient(get_http_client(), base_url=base_url),
+        scheduler,
+        max_wait={
+            Priority.INTERACTIVE: settings.GEOCODE_INTERACTIVE_MAX_WAIT,
+            Priority.BATCH: settings.GEOCODE_BATCH_MAX_WAIT,
+        },
+    )
+    breaker = CircuitBreaker(
+        window=settings.GEOCODE_BREAKER_WINDOW,
+        min_calls=settings.GEOCODE_BREAKER_MIN_CALLS,
+        error_rate=settings.GEOCODE_BREAKER_ERROR_RATE,
+        reset_timeout=settings.GEOCODE_BREAKER_RESET_TIMEOUT,
+    )
+    return ResilientGeocodingClient(
+        scheduled,
+        breaker,
+        retries=settings.GEOCODE_RETRIES,
+        base_delay=settings.GEOCODE_RETRY_BASE_DELAY,
+        max_delay=settings.GEOCODE_RETRY_MAX_DELAY,
+    )
+
+
+def create_upstream_client() -> GeocodingClient:
+    """Create the Nominatim upstream, hedged across mirrors when configured."""
+    primary = create_scheduled_client(settings.NOMINATIM_BASE_URL)
+    if not settings.NOMINATIM_MIRROR_URLS:
+        return primary
+
+    providers = [(settings.NOMINATIM_BASE_URL, primary)]
+    for url in settings.NOMINATIM_MIRROR_URLS:
+        providers.append((url, create_scheduled_client(url)))
+    return HedgedGeocodingClient(
+        providers,
+        hedge_percentile=settings.GEOCODE_HEDGE_PERCENTILE,
+        initial_hedge_delay=settings.GEOCODE_HEDGE_INITIAL_DELAY,
+        min_hedge_delay=settings.GEOCODE_HEDGE_MIN_DELAY,
+    )
+
+
+def get_geocoding_client() -> GeocodingClient:
+    """Get the process-wide geocoding client."""
+    global _geocoding_client
+    if _geocoding_client is None:
+        _geocoding_client = create_geocoding_client(settings.GEOCODER_BACKEND)
+    return _geocoding_client
+
+
+def create_geocoding_client(backend: str) -> GeocodingClient:
+    """Build the geocoding client stack for the configured backend."""
+    if backend == "gazetteer":
+        return GazetteerClient(GazetteerIndex.from_csv(settings.GAZETTEER_PATH))
+
+    # The fuzzy layer sits inside the exact cache, so a cached entry for the
+    # address itself always wins over a near-duplicate's location.
+    upstream = create_upstream_client()
+    if settings.GEOCODE_FUZZY_ENABLED:
+        upstream = FuzzyMatchGeocodingClient(
+            upstream,
+            FuzzyAddressIndex(
+                threshold=settings.GEOCODE_FUZZY_THRESHOLD,
+                max_entries=settings.GEOCODE_FUZZY_MAX_ENTRIES,
+            ),
+        )
+    remote = SingleFlightGeocodingClient(
+        CachedGeocodingClient(
+            upstream,
+            get_geocode_cache(),
+            negative_ttl=settings.GEOCODE_NEGATIVE_CACHE_TTL,
+        ),
+        max_wait={
+            Priority.INTERACTIVE: settings.GEOCODE_INTERACTIVE_MAX_WAIT,
+            Priority.BATCH: settings.GEOCODE_BATCH_MAX_WAIT,
+        },
+    )
+    if backend == "nominatim":
+        return remote
+    if backend == "tiered":
+        local = GazetteerClient(GazetteerIndex.from_csv(settings.GAZETTEER_PATH))
+        return TieredGeocodingClient(local, remote)
+
+    raise ValueError(f"Unknown geocoder backend: {backend}")
+
+
+async def ensure_indexes(
+    client_factory: Callable[[str], DatabaseClient] = create_database_client,
+) -> None:
+    """
+    Create the declared indexes through the clients ``client_factory`` makes
+    per collection. A database that is unreachable at startup is logged
+    rather than keeping the application from starting.
+    """
+    try:
+        for collection, specs in INDEXES.items():
+            await client_factory(collection).ensure_indexes(specs)
+    except Exception as e:
+        logger.error(f"Failed to ensure database indexes: {str(e)}")
+
+
+async def startup() -> None:
+    """Create the shared clients when the application starts."""
+    if settings.MONGODB_ENSURE_INDEXES:
+        await ensure_indexes()
+    history_database = get_history_database()
+    if isinstance(history_database, BufferedDatabaseClient):
+        history_database.start()
+    get_geocoding_client()
+
+
+async def shutdown() -> None:
+    """Close the shared clients when the application stops."""
+    global _http_client, _geocoding_client, _geocode_cache, _mongo_client
+    global _history_database, _sqlite_database
+    if _history_database is not None:
+        await _history_database.close()
+        _history_database = None
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    if _geocode_cache is not None:
+        _geocode_cache.close()
+        _geocode_cache = None
+    if _mongo_client is not None:
+        _mongo_client.close()
+        _mongo_client = None
+    if _sqlite_database is not None:
+        _sqlite_database.close()
+        _sqlite_database = None
+    _geocoding_client = None
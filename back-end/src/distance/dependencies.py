@@ -1,9 +1,35 @@
+from src.config import get_settings
+from src.distance.engine import DistanceMode
+from src.distance.executor import DistanceExecutor
 from src.distance.service import DistanceService
-from src.core.clients.geocoding.client import NominatimClient
-from src.core.clients.database.mongodb import MongoDBClient
+from src.core.dependencies import get_geocoding_client, get_history_database
+from src.analytics.dependencies import get_analytics_service
+
+settings = get_settings()
+
+_distance_executor = DistanceExecutor(
+    workers=settings.DISTANCE_POOL_WORKERS,
+    threshold=settings.DISTANCE_OFFLOAD_THRESHOLD,
+)
+
+
+def get_distance_executor() -> DistanceExecutor:
+    """Get the process pool executor for large distance computations."""
+    return _distance_executor
+
+
+def create_distance_service() -> DistanceService:
+    """Build a distance service on the shared geocoding client and executor."""
+    geocoding_client = get_geocoding_client()
+    database_client = get_history_database()
+    return DistanceService(
+        geocoding_client,
+        database_client,
+        DistanceMode(settings.DISTANCE_MODE),
+        executor=_distance_executor,
+        analytics=get_analytics_service() if settings.ANALYTICS_ENABLED else None,
+    )
 
 
 async def get_distance_service() -> DistanceService:
-    geocoding_client = NominatimClient()
-    database_client = MongoDBClient()
-    return DistanceService(geocoding_client, database_client)
+    return create_distance_service()
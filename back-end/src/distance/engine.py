@@ -0,0 +1,85 @@
+from enum import Enum
+from typing import Sequence, Tuple
+import numpy as np
+from geopy.distance import geodesic
+from geopy.units import miles as to_miles
+from src.distance.kernels import haversine, vincenty
+
+MILES_PER_KM = to_miles(kilometers=1)
+
+Point = Tuple[float, float]
+
+
+class DistanceMode(str, Enum):
+    """
+    Accuracy modes of the distance engine.
+
+    HAVERSINE is a spherical approximation, within about 0.5% of the
+    ellipsoidal distance and the cheapest to compute. VINCENTY is ellipsoidal
+    (WGS-84) and vectorized, accurate to well under a millimeter. GEOPY runs
+    geopy's Karney geodesic per pair and is kept as the exact reference.
+    """
+
+    HAVERSINE = "haversine"
+    VINCENTY = "vincenty"
+    GEOPY = "geopy"
+
+
+def _geopy(lat1, lon1, lat2, lon2) -> np.ndarray:
+    lat1, lon1, lat2, lon2 = np.broadcast_arrays(lat1, lon1, lat2, lon2)
+    distances = np.full(lat1.shape, np.nan)
+    for index in np.ndindex(lat1.shape):
+        points = (lat1[index], lon1[index]), (lat2[index], lon2[index])
+        if not np.isnan(points).any():
+            distances[index] = geodesic(*points).kilometers
+    return distances
+
+
+def _vincenty(lat1, lon1, lat2, lon2) -> np.ndarray:
+    distances = vincenty(lat1, lon1, lat2, lon2)
+    # Vincenty does not converge for nearly antipodal points; use geopy there.
+    missing = np.isnan(distances)
+    if missing.any():
+        lat1, lon1, lat2, lon2 = np.broadcast_arrays(lat1, lon1, lat2, lon2)
+        distances[missing] = _geopy(
+            lat1[missing], lon1[missing], lat2[missing], lon2[missing]
+        )
+    return distances
+
+
+KERNELS = {
+    DistanceMode.HAVERSINE: haversine,
+    DistanceMode.VINCENTY: _vincenty,
+    DistanceMode.GEOPY: _geopy,
+}
+
+
+def distance(point1: Point, point2: Point, mode: DistanceMode) -> float:
+    """Distance in kilometers between two (latitude, longitude) points."""
+    if mode == DistanceMode.GEOPY:
+        return geodesic(point1, point2).kilometers
+    return float(KERNELS[mode](point1[0], point1[1], point2[0], point2[1]))
+
+
+def pairwise(
+    points1: Sequence[Point], points2: Sequence[Point], mode: DistanceMode
+) -> np.ndarray:
+    """Distances in kilometers between points1[i] and points2[i]."""
+    points1 = np.asarray(points1, dtype=np.float64).reshape(-1, 2)
+    points2 = np.asarray(points2, dtype=np.float64).reshape(-1, 2)
+    return KERNELS[mode](points1[:, 0], points1[:, 1], points2[:, 0], points2[:, 1])
+
+
+def matrix(
+    origins: Sequence[Point], destinations: Sequence[Point], mode: DistanceMode
+) -> np.ndarray:
+    """Distances in kilometers from every origin (rows) to every destination."""
+    origins = np.asarray(origins, dtype=np.float64).reshape(-1, 2)
+    destinations = np.asarray(destinations, dtype=np.float64).reshape(-1, 2)
+    return KERNELS[mode](
+        origins[:, 0][:, np.newaxis],
+        origins[:, 1][:, np.newaxis],
+        destinations[:, 0][np.newaxis, :],
+        destinations[:, 1][np.newaxis, :],
+    )
+
@@ -0,0 +1,153 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from src.distance import engine
+from src.distance.engine import DistanceMode
+
+# (shared memory name, shape) of an array placed in shared memory
+ArraySpec = Tuple[str, Tuple[int, ...]]
+
+
+def _warm() -> None:
+    """Import the engine and run it once so workers start hot."""
+    engine.matrix([(0.0, 0.0)], [(1.0, 1.0)], DistanceMode.VINCENTY)
+
+
+def _attach(spec: ArraySpec) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    name, shape = spec
+    memory = shared_memory.SharedMemory(name=name)
+    return memory, np.ndarray(shape, dtype=np.float64, buffer=memory.buf)
+
+
+def _matrix_rows(
+    origins: ArraySpec,
+    destinations: ArraySpec,
+    output: ArraySpec,
+    start: int,
+    stop: int,
+    mode: str,
+) -> None:
+    """Compute rows [start, stop) of a distance matrix into shared memory."""
+    memories = []
+    try:
+        arrays = []
+        for spec in (origins, destinations, output):
+            memory, array = _attach(spec)
+            memories.append(memory)
+            arrays.append(array)
+        origin_array, destination_array, output_array = arrays
+        output_array[start:stop] = engine.matrix(
+            origin_array[start:stop], destination_array, DistanceMode(mode)
+        )
+        del arrays, array, origin_array, destination_array, output_array
+    finally:
+        for memory in memories:
+            memory.close()
+
+
+class SharedArray:
+    """A float64 array backed by shared memory, unlinked on close."""
+
+    def __init__(self, shape: Tuple[int, ...], data: Optional[np.ndarray] = None):
+        size = max(1, int(np.prod(shape)) * 8)
+        self.memory = shared_memory.SharedMemory(create=True, size=size)
+        self.array = np.ndarray(shape, dtype=np.float64, buffer=self.memory.buf)
+        if data is not None:
+            self.array[:] = data
+
+    @property
+    def spec(self) -> ArraySpec:
+        return self.memory.name, self.array.shape
+
+    def close(self) -> None:
+        del self.array
+        self.memory.close()
+        self.memory.unlink()
+
+
+class DistanceExecutor:
+    """
+    Runs large distance computations in a pre-warmed process pool.
+
+    Matrices with fewer than ``threshold`` distances run inline. Larger
+    matrices are split into row blocks, one per worker. Coordinates and
+    results travel through shared memory, so only array names and row ranges
+    are pickled. The event loop stays free while the workers compute.
+    """
+
+    def __init__(self, workers: int = 2, threshold: int = 50000):
+        self.workers = workers
+        self.threshold = threshold
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.offloaded = 0
+        self.inline = 0
+
+    def start(self) -> None:
+        if self.workers <= 0 or self.pool is not None:
+            return
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        for _ in range(self.workers):
+            self.pool.submit(_warm)
+
+    def shutdown(self) -> None:
+        if self.pool is not None:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+            self.pool = None
+
+    async def matrix(
+        self, origins: np.ndarray, destinations: np.ndarray, mode: DistanceMode
+    ) -> np.ndarray:
+        """Distances in kilometers from every origin to every destination."""
+        origins = np.asarray(origins, dtype=np.float64).reshape(-1, 2)
+        destinations = np.asarray(destinations, dtype=np.float64).reshape(-1, 2)
+        rows, columns = len(origins), len(destinations)
+
+        if self.pool is None or rows * columns < self.threshold:
+            self.inline += 1
+            return engine.matrix(origins, destinations, mode)
+
+        self.offloaded += 1
+        shared: List[SharedArray] = []
+        try:
+            shared_origins = SharedArray(origins.shape, origins)
+            shared.append(shared_origins)
+            shared_destinations = SharedArray(destinations.shape, destinations)
+            shared.append(shared_destinations)
+            output = SharedArray((rows, columns))
+            shared.append(output)
+
+            loop = asyncio.get_running_loop()
+            block = -(-rows // self.workers)
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        self.pool,
+                        _matrix_rows,
+                        shared_origins.spec,
+                        shared_destinations.spec,
+                        output.spec,
+                        start,
+                        min(start + block, rows),
+                        mode.value,
+                    )
+                    for start in range(0, rows, block)
+                )
+            )
+            return output.array.copy()
+        finally:
+            for array in shared:
+                array.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers if self.pool is not None else 0,
+            "threshold": self.threshold,
+            "offloaded": self.offloaded,
+            "inline": self.inline,
+        }
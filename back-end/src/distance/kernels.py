@@ -0,0 +1,101 @@
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+
+# WGS-84 ellipsoid
+WGS84_A = 6378.137
+WGS84_F = 1 / 298.257223563
+WGS84_B = WGS84_A * (1 - WGS84_F)
+
+
+def haversine(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Great-circle distance in kilometers on a sphere of the mean Earth radius.
+
+    Arguments are latitudes and longitudes in degrees and may be any arrays
+    that broadcast together. NaN coordinates give NaN distances.
+    """
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def vincenty(lat1, lon1, lat2, lon2, iterations: int = 200, tolerance: float = 1e-12):
+    """
+    Ellipsoidal distance in kilometers on WGS-84 by Vincenty's inverse formula.
+
+    Arguments broadcast like ``haversine``. The iteration runs on whole arrays
+    and stops once every element has converged. Nearly antipodal points, for
+    which the formula does not converge, are returned as NaN so the caller can
+    fall back to an exact method.
+    """
+    lat1, lon1, lat2, lon2 = np.broadcast_arrays(
+        *map(np.radians, map(np.asarray, (lat1, lon1, lat2, lon2)))
+    )
+    f = WGS84_F
+    u1 = np.arctan((1 - f) * np.tan(lat1))
+    u2 = np.arctan((1 - f) * np.tan(lat2))
+    sin_u1, cos_u1 = np.sin(u1), np.cos(u1)
+    sin_u2, cos_u2 = np.sin(u2), np.cos(u2)
+    longitude = lon2 - lon1
+
+    lam = longitude.copy()
+    converged = np.zeros(lam.shape, dtype=bool)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for _ in range(iterations):
+            sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+            sin_sigma = np.hypot(
+                cos_u2 * sin_lam, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam
+            )
+            cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+            sin_alpha = np.where(
+                sin_sigma == 0, 0.0, cos_u1 * cos_u2 * sin_lam / sin_sigma
+            )
+            cos2_alpha = 1 - sin_alpha**2
+            cos_2sigma_m = np.where(
+                cos2_alpha == 0, 0.0, cos_sigma - 2 * sin_u1 * sin_u2 / cos2_alpha
+            )
+            c = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+            previous = lam
+            lam = longitude + (1 - c) * f * sin_alpha * (
+                sigma
+                + c
+                * sin_sigma
+                * (cos_2sigma_m + c * cos_sigma * (-1 + 2 * cos_2sigma_m**2))
+            )
+            converged = np.abs(lam - previous) < tolerance
+            if np.all(converged | np.isnan(lam)):
+                break
+
+        u_squared = cos2_alpha * (WGS84_A**2 - WGS84_B**2) / WGS84_B**2
+        a_coeff = 1 + u_squared / 16384 * (
+            4096 + u_squared * (-768 + u_squared * (320 - 175 * u_squared))
+        )
+        b_coeff = u_squared / 1024 * (
+            256 + u_squared * (-128 + u_squared * (74 - 47 * u_squared))
+        )
+        delta_sigma = (
+            b_coeff
+            * sin_sigma
+            * (
+                cos_2sigma_m
+                + b_coeff
+                / 4
+                * (
+                    cos_sigma * (-1 + 2 * cos_2sigma_m**2)
+                    - b_coeff
+                    / 6
+                    * cos_2sigma_m
+                    * (-3 + 4 * sin_sigma**2)
+                    * (-3 + 4 * cos_2sigma_m**2)
+                )
+            )
+        )
+        distance = WGS84_B * a_coeff * (sigma - delta_sigma)
+
+    return np.where(converged, distance, np.nan)
+
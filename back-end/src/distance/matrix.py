@@ -0,0 +1,62 @@
+import json
+from typing import Dict, List, Optional
+from src.distance.schemas import GeoLocation
+
+
+class DistanceMatrix:
+    """
+    An origin x destination distance matrix.
+
+    The matrix renders straight to the MatrixResponse JSON body, so its
+    flat distance list is never validated as a pydantic model.
+    """
+
+    __slots__ = ("units", "origins", "destinations", "distances", "errors")
+
+    def __init__(
+        self,
+        units: str,
+        origins: List[Optional[GeoLocation]],
+        destinations: List[Optional[GeoLocation]],
+        distances: List[Optional[float]],
+        errors: Dict[str, str],
+    ):
+        self.units = units
+        self.origins = origins
+        self.destinations = destinations
+        self.distances = distances
+        self.errors = errors
+
+    @property
+    def rows(self) -> int:
+        return len(self.origins)
+
+    @property
+    def columns(self) -> int:
+        return len(self.destinations)
+
+    def to_json(self) -> bytes:
+        def located(locations: List[Optional[GeoLocation]]):
+            return [
+                {
+                    "latitude": location.latitude,
+                    "longitude": location.longitude,
+                    "address": location.address,
+                }
+                if location is not None
+                else None
+                for location in locations
+            ]
+
+        return json.dumps(
+            {
+                "units": self.units,
+                "rows": self.rows,
+                "columns": self.columns,
+                "origins": located(self.origins),
+                "destinations": located(self.destinations),
+                "distances": self.distances,
+                "errors": self.errors,
+            },
+            separators=(",", ":"),
+        ).encode()
@@ -1,12 +1,27 @@
-from fastapi import APIRouter, Depends, status, Request
-from src.distance.schemas import AddressRequest, DistanceResponse
+import json
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Query, status, Request
+from src.distance.schemas import (
+    AddressRequest,
+    BatchDistanceRequest,
+    BatchDistanceResponse,
+    DistanceResponse,
+    MatrixRequest,
+    MatrixResponse,
+)
 from src.distance.service import DistanceService
+from src.distance.engine import DistanceMode
+from src.distance.streaming import UploadStreamingResponse, parse_pairs, read_lines
 from src.distance.dependencies import get_distance_service
 from src.core.security import limiter
 from src.core.exceptions import ValidationException, GeocodingException
 from src.core.dependencies import get_cache_client
+from src.core.canonical import canonicalize_address
 from src.core.clients.cache.cache import TTLCacheClient
-from fastapi.responses import JSONResponse
+from src.config import get_settings
+from fastapi.responses import JSONResponse, Response
+
+settings = get_settings()
 
 router = APIRouter(
     prefix="/distance",
@@ -29,18 +44,26 @@ router = APIRouter(
 async def calculate_distance(
     request: Request,
     address_request: AddressRequest,
+    mode: Optional[DistanceMode] = Query(None, description="Distance accuracy mode"),
     service: DistanceService = Depends(get_distance_service),
     cache: TTLCacheClient = Depends(get_cache_client),
 ) -> DistanceResponse:
     try:
         # Try to get from cache first
-        cache_key = f"{address_request.address1}:{address_request.address2}"
+        cache_key = (
+            f"{canonicalize_address(address_request.address1)}:"
+            f"{canonicalize_address(address_request.address2)}:"
+            f"{(mode or service.distance_mode).value}"
+        )
         cached_result = await cache.get(cache_key, "distance")
         if cached_result:
             return cached_result
 
         result = await service.calculate_distance(
-            address_request.address1, address_request.address2
+            address_request.address1,
+            address_request.address2,
+            mode=mode,
+            ip_address=request.client.host,
         )
 
         await cache.set(cache_key, result, "distance", ttl=3600)
@@ -56,3 +79,92 @@ async def calculate_distance(
             error = service.errors
             status = 400
         return JSONResponse(status_code=status, content={"errors": error})
+
+
+@router.post(
+    "/batch",
+    response_model=BatchDistanceResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Calculate distances for many address pairs",
+    description="Geocodes each unique address once and returns per-pair results and errors",
+)
+@limiter.limit("5/minute")
+async def calculate_batch(
+    request: Request,
+    batch_request: BatchDistanceRequest,
+    mode: Optional[DistanceMode] = Query(None, description="Distance accuracy mode"),
+    service: DistanceService = Depends(get_distance_service),
+    cache: TTLCacheClient = Depends(get_cache_client),
+) -> BatchDistanceResponse:
+    results = await service.calculate_batch(
+        [(pair.address1, pair.address2) for pair in batch_request.pairs],
+        concurrency=settings.BATCH_GEOCODE_CONCURRENCY,
+        mode=mode,
+        ip_address=request.client.host,
+    )
+    await cache.clear_namespace("history")
+
+    return BatchDistanceResponse(results=results)
+
+
+@router.post(
+    "/matrix",
+    response_model=MatrixResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Calculate an origin x destination distance matrix",
+    description="Geocodes each unique address once and returns a row-major distance matrix",
+)
+@limiter.limit("5/minute")
+async def calculate_matrix(
+    request: Request,
+    matrix_request: MatrixRequest,
+    mode: Optional[DistanceMode] = Query(None, description="Distance accuracy mode"),
+    service: DistanceService = Depends(get_distance_service),
+) -> Response:
+    matrix = await service.calculate_matrix(
+        matrix_request.origins,
+        matrix_request.destinations,
+        units=matrix_request.units,
+        concurrency=settings.BATCH_GEOCODE_CONCURRENCY,
+        mode=mode,
+    )
+    # The matrix is rendered directly, without going back through
+    # response_model.
+    return Response(content=matrix.to_json(), media_type="application/json")
+
+
+@router.post(
+    "/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Stream distances for an uploaded file of address pairs",
+    description="Accepts a streamed CSV (address1,address2) or NDJSON upload and "
+    "streams one NDJSON result per input line as results complete",
+    response_class=UploadStreamingResponse,
+)
+@limiter.limit("5/minute")
+async def stream_distances(
+    request: Request,
+    format: Optional[Literal["csv", "ndjson"]] = Query(
+        None, description="Upload format; inferred from Content-Type if omitted"
+    ),
+    mode: Optional[DistanceMode] = Query(None, description="Distance accuracy mode"),
+    service: DistanceService = Depends(get_distance_service),
+    cache: TTLCacheClient = Depends(get_cache_client),
+) -> UploadStreamingResponse:
+    if format is None:
+        content_type = request.headers.get("content-type", "")
+        format = "csv" if "csv" in content_type else "ndjson"
+
+    async def results():
+        pairs = parse_pairs(read_lines(request.stream()), format)
+        async for result in service.stream_distances(
+            pairs,
+            chunk_size=settings.STREAM_CHUNK_SIZE,
+            concurrency=settings.BATCH_GEOCODE_CONCURRENCY,
+            mode=mode,
+            ip_address=request.client.host,
+        ):
+            yield json.dumps(result) + "\n"
+        await cache.clear_namespace("history")
+
+    return UploadStreamingResponse(results(), media_type="application/x-ndjson")
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field, field_validator
+from typing import Dict, List, Literal, Optional
 from src.core.security import SecurityService
 
 
@@ -41,3 +42,66 @@ class DistanceResponse(BaseModel):
     address1: GeoLocation = Field(..., description="Geocoded first address")
     address2: GeoLocation = Field(..., description="Geocoded second address")
     query_id: str = Field(..., description="Unique identifier for the query")
+
+
+class BatchDistanceRequest(BaseModel):
+    pairs: List[AddressRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Address pairs to calculate distances for",
+    )
+
+
+class BatchDistanceItem(BaseModel):
+    result: Optional[DistanceResponse] = Field(
+        None, description="Calculated distance, if the pair succeeded"
+    )
+    errors: List[str] = Field(
+        default_factory=list, description="Errors for the pair, if it failed"
+    )
+
+
+class BatchDistanceResponse(BaseModel):
+    results: List[BatchDistanceItem] = Field(
+        ..., description="Per-pair results, in request order"
+    )
+
+
+class MatrixRequest(BaseModel):
+    origins: List[str] = Field(
+        ..., min_length=1, max_length=500, description="Origin addresses"
+    )
+    destinations: List[str] = Field(
+        ..., min_length=1, max_length=500, description="Destination addresses"
+    )
+    units: Literal["km", "miles"] = Field("km", description="Distance units")
+
+    @field_validator("origins", "destinations")
+    def validate_addresses(cls, v: List[str]) -> List[str]:
+        addresses = []
+        for address in v:
+            if not address or not address.strip() or len(address) > 200:
+                raise ValueError("Addresses must be 1 to 200 non-blank characters")
+            addresses.append(SecurityService.validate_input(address))
+        return addresses
+
+
+class MatrixResponse(BaseModel):
+    units: Literal["km", "miles"] = Field(..., description="Distance units")
+    rows: int = Field(..., description="Number of origins")
+    columns: int = Field(..., description="Number of destinations")
+    origins: List[Optional[GeoLocation]] = Field(
+        ..., description="Geocoded origins, null where geocoding failed"
+    )
+    destinations: List[Optional[GeoLocation]] = Field(
+        ..., description="Geocoded destinations, null where geocoding failed"
+    )
+    distances: List[Optional[float]] = Field(
+        ...,
+        description="Row-major distances, origins x destinations, null where "
+        "either address failed",
+    )
+    errors: Dict[str, str] = Field(
+        default_factory=dict, description="Geocoding errors by address"
+    )
@@ -1,5 +1,21 @@
-from geopy.distance import geodesic
-from src.distance.schemas import DistanceResponse, GeoLocation
+import asyncio
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+import numpy as np
+from bson import ObjectId
+from src.distance import engine
+from src.distance.engine import MILES_PER_KM, DistanceMode
+from src.distance.executor import DistanceExecutor
+from src.distance.matrix import DistanceMatrix
+from src.distance.streaming import ParsedPair
+from src.distance.schemas import (
+    BatchDistanceItem,
+    DistanceResponse,
+    GeoLocation,
+)
+from src.analytics.service import AnalyticsService
+from src.core.canonical import canonicalize_address
+from src.core.clients.geocoding.scheduler import Priority, geocode_priority
 from src.core.clients.geocoding.base import GeocodingClient
 from src.core.clients.database.base import DatabaseClient
 from src.distance.exceptions import DistanceCalculationError
@@ -8,14 +24,26 @@ from src.config import logger
 
 class DistanceService:
     def __init__(
-        self, geocoding_client: GeocodingClient, database_client: DatabaseClient
+        self,
+        geocoding_client: GeocodingClient,
+        database_client: DatabaseClient,
+        distance_mode: DistanceMode = DistanceMode.GEOPY,
+        executor: Optional[DistanceExecutor] = None,
+        analytics: Optional[AnalyticsService] = None,
     ):
         self.geocoding_client = geocoding_client
         self.database_client = database_client
+        self.distance_mode = distance_mode
+        self.executor = executor or DistanceExecutor(workers=0)
+        self.analytics = analytics
         self.errors = []
 
     async def calculate_distance(
-        self, address1: str, address2: str
+        self,
+        address1: str,
+        address2: str,
+        mode: Optional[DistanceMode] = None,
+        ip_address: Optional[str] = None,
     ) -> DistanceResponse:
 
         try:
@@ -40,18 +68,16 @@ class DistanceService:
         point1 = (location1.latitude, location1.longitude)
         point2 = (location2.latitude, location2.longitude)
 
-        kilometers = geodesic(point1, point2).kilometers
-        miles = geodesic(point1, point2).miles
+        kilometers = engine.distance(point1, point2, mode or self.distance_mode)
+        miles = kilometers * MILES_PER_KM
 
-        query_data = {
-            "kilometers": kilometers,
-            "miles": miles,
-            "address1": location1.address,
-            "address2": location2.address,
-            "coordinates": {"point1": point1, "point2": point2},
-        }
+        query_data = self._query_record(
+            location1, location2, kilometers, datetime.utcnow(), ip_address
+        )
 
         query_id = await self.database_client.create(query_data)
+        if self.analytics:
+            await self.analytics.record([query_data])
 
         return DistanceResponse(
             kilometers=round(kilometers, 2),
@@ -60,3 +86,242 @@ class DistanceService:
             address2=location2,
             query_id=query_id,
         )
+
+    @staticmethod
+    def _query_record(
+        location1: GeoLocation,
+        location2: GeoLocation,
+        kilometers: float,
+        timestamp: datetime,
+        ip_address: Optional[str],
+    ) -> Dict[str, Any]:
+        """
+        Build the history record of a calculated pair.
+
+        The canonical address keys back case- and abbreviation-insensitive
+        prefix search of the history.
+        """
+        return {
+            "kilometers": kilometers,
+            "miles": kilometers * MILES_PER_KM,
+            "address1": location1.address,
+            "address2": location2.address,
+            "address1_key": canonicalize_address(location1.address),
+            "address2_key": canonicalize_address(location2.address),
+            "coordinates": {
+                "point1": (location1.latitude, location1.longitude),
+                "point2": (location2.latitude, location2.longitude),
+            },
+            "timestamp": timestamp,
+            "ip_address": ip_address,
+        }
+
+    async def _geocode_unique(
+        self, addresses: List[str], concurrency: int
+    ) -> Dict[str, Union[GeoLocation, Exception]]:
+        """
+        Geocode each unique canonical address once, at batch priority and with
+        at most ``concurrency`` lookups in flight.
+
+        Returns the location, or the error raised, by canonical address.
+        """
+        unique: Dict[str, str] = {}
+        for address in addresses:
+            unique.setdefault(canonicalize_address(address), address)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def geocode(address: str):
+            async with semaphore:
+                try:
+                    return await self.geocoding_client.geocode(address)
+                except Exception as ex:
+                    return ex
+
+        token = geocode_priority.set(Priority.BATCH)
+        try:
+            results = await asyncio.gather(
+                *(geocode(address) for address in unique.values())
+            )
+        finally:
+            geocode_priority.reset(token)
+        return dict(zip(unique, results))
+
+    async def calculate_batch(
+        self,
+        pairs: List[Tuple[str, str]],
+        concurrency: int = 8,
+        mode: Optional[DistanceMode] = None,
+        ip_address: Optional[str] = None,
+        query_ids: Optional[List[str]] = None,
+        record_analytics: bool = True,
+    ) -> List[BatchDistanceItem]:
+        """
+        Calculate distances for many address pairs.
+
+        Each unique address is geocoded once. Distances are then computed by
+        one vectorized engine call and the successful pairs are persisted with
+        one bulk write.
+
+        ``query_ids`` assigns the history record ID of each pair, by position,
+        so that calculating the same batch again does not record it twice;
+        a repeated batch should also pass ``record_analytics=False``.
+        """
+        locations = await self._geocode_unique(
+            [address for pair in pairs for address in pair], concurrency
+        )
+
+        items: List[BatchDistanceItem] = []
+        computed: List[Tuple[int, GeoLocation, GeoLocation]] = []
+        for index, (address1, address2) in enumerate(pairs):
+            location1 = locations[canonicalize_address(address1)]
+            location2 = locations[canonicalize_address(address2)]
+            errors = [
+                str(location)
+                for location in (location1, location2)
+                if isinstance(location, Exception)
+            ]
+            items.append(BatchDistanceItem(errors=errors))
+            if not errors:
+                computed.append((index, location1, location2))
+
+        distances = engine.pairwise(
+            [(l1.latitude, l1.longitude) for _, l1, _ in computed],
+            [(l2.latitude, l2.longitude) for _, _, l2 in computed],
+            mode or self.distance_mode,
+        ).tolist()
+
+        timestamp = datetime.utcnow()
+        records = [
+            self._query_record(location1, location2, kilometers, timestamp, ip_address)
+            for (_, location1, location2), kilometers in zip(computed, distances)
+        ]
+        if query_ids is not None:
+            for (index, _, _), record in zip(computed, records):
+                record["_id"] = ObjectId(query_ids[index])
+        created_ids = await self.database_client.create_many(records)
+        if self.analytics and record_analytics:
+            await self.analytics.record(records)
+
+        for (index, location1, location2), kilometers, query_id in zip(
+            computed, distances, created_ids
+        ):
+            items[index].result = DistanceResponse(
+                kilometers=round(kilometers, 2),
+                miles=round(kilometers * MILES_PER_KM, 2),
+                address1=location1,
+                address2=location2,
+                query_id=query_id,
+            )
+
+        return items
+
+    async def calculate_matrix(
+        self,
+        origins: List[str],
+        destinations: List[str],
+        units: str = "km",
+        concurrency: int = 8,
+        mode: Optional[DistanceMode] = None,
+    ) -> DistanceMatrix:
+        """
+        Calculate the distance from every origin to every destination.
+
+        Each unique address is geocoded once and the whole matrix is computed
+        by one engine call, offloaded to the process pool when it is large.
+        Matrices are not written to history.
+        """
+        locations = await self._geocode_unique(origins + destinations, concurrency)
+        origin_locations = [locations[canonicalize_address(a)] for a in origins]
+        destination_locations = [
+            locations[canonicalize_address(a)] for a in destinations
+        ]
+
+        def coordinates(found: List[Union[GeoLocation, Exception]]) -> np.ndarray:
+            return np.array(
+                [
+                    (location.latitude, location.longitude)
+                    if isinstance(location, GeoLocation)
+                    else (np.nan, np.nan)
+                    for location in found
+                ],
+                dtype=np.float64,
+            ).reshape(-1, 2)
+
+        distances = await self.executor.matrix(
+            coordinates(origin_locations),
+            coordinates(destination_locations),
+            mode or self.distance_mode,
+        )
+        if units == "miles":
+            distances = distances * MILES_PER_KM
+
+        errors = {
+            address: str(location)
+            for address, location in zip(
+                origins + destinations, origin_locations + destination_locations
+            )
+            if isinstance(location, Exception)
+        }
+
+        def located(found: List[Union[GeoLocation, Exception]]):
+            return [
+                location if isinstance(location, GeoLocation) else None
+                for location in found
+            ]
+
+        return DistanceMatrix(
+            units=units,
+            origins=located(origin_locations),
+            destinations=located(destination_locations),
+            distances=[
+                None if distance != distance else distance
+                for distance in np.round(distances, 2).ravel().tolist()
+            ],
+            errors=errors,
+        )
+
+    async def stream_distances(
+        self,
+        pairs: AsyncIterator[ParsedPair],
+        chunk_size: int = 100,
+        concurrency: int = 8,
+        mode: Optional[DistanceMode] = None,
+        ip_address: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Calculate distances for a stream of parsed pairs, yielding one result
+        per input line.
+
+        Pairs are processed ``chunk_size`` at a time through calculate_batch,
+        so memory stays bounded by the chunk size. The next chunk is only read
+        once the consumer has taken every result of the current one.
+        """
+        chunk: List[Tuple[int, str, str]] = []
+
+        async def flush():
+            items = await self.calculate_batch(
+                [(address1, address2) for _, address1, address2 in chunk],
+                concurrency=concurrency,
+                mode=mode,
+                ip_address=ip_address,
+            )
+            for (line, _, _), item in zip(chunk, items):
+                if item.result is not None:
+                    yield {"line": line, "result": item.result.model_dump()}
+                else:
+                    yield {"line": line, "errors": item.errors}
+            chunk.clear()
+
+        async for pair in pairs:
+            if len(pair) == 2:
+                yield {"line": pair[0], "errors": [pair[1]]}
+                continue
+            chunk.append(pair)
+            if len(chunk) >= chunk_size:
+                async for result in flush():
+                    yield result
+
+        if chunk:
+            async for result in flush():
+                yield result
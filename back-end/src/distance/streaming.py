@@ -0,0 +1,115 @@
+import csv
+import json
+from typing import AsyncIterator, Optional, Tuple, Union
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+from src.core.security import SecurityService
+
+MAX_LINE_BYTES = 2048
+
+# A parsed upload row: (line number, address1, address2), or
+# (line number, error message) when the row is invalid.
+ParsedPair = Union[Tuple[int, str, str], Tuple[int, str]]
+
+
+async def read_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Optional[str]]:
+    """
+    Split a byte stream into decoded lines without buffering the whole body.
+
+    Lines longer than MAX_LINE_BYTES are skipped and reported as ``None``.
+    """
+    buffer = b""
+    overlong = False
+    async for chunk in chunks:
+        buffer += chunk
+        # Scan from an offset and cut the remainder once per chunk, so a chunk
+        # holding many lines is not copied once per line.
+        start = 0
+        while True:
+            newline = buffer.find(b"\n", start)
+            if newline < 0:
+                break
+            line, start = buffer[start:newline], newline + 1
+            if overlong:
+                overlong = False
+                yield None
+            else:
+                yield line.decode("utf-8", errors="replace").rstrip("\r")
+        buffer = buffer[start:]
+        if len(buffer) > MAX_LINE_BYTES:
+            buffer = b""
+            overlong = True
+    if overlong:
+        yield None
+    elif buffer.strip():
+        yield buffer.decode("utf-8", errors="replace").rstrip("\r")
+
+
+def _parse_csv(line: str) -> Tuple[str, str]:
+    fields = next(csv.reader([line]))
+    if len(fields) != 2:
+        raise ValueError("Expected two columns: address1,address2")
+    return fields[0], fields[1]
+
+
+def _parse_ndjson(line: str) -> Tuple[str, str]:
+    row = json.loads(line)
+    if not isinstance(row, dict):
+        raise ValueError("Expected an object with address1 and address2")
+    return row["address1"], row["address2"]
+
+
+async def parse_pairs(
+    lines: AsyncIterator[Optional[str]], format: str
+) -> AsyncIterator[ParsedPair]:
+    """
+    Parse and validate address pairs from CSV or NDJSON lines.
+
+    Blank lines and a leading CSV ``address1,address2`` header are skipped.
+    """
+    parse = _parse_csv if format == "csv" else _parse_ndjson
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if line is None:
+            yield line_number, f"Line is longer than {MAX_LINE_BYTES} bytes"
+            continue
+        if not line.strip():
+            continue
+        if line_number == 1 and format == "csv":
+            if [field.strip().lower() for field in line.split(",")] == [
+                "address1",
+                "address2",
+            ]:
+                continue
+
+        try:
+            address1, address2 = parse(line)
+            addresses = []
+            for address in (address1, address2):
+                if not isinstance(address, str) or not address.strip():
+                    raise ValueError("Address must not be empty or whitespace")
+                if len(address) > 200:
+                    raise ValueError("Address must be at most 200 characters")
+                addresses.append(SecurityService.validate_input(address))
+        except (ValueError, KeyError, StopIteration) as ex:
+            yield line_number, f"Invalid row: {ex}"
+            continue
+
+        yield line_number, addresses[0], addresses[1]
+
+
+class UploadStreamingResponse(StreamingResponse):
+    """
+    Streaming response whose body generator reads the request body.
+
+    StreamingResponse normally listens for client disconnects on ``receive``
+    while streaming, which would swallow the upload chunks. Here the body
+    generator is the only consumer of ``receive``; a disconnect surfaces there
+    as ClientDisconnect, or as a failed send.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
@@ -0,0 +1,24 @@
+import base64
+import binascii
+from bson import ObjectId
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(record_id: str) -> str:
+    """Encode a record ID as an opaque, URL-safe page token."""
+    return base64.urlsafe_b64encode(record_id.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> str:
+    """Decode a page token back to the query ID, an ObjectId, that it encodes."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        record_id = base64.b64decode(padded, altchars=b"-_", validate=True).decode()
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursorError(f"Invalid page token: {token}")
+    if not ObjectId.is_valid(record_id):
+        raise InvalidCursorError(f"Invalid page token: {token}")
+    return record_id
@@ -1,7 +1,10 @@
+from src.config import get_settings
 from src.history.service import HistoryService
-from src.core.clients.database.mongodb import MongoDBClient
+from src.core.dependencies import get_history_database
+
+settings = get_settings()
 
 
 async def get_history_service() -> HistoryService:
-    database_client = MongoDBClient()
-    return HistoryService(database_client)
+    database_client = get_history_database()
+    return HistoryService(database_client, pairs=settings.HISTORY_STORAGE == "pairs")
@@ -0,0 +1,57 @@
+import json
+from typing import Any, Dict, List, NamedTuple, Optional
+
+# Fields read for a history row besides _id; everything else stays in MongoDB.
+HISTORY_FIELDS = ["kilometers", "miles", "address1", "address2", "hits"]
+
+
+class HistoryRow(NamedTuple):
+    query_id: str
+    kilometers: Optional[float]
+    miles: Optional[float]
+    address1: str
+    address2: str
+    hits: Optional[int] = None
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any], key: str = "_id") -> "HistoryRow":
+        """Build a row from a record, identified by its ``key`` field."""
+        return cls(
+            str(record[key]),
+            record.get("kilometers"),
+            record.get("miles"),
+            record["address1"],
+            record["address2"],
+            record.get("hits"),
+        )
+
+
+class HistoryPage:
+    """
+    A page of history rows with its pagination details.
+
+    The page renders straight to the HistoryListResponse JSON body, so rows
+    are never built into, or validated as, pydantic models.
+    """
+
+    __slots__ = ("items", "pagination", "cursor")
+
+    def __init__(
+        self,
+        items: List[HistoryRow],
+        cursor: Dict[str, Any],
+        pagination: Optional[Dict[str, Any]] = None,
+    ):
+        self.items = items
+        self.cursor = cursor
+        self.pagination = pagination
+
+    def to_json(self) -> bytes:
+        return json.dumps(
+            {
+                "items": [row._asdict() for row in self.items],
+                "pagination": self.pagination,
+                "cursor": self.cursor,
+            },
+            separators=(",", ":"),
+        ).encode()
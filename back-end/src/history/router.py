@@ -1,6 +1,10 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import ValidationError as PydanticValidationError
 from fastapi import APIRouter, Depends, Query, status, Request
-from fastapi.responses import JSONResponse
-from src.history.schemas import HistoryListResponse
+from fastapi.responses import JSONResponse, Response
+from src.history.schemas import HistoryFilters, HistoryListResponse
+from src.history.cursor import InvalidCursorError
 from src.history.service import HistoryService
 from src.history.dependencies import get_history_service
 from src.core.security import SecurityService, limiter
@@ -23,23 +27,84 @@ router = APIRouter(
     response_model=HistoryListResponse,
     status_code=status.HTTP_200_OK,
     summary="Get distance calculation history",
-    description="Retrieves a paginated list of previous distance calculations",
+    description="Retrieves previous distance calculations, newest first. Pass the "
+    "`cursor.next` or `cursor.previous` token of a response as `after` or `before` "
+    "to page by cursor; otherwise `page` selects a page by offset. Address, "
+    "distance, time and IP filters narrow either mode.",
 )
 @limiter.limit("100/minute")
 async def get_history(
     request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Number of records per page"),
+    after: Optional[str] = Query(None, description="Return records after this token"),
+    before: Optional[str] = Query(
+        None, description="Return records before this token"
+    ),
+    include_total: bool = Query(
+        False, description="Include an estimated total in cursor mode"
+    ),
+    address: Optional[str] = Query(
+        None, description="Prefix of either address, ignoring case and abbreviations"
+    ),
+    search: Optional[str] = Query(None, description="Full-text address search"),
+    min_km: Optional[float] = Query(None, description="Minimum distance in km"),
+    max_km: Optional[float] = Query(None, description="Maximum distance in km"),
+    since: Optional[datetime] = Query(None, description="Earliest query time"),
+    until: Optional[datetime] = Query(None, description="Latest query time"),
+    ip: Optional[str] = Query(None, description="Requester IP address"),
     service: HistoryService = Depends(get_history_service),
     cache: TTLCacheClient = Depends(get_cache_client),
-) -> HistoryListResponse:
+) -> Response:
+    try:
+        filters = HistoryFilters(
+            address=address,
+            search=search,
+            min_km=min_km,
+            max_km=max_km,
+            since=since,
+            until=until,
+            ip_address=ip,
+        )
+    except PydanticValidationError as e:
+        raise ValidationException(
+            "; ".join(error["msg"] for error in e.errors())
+        )
 
-    cache_key = f"page:{page}:size:{page_size}"
+    if after is not None and before is not None:
+        raise ValidationException("Pass either after or before, not both")
+
+    # Equivalent filters normalize to the same signature and share entries.
+    if after is not None or before is not None:
+        cache_key = (
+            f"after:{after}:before:{before}:size:{page_size}:total:{include_total}"
+            f":filters:{filters.signature()}"
+        )
+    else:
+        cache_key = f"page:{page}:size:{page_size}:filters:{filters.signature()}"
     cached_result = await cache.get(cache_key, "history")
     if cached_result:
-        return cached_result
+        return Response(content=cached_result, media_type="application/json")
+
+    if after is not None or before is not None:
+        try:
+            response = await service.get_history_page(
+                after=after,
+                before=before,
+                page_size=page_size,
+                include_total=include_total,
+                filters=filters,
+            )
+        except InvalidCursorError as e:
+            raise ValidationException(str(e))
+    else:
+        response = await service.get_history(
+            page=page, page_size=page_size, filters=filters
+        )
 
-    response = await service.get_history(page=page, page_size=page_size)
-    await cache.set(cache_key, response, "history", ttl=3600)
+    # The page is rendered once, without going back through response_model;
+    # the cache keeps the rendered bytes.
+    content = response.to_json()
+    await cache.set(cache_key, content, "history", ttl=3600)
 
-    return response
+    return Response(content=content, media_type="application/json")
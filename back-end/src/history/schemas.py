@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
+from src.core.canonical import canonicalize_prefix
 
 
 class HistoryResponse(BaseModel):
@@ -11,6 +12,9 @@ class HistoryResponse(BaseModel):
     miles: Optional[float] = Field(None, description="Calculated distance in miles")
     address1: str = Field(..., description="First address used in calculation")
     address2: str = Field(..., description="Second address used in calculation")
+    hits: Optional[int] = Field(
+        None, description="Times the address pair was requested, with pair storage"
+    )
 
 
 class PaginationInfo(BaseModel):
@@ -20,6 +24,74 @@ class PaginationInfo(BaseModel):
     total_pages: int = Field(..., description="Total number of pages")
 
 
+class CursorInfo(BaseModel):
+    next: Optional[str] = Field(
+        None, description="Token for the next (older) page, passed as `after`"
+    )
+    previous: Optional[str] = Field(
+        None, description="Token for the previous (newer) page, passed as `before`"
+    )
+    page_size: int = Field(..., description="Number of records per page")
+    total: Optional[int] = Field(
+        None, description="Estimated total number of records, if requested"
+    )
+
+
 class HistoryListResponse(BaseModel):
     items: List[HistoryResponse] = Field(..., description="List of history records")
-    pagination: PaginationInfo = Field(..., description="Pagination information")
+    pagination: Optional[PaginationInfo] = Field(
+        None, description="Pagination information, in page mode"
+    )
+    cursor: CursorInfo = Field(..., description="Cursor pagination information")
+
+
+class HistoryFilters(BaseModel):
+    address: Optional[str] = Field(
+        None,
+        min_length=1,
+        max_length=200,
+        description="Prefix of either address, ignoring case and abbreviations",
+    )
+    search: Optional[str] = Field(
+        None, min_length=1, max_length=200, description="Full-text address search"
+    )
+    min_km: Optional[float] = Field(None, ge=0, description="Minimum distance in km")
+    max_km: Optional[float] = Field(None, ge=0, description="Maximum distance in km")
+    since: Optional[datetime] = Field(None, description="Earliest query time")
+    until: Optional[datetime] = Field(None, description="Latest query time")
+    ip_address: Optional[str] = Field(
+        None, max_length=45, description="Requester IP address"
+    )
+
+    @field_validator("address")
+    def canonicalize(cls, v: Optional[str]) -> Optional[str]:
+        # Matched against the canonical address keys stored with each query.
+        return canonicalize_prefix(v) or None if v is not None else None
+
+    @field_validator("search")
+    def normalize_search(cls, v: Optional[str]) -> Optional[str]:
+        # Text search ignores case, so equivalent searches share a cache key.
+        return " ".join(v.casefold().split()) or None if v is not None else None
+
+    @field_validator("ip_address")
+    def strip(cls, v: Optional[str]) -> Optional[str]:
+        return v.strip() or None if v is not None else None
+
+    @field_validator("since", "until")
+    def to_naive_utc(cls, v: Optional[datetime]) -> Optional[datetime]:
+        # Query times are stored as naive UTC.
+        if v is not None and v.tzinfo is not None:
+            v = v.astimezone(timezone.utc).replace(tzinfo=None)
+        return v
+
+    @model_validator(mode="after")
+    def check_ranges(self) -> "HistoryFilters":
+        if None not in (self.min_km, self.max_km) and self.min_km > self.max_km:
+            raise ValueError("min_km must not be greater than max_km")
+        if None not in (self.since, self.until) and self.since > self.until:
+            raise ValueError("since must not be later than until")
+        return self
+
+    def signature(self) -> str:
+        """A stable key for the filters that are set, for caching."""
+        return self.model_dump_json(exclude_none=True)
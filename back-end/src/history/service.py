@@ -1,38 +1,167 @@
-from src.history.schemas import HistoryListResponse, HistoryResponse, PaginationInfo
+from src.history.cursor import decode_cursor, encode_cursor
+from src.history.page import HISTORY_FIELDS, HistoryPage, HistoryRow
+from src.history.schemas import HistoryFilters
 from src.core.clients.database.base import DatabaseClient
-from typing import List
+from typing import Any, Dict, Optional
 import math
+import re
 
 
 class HistoryService:
-    def __init__(self, database_client: DatabaseClient):
+    """
+    Reads the query history.
+
+    With ``pairs`` the database client holds one record per address pair, as
+    PairDatabaseClient stores them; each pair is listed once, ordered and
+    identified by its latest query.
+    """
+
+    def __init__(self, database_client: DatabaseClient, pairs: bool = False):
         self.database_client = database_client
+        self.pairs = pairs
+        self.key = "last_query_id" if pairs else "_id"
+        self.projection = HISTORY_FIELDS + ([self.key] if pairs else [])
 
     async def get_history(
-        self, page: int = 1, page_size: int = 10
-    ) -> HistoryListResponse:
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        filters: Optional[HistoryFilters] = None,
+    ) -> HistoryPage:
         skip = (page - 1) * page_size
+        query = build_query(filters, self.pairs)
 
-        total = await self.database_client.count()
+        total = await self.database_client.count(query or None)
         records = await self.database_client.find_many(
-            skip=skip, limit=page_size, sort_by="_id", sort_order="desc"
+            skip=skip,
+            limit=page_size,
+            sort_by=self.key,
+            sort_order="desc",
+            filters=query,
+            projection=self.projection,
         )
 
         total_pages = math.ceil(total / page_size)
 
-        pagination = PaginationInfo(
-            total=total, page=page, page_size=page_size, total_pages=total_pages
+        pagination = {
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": total_pages,
+        }
+
+        items = [HistoryRow.from_record(record, self.key) for record in records]
+        cursor = {
+            "next": encode_cursor(items[-1].query_id)
+            if items and skip + page_size < total
+            else None,
+            "previous": encode_cursor(items[0].query_id)
+            if items and page > 1
+            else None,
+            "page_size": page_size,
+            "total": total,
+        }
+
+        return HistoryPage(items, cursor, pagination)
+
+    async def get_history_page(
+        self,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        page_size: int = 10,
+        include_total: bool = False,
+        filters: Optional[HistoryFilters] = None,
+    ) -> HistoryPage:
+        """
+        Get a page of history by keyset pagination, newest first.
+
+        ``after`` continues past the last record of a page and ``before``
+        returns the page ahead of its first record. Each page is a range query
+        on ``_id``, so its cost does not grow with depth. One extra record is
+        fetched to tell whether there is a page beyond this one. With filters
+        the total is an exact count of the matches, as there is no estimate.
+        """
+        query = build_query(filters, self.pairs)
+        sort_order = "desc"
+        if after is not None:
+            query[self.key] = {"$lt": decode_cursor(after)}
+        elif before is not None:
+            query[self.key] = {"$gt": decode_cursor(before)}
+            sort_order = "asc"
+
+        records = await self.database_client.find_many(
+            limit=page_size + 1,
+            sort_by=self.key,
+            sort_order=sort_order,
+            filters=query,
+            projection=self.projection,
         )
+        has_more = len(records) > page_size
+        records = records[:page_size]
+        if before is not None:
+            records.reverse()
+
+        items = [HistoryRow.from_record(record, self.key) for record in records]
+        has_next = has_more if before is None else True
+        has_previous = has_more if before is not None else after is not None
+        cursor = {
+            "next": encode_cursor(items[-1].query_id) if items and has_next else None,
+            "previous": encode_cursor(items[0].query_id)
+            if items and has_previous
+            else None,
+            "page_size": page_size,
+            "total": await self._total(filters) if include_total else None,
+        }
+
+        return HistoryPage(items, cursor)
+
+    async def _total(self, filters: Optional[HistoryFilters]) -> int:
+        query = build_query(filters, self.pairs)
+        if query:
+            return await self.database_client.count(query)
+        return await self.database_client.estimated_count()
+
+
+def build_query(
+    filters: Optional[HistoryFilters], pairs: bool = False
+) -> Dict[str, Any]:
+    """
+    Translate history filters into a database query.
+
+    Each condition matches a declared index: the canonical address keys for
+    prefix search, the text index for full-text search, and the kilometers,
+    timestamp and ip_address indexes for the rest.
+
+    With ``pairs`` the query targets pair records: a pair matches a time
+    range its first and last query overlap, and an IP address in its recent
+    query log.
+    """
+    query: Dict[str, Any] = {}
+    if filters is None:
+        return query
 
-        items = [
-            HistoryResponse(
-                query_id=str(record["_id"]),
-                kilometers=record.get("kilometers"),
-                miles=record.get("miles"),
-                address1=record["address1"],
-                address2=record["address2"],
-            )
-            for record in records
-        ]
-
-        return HistoryListResponse(items=items, pagination=pagination)
+    if filters.address:
+        prefix = {"$regex": "^" + re.escape(filters.address)}
+        query["$or"] = [{"address1_key": prefix}, {"address2_key": prefix}]
+    if filters.search:
+        query["$text"] = {"$search": filters.search}
+    if filters.min_km is not None or filters.max_km is not None:
+        query["kilometers"] = {}
+        if filters.min_km is not None:
+            query["kilometers"]["$gte"] = filters.min_km
+        if filters.max_km is not None:
+            query["kilometers"]["$lte"] = filters.max_km
+    if pairs:
+        if filters.since is not None:
+            query["last_seen"] = {"$gte": filters.since}
+        if filters.until is not None:
+            query["first_seen"] = {"$lte": filters.until}
+    elif filters.since is not None or filters.until is not None:
+        query["timestamp"] = {}
+        if filters.since is not None:
+            query["timestamp"]["$gte"] = filters.since
+        if filters.until is not None:
+            query["timestamp"]["$lte"] = filters.until
+    if filters.ip_address:
+        query["recent.ip_address" if pairs else "ip_address"] = filters.ip_address
+    return query
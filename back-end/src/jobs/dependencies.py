@@ -0,0 +1,39 @@
+from typing import Optional
+from src.config import get_settings
+from src.core.dependencies import create_database_client, get_cache_client
+from src.distance.dependencies import create_distance_service
+from src.jobs.service import JobService
+
+settings = get_settings()
+
+_job_service: Optional[JobService] = None
+
+
+def get_job_service() -> JobService:
+    """Get the background distance job service."""
+    global _job_service
+    if _job_service is None:
+        _job_service = JobService(
+            create_database_client("jobs"),
+            create_database_client("job_results"),
+            create_distance_service,
+            workers=settings.JOB_WORKERS,
+            chunk_size=settings.JOB_CHUNK_SIZE,
+            concurrency=settings.JOB_CONCURRENCY,
+            lease_seconds=settings.JOB_LEASE_SECONDS,
+            cache=get_cache_client(),
+        )
+    return _job_service
+
+
+async def startup() -> None:
+    """Start the job workers and resume unfinished jobs."""
+    await get_job_service().start()
+
+
+async def shutdown() -> None:
+    """Stop the job workers; unfinished jobs resume on the next start."""
+    global _job_service
+    if _job_service is not None:
+        await _job_service.stop()
+        _job_service = None
@@ -0,0 +1,114 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, status, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from src.jobs.exceptions import JobNotFoundError
+from src.jobs.schemas import JobRequest, JobResponse, JobStatus, JobSubmitResponse
+from src.jobs.service import JobService
+from src.jobs.dependencies import get_job_service
+from src.distance.engine import DistanceMode
+from src.core.security import limiter
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["Distance Jobs"],
+    responses={
+        400: {"description": "Invalid input"},
+        404: {"description": "Job not found"},
+        500: {"description": "Internal server error"},
+    },
+)
+
+
+def not_found(ex: JobNotFoundError) -> JSONResponse:
+    return JSONResponse(status_code=404, content={"errors": str(ex)})
+
+
+@router.post(
+    "",
+    response_model=JobSubmitResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit a background distance batch",
+    description="Queues a batch of address pairs and returns a job id to poll",
+)
+@limiter.limit("5/minute")
+async def submit_job(
+    request: Request,
+    job_request: JobRequest,
+    mode: Optional[DistanceMode] = Query(None, description="Distance accuracy mode"),
+    service: JobService = Depends(get_job_service),
+) -> JobSubmitResponse:
+    job_id = await service.submit(
+        [(pair.address1, pair.address2) for pair in job_request.pairs],
+        mode=mode,
+        ip_address=request.client.host,
+    )
+    return JobSubmitResponse(job_id=job_id, status=JobStatus.PENDING)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get a background job",
+    description="Returns job progress and a page of its per-pair results",
+)
+@limiter.limit("100/minute")
+async def get_job(
+    request: Request,
+    job_id: str,
+    offset: int = Query(0, ge=0, description="Index of the first result"),
+    limit: int = Query(100, ge=0, le=1000, description="Number of results"),
+    service: JobService = Depends(get_job_service),
+) -> JobResponse:
+    try:
+        return await service.get_job(job_id, offset=offset, limit=limit)
+    except JobNotFoundError as ex:
+        return not_found(ex)
+
+
+@router.get(
+    "/{job_id}/events",
+    status_code=status.HTTP_200_OK,
+    summary="Stream background job progress",
+    description="Server-sent events with the job progress, until the job finishes",
+    response_class=StreamingResponse,
+)
+@limiter.limit("100/minute")
+async def stream_job(
+    request: Request,
+    job_id: str,
+    service: JobService = Depends(get_job_service),
+):
+    try:
+        await service.get_job(job_id)
+    except JobNotFoundError as ex:
+        return not_found(ex)
+
+    async def events():
+        async for job in service.watch(job_id):
+            yield f"event: progress\ndata: {job.model_dump_json()}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.post(
+    "/{job_id}/cancel",
+    response_model=JobResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Cancel a background job",
+    description="Stops the job before its next chunk; computed results are kept",
+)
+@limiter.limit("100/minute")
+async def cancel_job(
+    request: Request,
+    job_id: str,
+    service: JobService = Depends(get_job_service),
+) -> JobResponse:
+    try:
+        return await service.cancel(job_id)
+    except JobNotFoundError as ex:
+        return not_found(ex)
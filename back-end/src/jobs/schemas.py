@@ -0,0 +1,61 @@
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from src.config import get_settings
+from src.distance.engine import DistanceMode
+from src.distance.schemas import AddressRequest, DistanceResponse
+
+settings = get_settings()
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def finished(self) -> bool:
+        return self in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class JobRequest(BaseModel):
+    pairs: List[AddressRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.JOB_MAX_PAIRS,
+        description="Address pairs to calculate distances for",
+    )
+
+
+class JobSubmitResponse(BaseModel):
+    job_id: str = Field(..., description="Unique identifier for the job")
+    status: JobStatus = Field(..., description="Job status")
+
+
+class JobResultItem(BaseModel):
+    index: int = Field(..., description="Position of the pair in the request")
+    result: Optional[DistanceResponse] = Field(
+        None, description="Calculated distance, if the pair succeeded"
+    )
+    errors: List[str] = Field(
+        default_factory=list, description="Errors for the pair, if it failed"
+    )
+
+
+class JobResponse(BaseModel):
+    job_id: str = Field(..., description="Unique identifier for the job")
+    status: JobStatus = Field(..., description="Job status")
+    mode: Optional[DistanceMode] = Field(None, description="Distance accuracy mode")
+    total: int = Field(..., description="Number of pairs in the job")
+    processed: int = Field(..., description="Number of pairs processed so far")
+    succeeded: int = Field(..., description="Number of pairs that succeeded")
+    failed: int = Field(..., description="Number of pairs that failed")
+    error: Optional[str] = Field(None, description="Why the job failed, if it did")
+    created_at: datetime = Field(..., description="When the job was submitted")
+    updated_at: datetime = Field(..., description="When the job last progressed")
+    results: List[JobResultItem] = Field(
+        default_factory=list, description="Requested page of per-pair results"
+    )
@@ -0,0 +1,391 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+from uuid import uuid4
+from bson import ObjectId
+from src.core.clients.cache.base import BaseCacheClient
+from src.core.clients.database.base import DatabaseClient
+from src.distance.engine import DistanceMode
+from src.distance.service import DistanceService
+from src.jobs.exceptions import JobNotFoundError
+from src.jobs.schemas import JobResponse, JobResultItem, JobStatus
+from src.config import logger
+
+
+class JobService:
+    """
+    Runs distance batches in the background.
+
+    Jobs and their per-pair results are persisted through two database
+    clients, so progress survives a restart. A fixed pool of worker tasks
+    takes jobs off an in-process queue, and each job geocodes with at most
+    ``concurrency`` lookups in flight.
+
+    Several instances may share the same jobs. A worker claims a job
+    atomically before running it, taking it over when it is pending or when
+    its previous owner's lease has expired, and renews the lease while it
+    runs. Every later status change is conditional on the job still being
+    running under the same owner, so a cancelled job, or one taken over by
+    another instance, is never overwritten. Each instance queues the
+    claimable jobs on start and again every ``lease_seconds``, so a crashed
+    instance's jobs continue from their last completed chunk elsewhere.
+
+    Each chunk writes history records, so when given ``cache``, the
+    ``cache_namespace`` entries are cleared after every chunk so that cached
+    history pages list the new records.
+    """
+
+    def __init__(
+        self,
+        jobs: DatabaseClient,
+        results: DatabaseClient,
+        distance_service_factory: Callable[[], DistanceService],
+        workers: int = 2,
+        chunk_size: int = 100,
+        concurrency: int = 4,
+        lease_seconds: float = 60.0,
+        cache: Optional[BaseCacheClient] = None,
+        cache_namespace: str = "history",
+    ):
+        self.jobs = jobs
+        self.results = results
+        self.distance_service_factory = distance_service_factory
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.lease_seconds = lease_seconds
+        self.cache = cache
+        self.cache_namespace = cache_namespace
+        self.owner = uuid4().hex
+        self._queue: Optional[asyncio.Queue] = None
+        self._queued: Set[str] = set()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Start the worker pool and queue every claimable job."""
+        self._queue = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+        resumed = await self._queue_claimable()
+        if resumed:
+            logger.info(f"Resuming {resumed} distance jobs")
+        self._tasks.append(asyncio.create_task(self._rescan()))
+
+    def _enqueue(self, job_id: str) -> None:
+        if job_id not in self._queued:
+            self._queued.add(job_id)
+            self._queue.put_nowait(job_id)
+
+    async def _queue_claimable(self) -> int:
+        """Queue the pending jobs and the running jobs whose lease expired."""
+        now = datetime.utcnow()
+        unfinished = await self.jobs.find_many(
+            limit=0,
+            sort_by="_id",
+            sort_order="asc",
+            filters={
+                "status": {"$in": [JobStatus.PENDING.value, JobStatus.RUNNING.value]}
+            },
+            projection=["status", "lease_until"],
+        )
+        claimable = [
+            str(job["_id"])
+            for job in unfinished
+            if job["status"] == JobStatus.PENDING.value
+            or job.get("lease_until") is None
+            or job["lease_until"] < now
+        ]
+        for job_id in claimable:
+            self._enqueue(job_id)
+        return len(claimable)
+
+    async def _rescan(self) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds)
+            try:
+                await self._queue_claimable()
+            except Exception as e:
+                logger.error(f"Failed to scan for distance jobs: {str(e)}")
+
+    async def stop(self) -> None:
+        """
+        Stop the worker pool.
+
+        Jobs in flight keep their ``running`` status and are taken over once
+        their lease expires.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(
+        self,
+        pairs: List[Tuple[str, str]],
+        mode: Optional[DistanceMode] = None,
+        ip_address: Optional[str] = None,
+    ) -> str:
+        """Persist a new job and queue it; returns the job id."""
+        now = datetime.utcnow()
+        job_id = await self.jobs.create(
+            {
+                "status": JobStatus.PENDING.value,
+                "mode": mode.value if mode else None,
+                "pairs": [list(pair) for pair in pairs],
+                "ip_address": ip_address,
+                "total": len(pairs),
+                "processed": 0,
+                "succeeded": 0,
+                "failed": 0,
+                "error": None,
+                "owner": None,
+                "lease_until": None,
+                "chunk": None,
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+        self._enqueue(job_id)
+        return job_id
+
+    async def get_job(
+        self, job_id: str, offset: int = 0, limit: int = 0
+    ) -> JobResponse:
+        """Get a job's progress, with up to ``limit`` results from ``offset``."""
+        job = await self._find(job_id)
+        results = []
+        if limit:
+            records = await self.results.find_many(
+                skip=offset,
+                limit=limit,
+                sort_by="index",
+                sort_order="asc",
+                filters={"job_id": job_id},
+            )
+            results = [
+                JobResultItem(
+                    index=record["index"],
+                    result=record.get("result"),
+                    errors=record.get("errors", []),
+                )
+                for record in records
+            ]
+        return self._response(job_id, job, results)
+
+    async def cancel(self, job_id: str) -> JobResponse:
+        """
+        Cancel a job that has not finished.
+
+        A running job stops before its next chunk; results already computed
+        are kept.
+        """
+        await self.jobs.update_if(
+            job_id,
+            {"status": {"$in": [JobStatus.PENDING.value, JobStatus.RUNNING.value]}},
+            {"status": JobStatus.CANCELLED.value, "updated_at": datetime.utcnow()},
+        )
+        job = await self._find(job_id)
+        return self._response(job_id, job, [])
+
+    async def watch(
+        self, job_id: str, interval: float = 1.0
+    ) -> AsyncIterator[JobResponse]:
+        """Yield the job each time its progress changes, until it finishes."""
+        last = None
+        while True:
+            job = await self._find(job_id)
+            progress = (job["status"], job["processed"])
+            if progress != last:
+                last = progress
+                yield self._response(job_id, job, [])
+            if JobStatus(job["status"]).finished:
+                return
+            await asyncio.sleep(interval)
+
+    async def _find(self, job_id: str) -> Dict[str, Any]:
+        job = await self.jobs.find_by_id(job_id)
+        if job is None:
+            raise JobNotFoundError(f"Job not found: {job_id}")
+        return job
+
+    @staticmethod
+    def _response(
+        job_id: str, job: Dict[str, Any], results: List[JobResultItem]
+    ) -> JobResponse:
+        return JobResponse(
+            job_id=job_id,
+            status=job["status"],
+            mode=job.get("mode"),
+            total=job["total"],
+            processed=job["processed"],
+            succeeded=job["succeeded"],
+            failed=job["failed"],
+            error=job.get("error"),
+            created_at=job["created_at"],
+            updated_at=job["updated_at"],
+            results=results,
+        )
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            self._queued.discard(job_id)
+            try:
+                await self.run(job_id)
+            except Exception as ex:
+                logger.error(f"Distance job {job_id} failed: {str(ex)}")
+                try:
+                    await self._update_owned(
+                        job_id,
+                        {
+                            "status": JobStatus.FAILED.value,
+                            "error": str(ex),
+                            "lease_until": None,
+                            "updated_at": datetime.utcnow(),
+                        },
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to record job {job_id} failure: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    def _lease_until(self) -> datetime:
+        return datetime.utcnow() + timedelta(seconds=self.lease_seconds)
+
+    async def _claim(self, job_id: str) -> bool:
+        """Take the job if it is pending or its owner's lease has expired."""
+        now = datetime.utcnow()
+        running = JobStatus.RUNNING.value
+        return await self.jobs.update_if(
+            job_id,
+            {
+                "$or": [
+                    {"status": JobStatus.PENDING.value},
+                    {"status": running, "lease_until": None},
+                    {"status": running, "lease_until": {"$lt": now}},
+                ]
+            },
+            {
+                "status": running,
+                "owner": self.owner,
+                "lease_until": self._lease_until(),
+                "updated_at": now,
+            },
+        )
+
+    async def _update_owned(self, job_id: str, data: Dict[str, Any]) -> bool:
+        """Update the job if it is still running under this instance."""
+        return await self.jobs.update_if(
+            job_id, {"status": JobStatus.RUNNING.value, "owner": self.owner}, data
+        )
+
+    async def _renew(self, job_id: str) -> None:
+        """Renew the job's lease until it is lost or the task is cancelled."""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            if not await self._update_owned(
+                job_id, {"lease_until": self._lease_until()}
+            ):
+                return
+
+    async def run(self, job_id: str) -> None:
+        """
+        Claim a job and process it chunk by chunk, from its last completed
+        chunk. Returns without doing anything if the job cannot be claimed.
+
+        Progress counters are written after each chunk's results, so results
+        past the recorded progress belong to an interrupted chunk and are
+        dropped before resuming. The history record IDs of a chunk are saved
+        on the job before it is calculated, so an interrupted chunk is
+        recorded under the same IDs when it is redone, and its analytics are
+        not counted again.
+        """
+        if not await self._claim(job_id):
+            return
+        job = await self._find(job_id)
+
+        await self.results.delete_many(
+            {"job_id": job_id, "index": {"$gte": job["processed"]}}
+        )
+
+        renewal = asyncio.create_task(self._renew(job_id))
+        try:
+            await self._process(job_id, job)
+        finally:
+            renewal.cancel()
+            await asyncio.gather(renewal, return_exceptions=True)
+
+    async def _process(self, job_id: str, job: Dict[str, Any]) -> None:
+        service = self.distance_service_factory()
+        mode = DistanceMode(job["mode"]) if job.get("mode") else None
+        pairs = job["pairs"]
+        processed, succeeded, failed = (
+            job["processed"],
+            job["succeeded"],
+            job["failed"],
+        )
+        interrupted = job.get("chunk")
+
+        while processed < len(pairs):
+            chunk = pairs[processed : processed + self.chunk_size]
+            redo = interrupted is not None and interrupted["start"] == processed
+            if redo:
+                query_ids = interrupted["query_ids"]
+            else:
+                query_ids = [str(ObjectId()) for _ in chunk]
+                if not await self._update_owned(
+                    job_id,
+                    {
+                        "chunk": {"start": processed, "query_ids": query_ids},
+                        "lease_until": self._lease_until(),
+                    },
+                ):
+                    return
+            interrupted = None
+
+            items = await service.calculate_batch(
+                [tuple(pair) for pair in chunk],
+                concurrency=self.concurrency,
+                mode=mode,
+                ip_address=job.get("ip_address"),
+                query_ids=query_ids,
+                record_analytics=not redo,
+            )
+            await self.results.create_many(
+                [
+                    {
+                        "job_id": job_id,
+                        "index": processed + offset,
+                        "result": item.result.model_dump() if item.result else None,
+                        "errors": item.errors,
+                    }
+                    for offset, item in enumerate(items)
+                ]
+            )
+            if self.cache is not None:
+                await self.cache.clear_namespace(self.cache_namespace)
+
+            processed += len(chunk)
+            succeeded += sum(1 for item in items if item.result is not None)
+            failed += sum(1 for item in items if item.result is None)
+            if not await self._update_owned(
+                job_id,
+                {
+                    "processed": processed,
+                    "succeeded": succeeded,
+                    "failed": failed,
+                    "chunk": None,
+                    "updated_at": datetime.utcnow(),
+                },
+            ):
+                return
+
+        await self._update_owned(
+            job_id,
+            {
+                "status": JobStatus.COMPLETED.value,
+                "lease_until": None,
+                "updated_at": datetime.utcnow(),
+            },
+        )
@@ -1,15 +1,25 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
+from slowapi.middleware import SlowAPIASGIMiddleware
 from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
 from src.config import get_settings
 from src.distance.router import router as distance_router
 from src.history.router import router as history_router
+from src.monitoring.router import router as monitoring_router
+from src.jobs.router import router as jobs_router
+from src.analytics.router import router as analytics_router
 from src.core.security import limiter, SecurityService, security_logger
+from src.core import dependencies
+from src.distance.dependencies import get_distance_executor
+from src.jobs import dependencies as job_dependencies
+from src.analytics import dependencies as analytics_dependencies
+from src.retention import dependencies as retention_dependencies
 from src.core.exceptions import (
     BaseAPIException,
     ValidationException,
@@ -21,6 +31,22 @@ from src.core.exceptions import (
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await dependencies.startup()
+    get_distance_executor().start()
+    await analytics_dependencies.startup()
+    await job_dependencies.startup()
+    await retention_dependencies.startup()
+    yield
+    await retention_dependencies.shutdown()
+    await job_dependencies.shutdown()
+    await analytics_dependencies.shutdown()
+    get_distance_executor().shutdown()
+    await dependencies.shutdown()
+
+
 app = FastAPI(
     title="Address Distance API",
     version=settings.VERSION,
@@ -30,6 +56,7 @@ app = FastAPI(
     redoc_url=f"{settings.API_PREFIX}/redoc",
     default_response_class=JSONResponse,
     default_response_headers={},  # Disable default headers
+    lifespan=lifespan,
 )
 
 
@@ -59,22 +86,42 @@ app.add_middleware(
 app.add_exception_handler(BaseAPIException, exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 
-app.add_middleware(SlowAPIMiddleware)
+app.add_middleware(SlowAPIASGIMiddleware)
+
+
+class RequestLoggingMiddleware:
+    """
+    Log every request with its outcome.
+
+    Written as plain ASGI middleware rather than with @app.middleware so that
+    request bodies can still be streamed while the response is being sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        try:
+            await self.app(scope, receive, send)
+            security_logger.log_request(request, "success")
+        except Exception as e:
+            security_logger.log_request(request, "error", str(e))
+            raise
 
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    try:
-        response = await call_next(request)
-        security_logger.log_request(request, "success")
-        return response
-    except Exception as e:
-        security_logger.log_request(request, "error", str(e))
-        raise
+app.add_middleware(RequestLoggingMiddleware)
 
 
 app.include_router(distance_router, prefix=settings.API_PREFIX)
+app.include_router(analytics_router, prefix=settings.API_PREFIX)
 app.include_router(history_router, prefix=settings.API_PREFIX)
+app.include_router(monitoring_router, prefix=settings.API_PREFIX)
+app.include_router(jobs_router, prefix=settings.API_PREFIX)
 
 
 #
@@ -0,0 +1,194 @@
+"""
+Query plan verification for the query shapes the services issue.
+
+Run against the configured database with ``python -m src.monitoring.plans``;
+pass ``--ensure-indexes`` to create the declared indexes first. Exits non-zero
+when any shape needs a collection scan, or an in-memory sort it does not
+explicitly allow.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional
+from src.core import dependencies
+from src.core.clients.database.base import DatabaseClient
+from src.history.schemas import HistoryFilters
+from src.history.service import build_query
+
+# Stages that mean a query is not served by an index.
+PROBLEM_STAGES = {"COLLSCAN", "SORT"}
+
+SAMPLE_ID = "0" * 24
+
+
+@dataclass(frozen=True)
+class QueryShape:
+    name: str
+    collection: str
+    filters: Dict[str, Any] = field(default_factory=dict)
+    sort_by: str = "_id"
+    sort_order: str = "desc"
+    # Problem stages accepted for this shape, e.g. sorting the matches of a
+    # range filter that an index has already narrowed.
+    allowed: FrozenSet[str] = frozenset()
+
+
+def history_shape(name: str, allowed: FrozenSet[str] = frozenset(), **filters):
+    return QueryShape(
+        name, "queries", build_query(HistoryFilters(**filters)), allowed=allowed
+    )
+
+
+def pair_history_shape(name: str, allowed: FrozenSet[str] = frozenset(), **filters):
+    return QueryShape(
+        name,
+        "query_pairs",
+        build_query(HistoryFilters(**filters), pairs=True),
+        "last_query_id",
+        allowed=allowed,
+    )
+
+
+QUERY_SHAPES: List[QueryShape] = [
+    QueryShape("history_page", "queries"),
+    QueryShape("history_after", "queries", {"_id": {"$lt": SAMPLE_ID}}),
+    QueryShape(
+        "history_before", "queries", {"_id": {"$gt": SAMPLE_ID}}, sort_order="asc"
+    ),
+    history_shape("history_ip", ip_address="203.0.113.7"),
+    history_shape("history_address", frozenset({"SORT"}), address="main st"),
+    history_shape("history_search", frozenset({"SORT"}), search="springfield"),
+    history_shape("history_distance", frozenset({"SORT"}), min_km=10, max_km=20),
+    history_shape(
+        "history_time", frozenset({"SORT"}), since=datetime(2024, 1, 1)
+    ),
+    pair_history_shape("pairs_page"),
+    QueryShape(
+        "pairs_after",
+        "query_pairs",
+        {"last_query_id": {"$lt": SAMPLE_ID}},
+        "last_query_id",
+    ),
+    pair_history_shape("pairs_address", frozenset({"SORT"}), address="main st"),
+    pair_history_shape("pairs_search", frozenset({"SORT"}), search="springfield"),
+    pair_history_shape("pairs_distance", frozenset({"SORT"}), min_km=10, max_km=20),
+    QueryShape(
+        "retention_expired",
+        "queries",
+        {"timestamp": {"$lt": datetime(2024, 1, 1)}},
+        "timestamp",
+        "asc",
+    ),
+    QueryShape(
+        "retention_expired_pairs",
+        "query_pairs",
+        {"last_seen": {"$lt": datetime(2024, 1, 1)}},
+        "last_seen",
+        "asc",
+    ),
+    QueryShape(
+        "stats_daily",
+        "rollups",
+        {"kind": "day", "day": {"$gte": "2024-01-01"}},
+        "day",
+        "asc",
+    ),
+    QueryShape("stats_routes", "rollups", {"kind": "pair"}, "count"),
+    QueryShape(
+        "stats_routes_recent",
+        "rollups",
+        {"kind": "pair_day", "day": "2024-01-01"},
+        "count",
+    ),
+    # A fixed, small number of histogram buckets.
+    QueryShape(
+        "stats_distances",
+        "rollups",
+        {"kind": "distance"},
+        "bucket",
+        "asc",
+        allowed=frozenset({"SORT"}),
+    ),
+    # Few jobs are unfinished at a time; SQLite sorts the two status ranges
+    # rather than merging them.
+    QueryShape(
+        "jobs_unfinished",
+        "jobs",
+        {"status": {"$in": ["pending", "running"]}},
+        sort_order="asc",
+        allowed=frozenset({"SORT"}),
+    ),
+    QueryShape(
+        "job_results", "job_results", {"job_id": SAMPLE_ID}, "index", "asc"
+    ),
+]
+
+
+def plan_stages(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Walk every stage of a query plan tree."""
+    if "queryPlan" in plan:
+        plan = plan["queryPlan"]
+    yield plan
+    for key in ("inputStage", "outerStage", "innerStage"):
+        if key in plan:
+            yield from plan_stages(plan[key])
+    for child in plan.get("inputStages", []):
+        yield from plan_stages(child)
+
+
+def check_plan(
+    explain: Dict[str, Any], allowed: FrozenSet[str] = frozenset()
+) -> Dict[str, Any]:
+    """Summarize an explain() result and flag the stages that need attention."""
+    winning = explain.get("queryPlanner", {}).get("winningPlan", {})
+    stages = list(plan_stages(winning))
+    names = [stage.get("stage") for stage in stages]
+    return {
+        "stages": names,
+        "indexes": [stage["indexName"] for stage in stages if "indexName" in stage],
+        "problems": sorted(PROBLEM_STAGES.intersection(names) - allowed),
+    }
+
+
+async def verify_query_plans(
+    client_factory: Callable[[str], DatabaseClient],
+    shapes: Optional[List[QueryShape]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Explain each query shape on a client created for its collection and
+    report its plan, by shape name.
+    """
+    report = {}
+    for shape in shapes or QUERY_SHAPES:
+        database_client = client_factory(shape.collection)
+        explain = await database_client.explain(
+            shape.filters, shape.sort_by, shape.sort_order
+        )
+        report[shape.name] = check_plan(explain, shape.allowed)
+    return report
+
+
+async def main(ensure_indexes: bool) -> int:
+    try:
+        if ensure_indexes:
+            await dependencies.ensure_indexes()
+        report = await verify_query_plans(dependencies.create_database_client)
+    finally:
+        await dependencies.shutdown()
+    print(json.dumps(report, indent=2))
+    return 1 if any(result["problems"] for result in report.values()) else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--ensure-indexes",
+        action="store_true",
+        help="Create the declared indexes before explaining",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.ensure_indexes)))
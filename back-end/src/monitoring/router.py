@@ -0,0 +1,96 @@
+from typing import Any, Dict
+from fastapi import APIRouter, Depends, Request, status
+from src.core.clients.geocoding.base import GeocodingClient
+from src.core.clients.database.base import DatabaseClient
+from src.core.clients.database.pool import PoolStatsListener
+from src.core.dependencies import (
+    create_database_client,
+    get_geocoding_client,
+    get_history_database,
+    get_mongo_pool_stats,
+)
+from src.core.security import limiter
+from src.distance.dependencies import get_distance_executor
+from src.distance.executor import DistanceExecutor
+from src.monitoring.plans import verify_query_plans
+from src.retention.dependencies import get_retention_service
+from src.retention.service import RetentionService
+
+router = APIRouter(
+    prefix="/monitoring",
+    tags=["Monitoring"],
+    responses={
+        500: {"description": "Internal server error"},
+    },
+)
+
+
+def collect_stats(client: Any) -> Dict[str, Any]:
+    """Collect the stats of every layer in a wrapped client chain."""
+    stats = {}
+    while client is not None:
+        if hasattr(client, "stats"):
+            stats[type(client).__name__] = client.stats()
+        client = getattr(client, "client", None)
+    return stats
+
+
+@router.get(
+    "/geocoding",
+    status_code=status.HTTP_200_OK,
+    summary="Get geocoding client statistics",
+    description="Returns the counters exposed by each layer of the geocoding client",
+)
+@limiter.limit("100/minute")
+async def get_geocoding_stats(
+    request: Request,
+    client: GeocodingClient = Depends(get_geocoding_client),
+) -> Dict[str, Any]:
+    return collect_stats(client)
+
+
+@router.get(
+    "/distance",
+    status_code=status.HTTP_200_OK,
+    summary="Get distance executor statistics",
+    description="Returns process pool size and how many computations were offloaded",
+)
+@limiter.limit("100/minute")
+async def get_distance_stats(
+    request: Request,
+    executor: DistanceExecutor = Depends(get_distance_executor),
+) -> Dict[str, Any]:
+    return executor.stats()
+
+
+@router.get(
+    "/database",
+    status_code=status.HTTP_200_OK,
+    summary="Get database statistics",
+    description="Returns MongoDB connections per server, history write buffer "
+    "counters and history retention progress",
+)
+@limiter.limit("100/minute")
+async def get_database_stats(
+    request: Request,
+    pool_stats: PoolStatsListener = Depends(get_mongo_pool_stats),
+    history_database: DatabaseClient = Depends(get_history_database),
+    retention: RetentionService = Depends(get_retention_service),
+) -> Dict[str, Any]:
+    return {
+        "pool": pool_stats.stats(),
+        "history": collect_stats(history_database),
+        "retention": retention.stats(),
+    }
+
+
+@router.get(
+    "/database/plans",
+    status_code=status.HTTP_200_OK,
+    summary="Verify database query plans",
+    description="Explains each query shape the services issue and flags "
+    "collection scans and in-memory sorts",
+)
+@limiter.limit("10/minute")
+async def get_query_plans(request: Request) -> Dict[str, Any]:
+    return await verify_query_plans(create_database_client)
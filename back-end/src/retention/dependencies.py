@@ -0,0 +1,65 @@
+from typing import Optional
+from src.analytics.dependencies import get_analytics_service
+from src.config import get_settings, logger
+from src.core.clients.database.lease import Lease
+from src.core.dependencies import (
+    create_database_client,
+    get_cache_client,
+    get_history_database,
+)
+from src.retention.service import ArchiveWriter, RetentionService
+
+settings = get_settings()
+
+_retention_service: Optional[RetentionService] = None
+
+
+def get_retention_service() -> RetentionService:
+    """Get the history retention service."""
+    global _retention_service
+    if _retention_service is None:
+        pairs = settings.HISTORY_STORAGE == "pairs"
+        collection = "query_pairs" if pairs else "queries"
+        archive = None
+        if settings.RETENTION_ARCHIVE_PATH:
+            archive = ArchiveWriter(
+                settings.RETENTION_ARCHIVE_PATH,
+                collection,
+                segment_records=settings.RETENTION_SEGMENT_RECORDS,
+            )
+        _retention_service = RetentionService(
+            get_history_database(),
+            field="last_seen" if pairs else "timestamp",
+            max_age_days=settings.RETENTION_DAYS,
+            archive=archive,
+            ttl_index=settings.RETENTION_TTL_INDEX,
+            interval=settings.RETENTION_INTERVAL,
+            batch_size=settings.RETENTION_BATCH_SIZE,
+            duty_cycle=settings.RETENTION_DUTY_CYCLE,
+            analytics=get_analytics_service(),
+            cache=get_cache_client(),
+            lease=Lease(
+                create_database_client("leases"),
+                f"retention:{collection}",
+                seconds=settings.RETENTION_LEASE_SECONDS,
+            ),
+        )
+    return _retention_service
+
+
+async def startup() -> None:
+    """Match the TTL index to the settings and start compacting the history."""
+    service = get_retention_service()
+    try:
+        await service.sync_ttl_index()
+    except Exception as e:
+        logger.error(f"Failed to update the history TTL index: {str(e)}")
+    service.start()
+
+
+async def shutdown() -> None:
+    """Stop the compaction task."""
+    global _retention_service
+    if _retention_service is not None:
+        await _retention_service.close()
+        _retention_service = None
@@ -0,0 +1,243 @@
+import asyncio
+import gzip
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from bson import json_util
+from src.analytics.service import AnalyticsService
+from src.core.clients.cache.base import BaseCacheClient
+from src.core.clients.database.base import DatabaseClient
+from src.core.clients.database.indexes import ASCENDING, IndexSpec
+from src.core.clients.database.lease import Lease
+from src.config import logger
+
+
+class ArchiveWriter:
+    """
+    Appends records to gzip-compressed NDJSON segment files.
+
+    Records are written as MongoDB extended JSON, one per line, so archived
+    ObjectIds and dates can be restored as such, e.g. with mongoimport. Each
+    write appends a gzip member and is synced to disk before it returns. A
+    new segment is started once the current one holds ``segment_records``
+    records.
+    """
+
+    def __init__(self, directory: str, prefix: str, segment_records: int = 100000):
+        self.directory = directory
+        self.prefix = prefix
+        self.segment_records = segment_records
+        self.path: Optional[str] = None
+        self._segment_count = 0
+
+    def _next_segment(self) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"{self.prefix}-{datetime.utcnow():%Y%m%dT%H%M%S%f}.ndjson.gz"
+        return os.path.join(self.directory, name)
+
+    def write(self, records: List[Dict[str, Any]]) -> str:
+        """Append records to the current segment; returns its path."""
+        if self.path is None or self._segment_count >= self.segment_records:
+            self.path = self._next_segment()
+            self._segment_count = 0
+        lines = "".join(
+            json_util.dumps(record, json_options=json_util.RELAXED_JSON_OPTIONS) + "\n"
+            for record in records
+        )
+        with open(self.path, "ab") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb") as compressed:
+                compressed.write(lines.encode())
+            raw.flush()
+            os.fsync(raw.fileno())
+        self._segment_count += len(records)
+        return self.path
+
+
+class RetentionService:
+    """
+    Expires history records once they are ``max_age_days`` old.
+
+    A background task compacts the history every ``interval`` seconds: it
+    reads the oldest expired records ``batch_size`` at a time, archives each
+    batch when an ArchiveWriter is given, and then deletes it. Compaction is
+    throttled to a ``duty_cycle`` share of wall time: after each batch it
+    pauses in proportion to how long the batch took, so it slows down when
+    the database is busy rather than competing with requests.
+
+    Records are archived before they are deleted, so an interrupted batch is
+    archived again by the next run rather than lost.
+
+    With ``ttl_index`` the database also expires records itself through a TTL
+    index on ``field``, where it supports one. The index deletes records
+    without archiving them, so it cannot be combined with an archive.
+
+    When given ``analytics``, each compaction also expires the per-day
+    analytics rollups of the days it expired, and when given ``cache``, the
+    ``cache_namespace`` entries are cleared after each deleted batch so that
+    cached history pages do not list deleted records.
+
+    With a ``lease``, only the process holding it compacts; the others skip
+    the cycle. The lease is renewed before every batch and released when
+    the compaction ends.
+    """
+
+    def __init__(
+        self,
+        database_client: DatabaseClient,
+        field: str = "timestamp",
+        max_age_days: int = 0,
+        archive: Optional[ArchiveWriter] = None,
+        ttl_index: bool = False,
+        interval: float = 3600.0,
+        batch_size: int = 500,
+        duty_cycle: float = 0.1,
+        analytics: Optional[AnalyticsService] = None,
+        cache: Optional[BaseCacheClient] = None,
+        cache_namespace: str = "history",
+        lease: Optional[Lease] = None,
+    ):
+        if archive is not None and ttl_index:
+            raise ValueError("A TTL index would delete records before archiving them")
+        if not 0 < duty_cycle <= 1:
+            raise ValueError("duty_cycle must be in (0, 1]")
+        self.database_client = database_client
+        self.field = field
+        self.max_age_days = max_age_days
+        self.archive = archive
+        self.ttl_index = ttl_index
+        self.interval = interval
+        self.batch_size = batch_size
+        self.duty_cycle = duty_cycle
+        self.analytics = analytics
+        self.cache = cache
+        self.cache_namespace = cache_namespace
+        self.lease = lease
+        self._task: Optional[asyncio.Task] = None
+        self._runs = 0
+        self._archived = 0
+        self._deleted = 0
+        self._expired_rollups = 0
+        self._failures = 0
+        self._last_run: Optional[datetime] = None
+        self._last_duration = 0.0
+        self._last_deleted = 0
+
+    @property
+    def ttl_index_name(self) -> str:
+        return f"{self.field}_ttl"
+
+    async def sync_ttl_index(self) -> None:
+        """Create, update or drop the TTL index to match the configuration."""
+        if self.ttl_index and self.max_age_days > 0:
+            await self.database_client.ensure_indexes(
+                [
+                    IndexSpec(
+                        self.ttl_index_name,
+                        [(self.field, ASCENDING)],
+                        {"expireAfterSeconds": self.max_age_days * 86400},
+                    )
+                ]
+            )
+        else:
+            await self.database_client.drop_indexes([self.ttl_index_name])
+
+    def start(self) -> None:
+        """Start the background compaction task, if records expire at all."""
+        if self._task is None and self.max_age_days > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.compact()
+            except Exception:
+                # Already logged; retry on the next cycle.
+                pass
+            await asyncio.sleep(self.interval)
+
+    async def close(self) -> None:
+        """Stop the compaction task."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def compact(self, now: Optional[datetime] = None) -> int:
+        """
+        Archive and delete every expired record, oldest first; returns the
+        number of records deleted, or 0 when another process holds the lease.
+        """
+        if self.lease is not None and not await self.lease.acquire():
+            return 0
+        try:
+            return await self._compact(now)
+        finally:
+            if self.lease is not None:
+                await self.lease.release()
+
+    async def _compact(self, now: Optional[datetime]) -> int:
+        started = time.perf_counter()
+        cutoff = (now or datetime.utcnow()) - timedelta(days=self.max_age_days)
+        deleted = 0
+        try:
+            while True:
+                batch_started = time.perf_counter()
+                records = await self.database_client.find_many(
+                    limit=self.batch_size,
+                    sort_by=self.field,
+                    sort_order="asc",
+                    filters={self.field: {"$lt": cutoff}},
+                )
+                if not records:
+                    break
+                if self.archive is not None:
+                    await asyncio.to_thread(self.archive.write, records)
+                    self._archived += len(records)
+                # A record touched since it was read, such as a pair queried
+                # again, is no longer expired and is kept.
+                count = await self.database_client.delete_many(
+                    {
+                        "_id": {"$in": [record["_id"] for record in records]},
+                        self.field: {"$lt": cutoff},
+                    }
+                )
+                deleted += count
+                self._deleted += count
+                if count and self.cache is not None:
+                    await self.cache.clear_namespace(self.cache_namespace)
+                if len(records) < self.batch_size:
+                    break
+                elapsed = time.perf_counter() - batch_started
+                await asyncio.sleep(elapsed * (1 / self.duty_cycle - 1))
+                if self.lease is not None and not await self.lease.acquire():
+                    break
+            if self.analytics is not None:
+                self._expired_rollups += await self.analytics.expire(cutoff)
+        except Exception as e:
+            self._failures += 1
+            logger.error(f"Failed to compact history: {str(e)}")
+            raise
+        finally:
+            self._runs += 1
+            self._last_run = datetime.utcnow()
+            self._last_duration = time.perf_counter() - started
+            self._last_deleted = deleted
+        if deleted:
+            logger.info(f"Expired {deleted} history records older than {cutoff}")
+        return deleted
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_age_days": self.max_age_days,
+            "ttl_index": self.ttl_index,
+            "archive_segment": self.archive.path if self.archive else None,
+            "runs": self._runs,
+            "failed_runs": self._failures,
+            "archived_records": self._archived,
+            "deleted_records": self._deleted,
+            "expired_rollups": self._expired_rollups,
+            "last_run": self._last_run.isoformat() if self._last_run else None,
+            "last_duration": round(self._last_duration, 4),
+            "last_deleted": self._last_deleted,
+        }
@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta
+import pytest
+from src.analytics.service import AnalyticsService, distance_bucket
+
+
+def query(address1, address2, kilometers, timestamp=None):
+    return {
+        "address1": address1.title(),
+        "address2": address2.title(),
+        "address1_key": address1,
+        "address2_key": address2,
+        "kilometers": kilometers,
+        "timestamp": timestamp or datetime.utcnow(),
+    }
+
+
+def test_distance_bucket_uses_lower_bounds():
+    assert distance_bucket(0.4) == 0
+    assert distance_bucket(1) == 1
+    assert distance_bucket(3935) == 2500
+    assert distance_bucket(30000) == 20000
+
+
+@pytest.mark.asyncio
+async def test_record_coalesces_increments_into_one_bulk_upsert(database_client):
+    service = AnalyticsService(database_client)
+    service.start()
+
+    await service.record(
+        [
+            query("new york", "chicago", 1145.0),
+            query("chicago", "new york", 1145.0),
+            query("boston", "chicago", 1366.0),
+        ]
+    )
+    assert database_client.called("increment_many") == []
+
+    await service.close()
+
+    # One day, two pairs, two pair-days and one distance bucket.
+    increments = database_client.called("increment_many")
+    assert [len(call["updates"]) for call in increments] == [6]
+
+
+@pytest.mark.asyncio
+async def test_stats_are_read_from_rollups(database_client):
+    service = AnalyticsService(database_client)
+    today = datetime.utcnow()
+    last_month = today - timedelta(days=40)
+
+    await service.record(
+        [
+            query("new york", "chicago", 1145.0),
+            query("chicago", "new york", 1147.0),
+            query("boston", "chicago", 1366.0),
+            query("boston", "chicago", 1366.0, last_month),
+            query("boston", "chicago", 1366.0, last_month),
+        ]
+    )
+
+    daily = await service.daily_counts(days=7)
+    assert [(day.day, day.count) for day in daily.days] == [
+        (today.date().isoformat(), 3)
+    ]
+
+    all_time = await service.top_routes(limit=1)
+    assert [(r.address2, r.count) for r in all_time.routes] == [("Chicago", 3)]
+    assert all_time.routes[0].average_kilometers == 1366.0
+
+    this_week = await service.top_routes(limit=2, days=7)
+    assert [route.count for route in this_week.routes] == [2, 1]
+    assert this_week.routes[0].address1 == "New York"
+
+    histogram = await service.distance_histogram()
+    counts = {bucket.min_km: bucket.count for bucket in histogram.buckets}
+    assert counts[1000] == 5
+    assert sum(counts.values()) == 5
+    assert histogram.buckets[-1].max_km is None
+
+    finds = database_client.called("find_many")
+    assert all(call["filters"]["kind"] for call in finds)
+
+
+@pytest.mark.asyncio
+async def test_recent_top_routes_read_a_bounded_number_of_pairs_per_day(
+    database_client,
+):
+    service = AnalyticsService(database_client, route_candidates=2)
+    yesterday = datetime.utcnow() - timedelta(days=1)
+
+    await service.record(
+        [query("new york", "chicago", 1145.0)] * 3
+        + [query("boston", "chicago", 1366.0)] * 2
+        + [query("austin", "dallas", 293.0)]
+        + [query("austin", "dallas", 293.0, yesterday)] * 4
+    )
+
+    routes = await service.top_routes(limit=1, days=2)
+
+    assert [(r.address1, r.count) for r in routes.routes] == [("Austin", 4)]
+    day_finds = [
+        call for call in database_client.called("find_many") if "day" in call["filters"]
+    ]
+    assert len(day_finds) == 2
+
+
+@pytest.mark.asyncio
+async def test_expire_drops_daily_rollups_only(database_client):
+    service = AnalyticsService(database_client)
+    today = datetime.utcnow()
+
+    await service.record(
+        [
+            query("boston", "chicago", 1366.0, today - timedelta(days=40)),
+            query("boston", "chicago", 1366.0, today),
+        ]
+    )
+
+    assert await service.expire(today - timedelta(days=30)) == 2
+    assert (await service.daily_counts(days=60)).days[0].count == 1
+    assert (await service.top_routes()).routes[0].count == 2
@@ -0,0 +1,67 @@
+import pytest
+from src.core.clients.cache.sqlite import SQLiteCacheClient
+from src.core.clients.geocoding.base import GeocodingClient
+from src.core.clients.geocoding.cached import CachedGeocodingClient
+from src.distance.schemas import GeoLocation
+
+
+class CountingGeocodingClient(GeocodingClient):
+    def __init__(self):
+        self.calls = 0
+
+    async def geocode(self, address: str) -> GeoLocation:
+        self.calls += 1
+        return GeoLocation(latitude=40.7128, longitude=-74.0060, address=address)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    client = SQLiteCacheClient(str(tmp_path / "cache.sqlite3"), maxsize=2, ttl=60)
+    yield client
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_set_and_get(cache):
+    await cache.set("key", {"value": 1}, "test")
+    assert await cache.get("key", "test") == {"value": 1}
+    assert await cache.get("key", "other") is None
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_missed(cache):
+    await cache.set("key", {"value": 1}, "test", ttl=-1)
+    assert await cache.get("key", "test") is None
+
+
+@pytest.mark.asyncio
+async def test_shared_between_instances(cache, tmp_path):
+    await cache.set("key", {"value": 1}, "test")
+    other = SQLiteCacheClient(str(tmp_path / "cache.sqlite3"))
+    assert await other.get("key", "test") == {"value": 1}
+    other.close()
+
+
+@pytest.mark.asyncio
+async def test_size_bound_eviction(tmp_path):
+    cache = SQLiteCacheClient(
+        str(tmp_path / "cache.sqlite3"), maxsize=2, evict_interval=1
+    )
+    for index in range(5):
+        await cache.set(f"key{index}", index, "test", ttl=60 + index)
+
+    assert await cache.get("key0", "test") is None
+    assert await cache.get("key4", "test") == 4
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_cached_geocoding_client_reuses_results(cache):
+    inner = CountingGeocodingClient()
+    client = CachedGeocodingClient(inner, cache)
+
+    first = await client.geocode("New York, NY")
+    second = await client.geocode("new york,  NY ")
+
+    assert first == second
+    assert inner.calls == 1
@@ -0,0 +1,71 @@
+from typing import Any, Dict, List, Tuple
+import pytest
+from src.core.clients.database.sqlite import SQLiteDatabase, SQLiteDatabaseClient
+
+
+class RecordingDatabaseClient(SQLiteDatabaseClient):
+    """
+    SQLite client on a temporary file that also records the calls tests
+    assert on, by method name with their arguments. The next ``failures``
+    calls to create_many fail as if the database were unavailable.
+    """
+
+    def __init__(self, database: SQLiteDatabase, collection: str = "queries"):
+        super().__init__(database, collection)
+        self.calls: List[Tuple[str, Dict[str, Any]]] = []
+        self.failures = 0
+        self.closed = False
+
+    def called(self, method: str) -> List[Dict[str, Any]]:
+        """The arguments of every call to ``method``, in order."""
+        return [arguments for name, arguments in self.calls if name == method]
+
+    async def create(self, data):
+        self.calls.append(("create", {"data": data}))
+        return await super().create(data)
+
+    async def create_many(self, data):
+        self.calls.append(("create_many", {"data": data}))
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("database unavailable")
+        return await super().create_many(data)
+
+    async def find_many(self, **kwargs):
+        self.calls.append(("find_many", kwargs))
+        return await super().find_many(**kwargs)
+
+    async def delete_many(self, filters):
+        self.calls.append(("delete_many", {"filters": filters}))
+        return await super().delete_many(filters)
+
+    async def increment_many(self, updates):
+        self.calls.append(("increment_many", {"updates": updates}))
+        await super().increment_many(updates)
+
+    async def estimated_count(self):
+        self.calls.append(("estimated_count", {}))
+        return await super().estimated_count()
+
+    async def ensure_indexes(self, indexes):
+        self.calls.append(("ensure_indexes", {"indexes": indexes}))
+        await super().ensure_indexes(indexes)
+
+    async def drop_indexes(self, names):
+        self.calls.append(("drop_indexes", {"names": names}))
+        await super().drop_indexes(names)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def sqlite_database(tmp_path):
+    database = SQLiteDatabase(str(tmp_path / "test.sqlite3"))
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def database_client(sqlite_database) -> RecordingDatabaseClient:
+    return RecordingDatabaseClient(sqlite_database)
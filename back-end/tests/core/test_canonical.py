@@ -0,0 +1,61 @@
+import pytest
+from src.core.canonical import AddressCanonicalizer
+
+
+@pytest.fixture
+def canonicalizer():
+    return AddressCanonicalizer({"nyc": "new york city", "big apple": "new york"})
+
+
+def test_variants_share_one_canonical_form(canonicalizer):
+    variants = ["New York, NY", "new york ny", "New York,  NY ", "NEW YORK, N.Y."]
+    assert {canonicalizer(variant) for variant in variants} == {
+        "new york new york"
+    }
+
+
+def test_unicode_is_normalized(canonicalizer):
+    assert canonicalizer("São Paulo") == canonicalizer("sao paulo")
+    assert canonicalizer("Ｍain Ｓt") == "main street"
+
+
+def test_street_abbreviations_are_expanded(canonicalizer):
+    assert canonicalizer("123 Main St., Springfield") == "123 main street springfield"
+    assert canonicalizer("5th Ave") == "5th avenue"
+
+
+def test_region_codes_only_expand_in_region_slot(canonicalizer):
+    assert canonicalizer("Maple Ct, Hartford, CT") == "maple court hartford connecticut"
+    assert canonicalizer("Portland, OR 97201") == "portland oregon 97201"
+    assert canonicalizer("Los Angeles, CA, USA") == "los angeles california united states"
+    assert canonicalizer("In Town") == "in town"
+
+
+def test_street_suffixes_are_not_read_as_regions(canonicalizer):
+    assert canonicalizer("10 Main Ct") == "10 main court"
+    assert canonicalizer("100 Main St NE") == "100 main street northeast"
+    assert canonicalizer("100 Main St NE, Atlanta, GA") == (
+        "100 main street northeast atlanta georgia"
+    )
+    assert canonicalizer("Tampa, FL") == "tampa florida"
+
+
+def test_leading_st_is_saint(canonicalizer):
+    assert canonicalizer("St Louis, MO") == "saint louis missouri"
+    assert canonicalizer("12 St Marks Pl, New York, NY") == (
+        "12 saint marks place new york new york"
+    )
+    assert canonicalizer("5th St") == "5th street"
+
+
+def test_synonyms(canonicalizer):
+    assert canonicalizer("NYC") == "new york city"
+    assert canonicalizer("The Big Apple") == "the new york"
+
+
+def test_prefix_does_not_expand_a_partial_last_word(canonicalizer):
+    assert canonicalizer.prefix("Main S") == "main s"
+    assert canonicalizer.prefix("St Lou") == "saint lou"
+    assert canonicalizer.prefix("123 Main St., Spring") == "123 main street spring"
+    assert canonicalizer.prefix("Main St ") == "main street"
+    assert canonicalizer.prefix("") == ""
@@ -0,0 +1,86 @@
+import asyncio
+import pytest
+from bson import ObjectId
+from src.core.clients.database.buffered import BufferedDatabaseClient
+
+
+def bulk_writes(store):
+    return [len(call["data"]) for call in store.called("create_many")]
+
+
+@pytest.mark.asyncio
+async def test_create_returns_id_before_the_write(database_client):
+    store = database_client
+    client = BufferedDatabaseClient(store, flush_size=10, flush_interval=60)
+    client.start()
+
+    record_id = await client.create({"kilometers": 1.0})
+
+    assert ObjectId.is_valid(record_id)
+    assert await store.count() == 0
+    assert client.stats()["pending"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_flushes_in_bulk_when_size_threshold_is_reached(database_client):
+    store = database_client
+    client = BufferedDatabaseClient(store, flush_size=3, flush_interval=60)
+    client.start()
+
+    ids = [await client.create({"index": index}) for index in range(3)]
+    await asyncio.sleep(0.01)
+
+    assert bulk_writes(store) == [3]
+    assert store.called("create") == []
+    records = await store.find_many(limit=0)
+    assert sorted(record["_id"] for record in records) == sorted(ids)
+    assert client.stats()["flushed_records"] == 3
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_interval_elapses(database_client):
+    store = database_client
+    client = BufferedDatabaseClient(store, flush_size=100, flush_interval=0.01)
+    client.start()
+
+    await client.create({"index": 0})
+    await asyncio.sleep(0.05)
+
+    assert bulk_writes(store) == [1]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_reads_see_pending_writes(database_client):
+    store = database_client
+    client = BufferedDatabaseClient(store, flush_size=100, flush_interval=60)
+    client.start()
+
+    record_id = await client.create({"index": 0})
+
+    assert await client.count() == 1
+    assert (await client.find_by_id(record_id))["index"] == 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_is_retried_and_close_drains_the_buffer(database_client):
+    store = database_client
+    store.failures = 1
+    client = BufferedDatabaseClient(store, flush_size=100, flush_interval=60)
+    client.start()
+
+    await client.create_many([{"index": 0}, {"index": 1}])
+    with pytest.raises(ConnectionError):
+        await client.flush()
+    assert client.stats()["pending"] == 2
+    assert client.stats()["failed_flushes"] == 1
+
+    await client.close()
+
+    # The failed write is retried with the same records.
+    assert bulk_writes(store) == [2, 2]
+    assert await store.count() == 2
+    assert store.closed
@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta
+import pytest
+from src.core.clients.database.lease import Lease
+from src.core.clients.database.sqlite import SQLiteDatabase, SQLiteDatabaseClient
+
+
+@pytest.fixture
+def leases(tmp_path):
+    database = SQLiteDatabase(str(tmp_path / "test.sqlite3"))
+    yield SQLiteDatabaseClient(database, "leases")
+    database.close()
+
+
+@pytest.mark.asyncio
+async def test_one_process_holds_the_lease_at_a_time(leases):
+    first, second = Lease(leases, "retention"), Lease(leases, "retention")
+
+    assert await first.acquire()
+    assert await first.acquire()
+    assert not await second.acquire()
+
+    await first.release()
+    assert await second.acquire()
+    assert not await first.acquire()
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_taken_over(leases):
+    first, second = Lease(leases, "retention"), Lease(leases, "retention")
+    await first.acquire()
+    await leases.update(
+        "retention", {"expires": datetime.utcnow() - timedelta(seconds=1)}
+    )
+
+    assert await second.acquire()
+    assert not await first.acquire()
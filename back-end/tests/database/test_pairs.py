@@ -0,0 +1,130 @@
+from datetime import datetime
+import pytest
+from bson import ObjectId
+from src.core.clients.database.base import Upsert
+from src.core.clients.database.mongodb import update_document, upsert_filter
+from src.core.clients.database.pairs import PairDatabaseClient, pair_id
+from src.core.clients.database.sqlite import SQLiteDatabase, SQLiteDatabaseClient
+from src.history.schemas import HistoryFilters
+from src.history.service import HistoryService
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = SQLiteDatabase(str(tmp_path / "test.sqlite3"))
+    yield database
+    database.close()
+
+
+def query(address1: str, address2: str, minute: int, ip_address: str = "1.1.1.1"):
+    return {
+        "kilometers": 12.5,
+        "miles": 7.77,
+        "address1": address1.title(),
+        "address2": address2.title(),
+        "address1_key": address1,
+        "address2_key": address2,
+        "coordinates": {"point1": [1.0, 2.0], "point2": [3.0, 4.0]},
+        "timestamp": datetime(2024, 1, 1, 12, minute),
+        "ip_address": ip_address,
+    }
+
+
+def test_pair_id_ignores_direction():
+    assert pair_id("a street", "b road") == pair_id("b road", "a street")
+    assert pair_id("a street", "b road") != pair_id("a street", "c lane")
+
+
+def test_update_document_maps_to_mongodb_operators():
+    update = Upsert(
+        "pair",
+        increment={"hits": 2},
+        set={"kilometers": 1.5},
+        minimum={"first_seen": 1},
+        push={"recent": [{"ip_address": "1.1.1.1"}]},
+        push_limit=5,
+    )
+
+    assert update_document(update) == {
+        "$inc": {"hits": 2},
+        "$set": {"kilometers": 1.5},
+        "$min": {"first_seen": 1},
+        "$push": {"recent": {"$each": [{"ip_address": "1.1.1.1"}], "$slice": -5}},
+    }
+
+
+@pytest.mark.asyncio
+async def test_queries_are_stored_once_per_pair(database):
+    client = PairDatabaseClient(
+        SQLiteDatabaseClient(database, "query_pairs"), recent_limit=2
+    )
+
+    ids = await client.create_many(
+        [
+            query("a street", "b road", 1, "1.1.1.1"),
+            query("b road", "a street", 2, "2.2.2.2"),
+        ]
+    )
+    last_id = await client.create(query("a street", "b road", 3, "3.3.3.3"))
+    await client.create(query("a street", "c lane", 0))
+
+    assert len(set(ids + [last_id])) == 3
+    assert await client.count() == 2
+    pair = await client.find_by_id(pair_id("a street", "b road"))
+    assert pair["hits"] == 3
+    assert pair["address1"] == "A Street"
+    assert pair["first_seen"] == datetime(2024, 1, 1, 12, 1)
+    assert pair["last_seen"] == datetime(2024, 1, 1, 12, 3)
+    assert pair["last_query_id"] == last_id
+    assert [entry["ip_address"] for entry in pair["recent"]] == [
+        "2.2.2.2",
+        "3.3.3.3",
+    ]
+
+
+def test_upsert_filter_skips_records_matching_unless():
+    update = Upsert("pair", unless={"recent.query_id": {"$in": ["q1"]}})
+
+    assert upsert_filter(update) == {
+        "_id": "pair",
+        "$nor": [{"recent.query_id": {"$in": ["q1"]}}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_retried_writes_are_not_counted_twice(database):
+    client = PairDatabaseClient(SQLiteDatabaseClient(database, "query_pairs"))
+    records = [
+        {**query("a street", "b road", 1), "_id": ObjectId()},
+        {**query("c lane", "d way", 2), "_id": ObjectId()},
+    ]
+    await client.create_many(records[:1])
+
+    # The first pair was written before a failure; the retry has both.
+    await client.create_many(records)
+    await client.create_many(records)
+
+    assert (await client.find_by_id(pair_id("a street", "b road")))["hits"] == 1
+    assert (await client.find_by_id(pair_id("c lane", "d way")))["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_history_lists_pairs_by_latest_query(database):
+    client = PairDatabaseClient(SQLiteDatabaseClient(database, "query_pairs"))
+    await client.create(query("a street", "b road", 1))
+    await client.create(query("c lane", "d way", 2, "2.2.2.2"))
+    await client.create(query("a street", "b road", 3))
+    service = HistoryService(client, pairs=True)
+
+    first = await service.get_history_page(page_size=1)
+    second = await service.get_history_page(after=first.cursor["next"], page_size=1)
+    by_ip = await service.get_history(filters=HistoryFilters(ip_address="2.2.2.2"))
+    since = await service.get_history(
+        filters=HistoryFilters(since=datetime(2024, 1, 1, 12, 3))
+    )
+
+    assert [(row.address1, row.hits) for row in first.items] == [("A Street", 2)]
+    assert [(row.address1, row.hits) for row in second.items] == [("C Lane", 1)]
+    assert second.cursor["next"] is None
+    assert [row.address1 for row in by_ip.items] == ["C Lane"]
+    assert [row.address1 for row in since.items] == ["A Street"]
@@ -0,0 +1,74 @@
+import os
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+from src.core.clients.database.mongodb import MongoDBClient
+from src.core.dependencies import ensure_indexes
+from src.monitoring.plans import QUERY_SHAPES, check_plan, verify_query_plans
+
+INDEXED_PLAN = {
+    "queryPlanner": {
+        "winningPlan": {
+            "stage": "LIMIT",
+            "inputStage": {
+                "stage": "FETCH",
+                "inputStage": {"stage": "IXSCAN", "indexName": "address1_id"},
+            },
+        }
+    }
+}
+
+SCAN_AND_SORT_PLAN = {
+    "queryPlanner": {
+        "winningPlan": {
+            "queryPlan": {
+                "stage": "SORT",
+                "inputStage": {"stage": "COLLSCAN"},
+            }
+        }
+    }
+}
+
+
+def test_check_plan_accepts_index_scans():
+    result = check_plan(INDEXED_PLAN)
+
+    assert result["stages"] == ["LIMIT", "FETCH", "IXSCAN"]
+    assert result["indexes"] == ["address1_id"]
+    assert result["problems"] == []
+
+
+def test_check_plan_flags_collection_scans_and_memory_sorts():
+    result = check_plan(SCAN_AND_SORT_PLAN)
+
+    assert result["problems"] == ["COLLSCAN", "SORT"]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_declared_indexes_serve_every_query_shape():
+    client = AsyncIOMotorClient(
+        os.getenv("MONGODB_TEST_URL", "mongodb://localhost:27017"),
+        serverSelectionTimeoutMS=500,
+    )
+    try:
+        await client.admin.command("ping")
+    except Exception:
+        client.close()
+        pytest.skip("no local mongod")
+
+    queries = MongoDBClient(client)
+    try:
+        await ensure_indexes(lambda collection: MongoDBClient(client, collection))
+        # A non-empty collection so the planner has something to choose.
+        record_id = await queries.create({"address1": "a", "address2": "b"})
+        report = await verify_query_plans(
+            lambda collection: MongoDBClient(client, collection)
+        )
+        await queries.delete_many({"_id": record_id})
+    finally:
+        client.close()
+
+    assert set(report) == {shape.name for shape in QUERY_SHAPES}
+    assert {name: result["problems"] for name, result in report.items()} == {
+        shape.name: [] for shape in QUERY_SHAPES
+    }
@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+from src.core.clients.database.pool import PoolStatsListener
+
+PRIMARY = SimpleNamespace(address=("db1", 27017))
+SECONDARY = SimpleNamespace(address=("db2", 27017))
+
+
+def test_pool_stats_track_in_use_and_available_connections():
+    listener = PoolStatsListener()
+
+    for _ in range(3):
+        listener.connection_created(PRIMARY)
+    for _ in range(2):
+        listener.connection_check_out_started(PRIMARY)
+        listener.connection_checked_out(PRIMARY)
+    listener.connection_check_out_started(PRIMARY)
+    listener.connection_checked_in(PRIMARY)
+
+    stats = listener.stats()["db1:27017"]
+    assert stats["open"] == 3
+    assert stats["in_use"] == 1
+    assert stats["available"] == 2
+    assert stats["waiting"] == 1
+    assert stats["checked_out"] == 2
+
+
+def test_pool_stats_are_kept_per_server():
+    listener = PoolStatsListener()
+
+    listener.connection_created(PRIMARY)
+    listener.connection_created(SECONDARY)
+    listener.connection_closed(SECONDARY)
+    listener.connection_check_out_started(SECONDARY)
+    listener.connection_check_out_failed(SECONDARY)
+
+    stats = listener.stats()
+    assert stats["db1:27017"]["open"] == 1
+    assert stats["db2:27017"]["open"] == 0
+    assert stats["db2:27017"]["waiting"] == 0
+    assert stats["db2:27017"]["check_out_failures"] == 1
@@ -0,0 +1,162 @@
+from datetime import datetime
+import pytest
+from src.core.clients.database.sqlite import SQLiteDatabase, SQLiteDatabaseClient
+from src.history.schemas import HistoryFilters
+from src.history.service import HistoryService
+from src.monitoring.plans import QUERY_SHAPES, verify_query_plans
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = SQLiteDatabase(str(tmp_path / "test.sqlite3"))
+    yield database
+    database.close()
+
+
+def query(index: int, **fields):
+    record = {
+        "kilometers": float(index),
+        "miles": float(index) * 0.621371,
+        "address1": f"{index} Main Street Springfield",
+        "address2": f"{index} Elm Road Shelbyville",
+        "address1_key": f"{index} main street springfield",
+        "address2_key": f"{index} elm road shelbyville",
+        "coordinates": {"address1": {"lat": 1.0, "lon": 2.0}},
+        "timestamp": datetime(2024, 1, index + 1, 12, 30, 15, 250),
+        "ip_address": "203.0.113.7" if index % 2 else "198.51.100.1",
+    }
+    record.update(fields)
+    return record
+
+
+@pytest.mark.asyncio
+async def test_records_round_trip(database):
+    client = SQLiteDatabaseClient(database)
+
+    record_id = await client.create(query(1))
+    record = await client.find_by_id(record_id)
+
+    assert record == {"_id": record_id, **query(1)}
+    assert await client.find_by_id("0" * 24) is None
+
+
+@pytest.mark.asyncio
+async def test_retried_records_are_not_written_twice(database):
+    client = SQLiteDatabaseClient(database)
+    records = [query(index, _id=f"{index:024d}") for index in range(3)]
+
+    await client.create_many(records)
+    await client.create_many(records)
+
+    assert await client.count() == 3
+
+
+@pytest.mark.asyncio
+async def test_find_many_sorts_pages_and_projects(database):
+    client = SQLiteDatabaseClient(database)
+    await client.create_many([query(index) for index in range(5)])
+
+    records = await client.find_many(
+        skip=1,
+        limit=2,
+        sort_by="kilometers",
+        sort_order="asc",
+        projection=["kilometers"],
+    )
+
+    assert [record["kilometers"] for record in records] == [1.0, 2.0]
+    assert set(records[0]) == {"_id", "kilometers"}
+    assert len(await client.find_many(limit=0)) == 5
+
+
+@pytest.mark.asyncio
+async def test_filters_follow_mongodb_semantics(database):
+    client = SQLiteDatabaseClient(database)
+    await client.create_many([query(index) for index in range(5)])
+
+    assert await client.count({"kilometers": {"$gte": 1, "$lt": 3}}) == 2
+    assert await client.count({"timestamp": {"$gt": datetime(2024, 1, 3)}}) == 3
+    assert await client.count({"ip_address": {"$in": ["203.0.113.7"]}}) == 2
+    assert await client.count({"ip_address": {"$ne": "203.0.113.7"}}) == 3
+    assert await client.count({"address1_key": {"$regex": "^3 main"}}) == 1
+    assert await client.count({"address1_key": {"$regex": "main.*field$"}}) == 5
+    assert await client.count({"$or": [{"kilometers": 0}, {"kilometers": 4}]}) == 2
+    assert await client.count({"missing": None}) == 5
+
+
+@pytest.mark.asyncio
+async def test_text_search_matches_any_word_and_follows_updates(database):
+    client = SQLiteDatabaseClient(database)
+    ids = await client.create_many([query(index) for index in range(3)])
+
+    assert await client.count({"$text": {"$search": "springfield nowhere"}}) == 3
+
+    await client.update(ids[0], {"address1": "Oak Avenue", "address2": "Pine"})
+    await client.delete_many({"_id": ids[1]})
+
+    assert await client.count({"$text": {"$search": "springfield"}}) == 1
+    assert await client.count({"$text": {"$search": "oak"}}) == 1
+
+
+@pytest.mark.asyncio
+async def test_increment_many_upserts_counters(database):
+    client = SQLiteDatabaseClient(database, "rollups")
+
+    await client.increment_many([("day:2024-01-01", {"count": 1}, {"kind": "day"})])
+    await client.increment_many(
+        [("day:2024-01-01", {"count": 2, "kilometers": 5.5}, {"kind": "day"})]
+    )
+
+    assert await client.find_by_id("day:2024-01-01") == {
+        "_id": "day:2024-01-01",
+        "kind": "day",
+        "count": 3,
+        "kilometers": 5.5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_if_only_updates_matching_records(database):
+    client = SQLiteDatabaseClient(database, "jobs")
+    job_id = await client.create({"status": "running", "lease_until": None})
+    claim = {"$or": [{"status": "pending"}, {"lease_until": None}]}
+
+    assert await client.update_if(job_id, claim, {"owner": "a", "lease_until": 1})
+    assert not await client.update_if(job_id, claim, {"owner": "b"})
+    assert not await client.update_if("0" * 24, claim, {"owner": "b"})
+    assert (await client.find_by_id(job_id))["owner"] == "a"
+
+
+@pytest.mark.asyncio
+async def test_history_pagination_and_filters(database):
+    client = SQLiteDatabaseClient(database)
+    await client.create_many([query(index) for index in range(5)])
+    service = HistoryService(client)
+
+    first = await service.get_history_page(page_size=2, include_total=True)
+    second = await service.get_history_page(after=first.cursor["next"], page_size=2)
+    back = await service.get_history_page(before=second.cursor["previous"], page_size=2)
+    filtered = await service.get_history(
+        page_size=10,
+        filters=HistoryFilters(address="3 main", ip_address="203.0.113.7"),
+    )
+
+    assert [row.kilometers for row in first.items] == [4.0, 3.0]
+    assert first.cursor["total"] == 5
+    assert [row.kilometers for row in second.items] == [2.0, 1.0]
+    assert back.items == first.items
+    assert [row.kilometers for row in filtered.items] == [3.0]
+    assert filtered.pagination["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_declared_indexes_serve_every_query_shape(database):
+    report = await verify_query_plans(
+        lambda collection: SQLiteDatabaseClient(database, collection)
+    )
+
+    assert set(report) == {shape.name for shape in QUERY_SHAPES}
+    assert {name: result["problems"] for name, result in report.items()} == {
+        shape.name: [] for shape in QUERY_SHAPES
+    }
+    assert report["history_ip"]["indexes"] == ["queries_ip_address_id"]
@@ -0,0 +1,125 @@
+import pytest
+from src.core.clients.geocoding.base import GeocodingClient
+from src.core.clients.geocoding.exceptions import AddressNotFoundError
+from src.core.clients.geocoding.scheduler import Priority, geocode_priority
+from src.distance.schemas import GeoLocation, MatrixResponse
+from src.distance.service import DistanceService
+
+LOCATIONS = {
+    "New York, NY": (40.7128, -74.0060),
+    "Los Angeles, CA": (34.0522, -118.2437),
+    "Chicago, IL": (41.8781, -87.6298),
+}
+
+
+class MockGeocodingClient(GeocodingClient):
+    def __init__(self):
+        self.calls = []
+        self.priorities = set()
+
+    async def geocode(self, address: str) -> GeoLocation:
+        self.calls.append(address)
+        self.priorities.add(geocode_priority.get())
+        if address not in LOCATIONS:
+            raise AddressNotFoundError(f"No results found for address: {address}")
+        latitude, longitude = LOCATIONS[address]
+        return GeoLocation(latitude=latitude, longitude=longitude, address=address)
+
+
+@pytest.mark.asyncio
+async def test_batch_geocodes_each_unique_address_once(database_client):
+    geocoding_client = MockGeocodingClient()
+    service = DistanceService(geocoding_client, database_client)
+
+    results = await service.calculate_batch(
+        [
+            ("New York, NY", "Los Angeles, CA"),
+            ("new york ny", "Chicago, IL"),
+            ("Chicago, IL", "Los Angeles, CA"),
+        ]
+    )
+
+    assert len(geocoding_client.calls) == 3
+    assert geocoding_client.priorities == {Priority.BATCH}
+    assert len(database_client.called("create_many")) == 1
+    stored = await database_client.find_many(limit=0)
+    assert {item.result.query_id for item in results} == {
+        record["_id"] for record in stored
+    }
+    assert results[0].result.kilometers == pytest.approx(3944, rel=0.01)
+    assert results[0].result.miles == pytest.approx(
+        results[0].result.kilometers * 0.621371, rel=0.001
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_errors_per_pair(database_client):
+    service = DistanceService(MockGeocodingClient(), database_client)
+
+    results = await service.calculate_batch(
+        [("Atlantis", "Los Angeles, CA"), ("New York, NY", "Chicago, IL")]
+    )
+
+    assert results[0].result is None
+    assert "No results found" in results[0].errors[0]
+    stored = await database_client.find_many(limit=0)
+    assert [record["_id"] for record in stored] == [results[1].result.query_id]
+
+
+@pytest.mark.asyncio
+async def test_batch_records_requester_and_searchable_address_keys(database_client):
+    service = DistanceService(MockGeocodingClient(), database_client)
+
+    await service.calculate_batch(
+        [("New York, NY", "Chicago, IL")], ip_address="203.0.113.7"
+    )
+
+    [record] = await database_client.find_many(limit=0)
+    assert record["ip_address"] == "203.0.113.7"
+    assert record["address1_key"] == "new york new york"
+    assert record["address2_key"] == "chicago illinois"
+    assert record["timestamp"] is not None
+
+
+@pytest.mark.asyncio
+async def test_matrix_is_row_major_with_gaps_for_failures(database_client):
+    geocoding_client = MockGeocodingClient()
+    service = DistanceService(geocoding_client, database_client)
+
+    matrix = await service.calculate_matrix(
+        ["New York, NY", "Atlantis"],
+        ["Los Angeles, CA", "Chicago, IL", "new york ny"],
+        units="miles",
+    )
+
+    assert len(geocoding_client.calls) == 4
+    assert (matrix.rows, matrix.columns) == (2, 3)
+    assert len(matrix.distances) == 6
+    assert matrix.distances[0] == pytest.approx(2445, rel=0.01)
+    assert matrix.distances[2] == 0
+    assert matrix.distances[3:] == [None, None, None]
+    assert matrix.origins[1] is None
+    assert "Atlantis" in matrix.errors
+    rendered = MatrixResponse.model_validate_json(matrix.to_json())
+    assert rendered.distances == matrix.distances
+    assert rendered.origins[0].latitude == 40.7128
+
+
+@pytest.mark.asyncio
+async def test_stream_processes_pairs_in_chunks(database_client):
+    service = DistanceService(MockGeocodingClient(), database_client)
+
+    async def pairs():
+        yield 1, "New York, NY", "Los Angeles, CA"
+        yield 2, "Invalid row: Expected two columns"
+        yield 3, "Chicago, IL", "Atlantis"
+        yield 4, "Chicago, IL", "New York, NY"
+
+    results = [
+        result async for result in service.stream_distances(pairs(), chunk_size=2)
+    ]
+
+    assert [result["line"] for result in results] == [2, 1, 3, 4]
+    assert results[1]["result"]["kilometers"] > 0
+    assert "No results found" in results[2]["errors"][0]
+    assert len(database_client.called("create_many")) == 2
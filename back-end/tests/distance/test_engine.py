@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from geopy.distance import geodesic
+from src.distance import engine
+from src.distance.engine import MILES_PER_KM, DistanceMode
+
+rng = np.random.default_rng(0)
+ORIGINS = np.column_stack([rng.uniform(-85, 85, 40), rng.uniform(-180, 180, 40)])
+DESTINATIONS = np.column_stack([rng.uniform(-85, 85, 40), rng.uniform(-180, 180, 40)])
+REFERENCE = np.array(
+    [geodesic(tuple(a), tuple(b)).kilometers for a, b in zip(ORIGINS, DESTINATIONS)]
+)
+
+
+def test_vincenty_matches_geopy():
+    distances = engine.pairwise(ORIGINS, DESTINATIONS, DistanceMode.VINCENTY)
+
+    assert np.allclose(distances, REFERENCE, rtol=1e-9, atol=1e-6)
+
+
+def test_haversine_is_within_half_a_percent_of_geopy():
+    distances = engine.pairwise(ORIGINS, DESTINATIONS, DistanceMode.HAVERSINE)
+
+    assert np.all(np.abs(distances - REFERENCE) / REFERENCE < 0.005)
+
+
+def test_short_urban_distances():
+    times_square, empire_state = (40.7580, -73.9855), (40.7484, -73.9857)
+    reference = geodesic(times_square, empire_state).kilometers
+
+    for mode in DistanceMode:
+        assert engine.distance(times_square, empire_state, mode) == pytest.approx(
+            reference, rel=0.005
+        )
+
+
+def test_nearly_antipodal_points_fall_back_to_geopy():
+    point1, point2 = (0.0, 0.0), (0.5, 179.7)
+
+    assert engine.distance(point1, point2, DistanceMode.VINCENTY) == pytest.approx(
+        geodesic(point1, point2).kilometers
+    )
+
+
+@pytest.mark.parametrize("mode", list(DistanceMode))
+def test_scalar_pairwise_and_matrix_agree(mode):
+    matrix = engine.matrix(ORIGINS[:5], DESTINATIONS[:4], mode)
+    pairwise = engine.pairwise(ORIGINS[:4], DESTINATIONS[:4], mode)
+
+    assert matrix.shape == (5, 4)
+    assert np.allclose(np.diag(matrix[:4]), pairwise)
+    assert engine.distance(tuple(ORIGINS[0]), tuple(DESTINATIONS[0]), mode) == (
+        pytest.approx(pairwise[0])
+    )
+
+
+def test_nan_coordinates_propagate():
+    matrix = engine.matrix([(0.0, 0.0), (np.nan, np.nan)], [(0.0, 1.0)], DistanceMode.VINCENTY)
+
+    assert matrix[0, 0] == pytest.approx(111.32, rel=0.001)
+    assert np.isnan(matrix[1, 0])
+
+
+def test_miles_conversion():
+    assert MILES_PER_KM == pytest.approx(0.621371, rel=1e-6)
@@ -0,0 +1,56 @@
+import asyncio
+import time
+import numpy as np
+import pytest
+from src.distance import engine
+from src.distance.engine import DistanceMode
+from src.distance.executor import DistanceExecutor
+
+
+@pytest.fixture(scope="module")
+def executor():
+    executor = DistanceExecutor(workers=2, threshold=100)
+    executor.start()
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_large_matrix_is_offloaded(executor):
+    rng = np.random.default_rng(0)
+    origins = rng.uniform(-60, 60, (31, 2))
+    destinations = rng.uniform(-60, 60, (17, 2))
+
+    result = await executor.matrix(origins, destinations, DistanceMode.VINCENTY)
+
+    assert executor.stats()["offloaded"] == 1
+    assert np.allclose(
+        result, engine.matrix(origins, destinations, DistanceMode.VINCENTY)
+    )
+
+
+@pytest.mark.asyncio
+async def test_small_matrix_runs_inline(executor):
+    inline = executor.stats()["inline"]
+
+    await executor.matrix([(0.0, 0.0)], [(1.0, 1.0)], DistanceMode.HAVERSINE)
+
+    assert executor.stats()["inline"] == inline + 1
+
+
+@pytest.mark.asyncio
+async def test_event_loop_stays_responsive(executor):
+    origins = np.random.default_rng(1).uniform(-60, 60, (40, 2))
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    await executor.matrix(origins, origins, DistanceMode.GEOPY)
+    task.cancel()
+
+    assert len(ticks) > 1
+    assert max(np.diff(ticks), default=0) < 0.1
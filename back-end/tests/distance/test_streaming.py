@@ -0,0 +1,59 @@
+import pytest
+from src.distance.streaming import MAX_LINE_BYTES, parse_pairs, read_lines
+
+
+async def chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+@pytest.mark.asyncio
+async def test_lines_are_split_across_chunk_boundaries():
+    lines = await collect(read_lines(chunks(b"a,b\r\nc,", b"d\n", b"e,f")))
+
+    assert lines == ["a,b", "c,d", "e,f"]
+
+
+@pytest.mark.asyncio
+async def test_overlong_lines_are_reported():
+    lines = await collect(
+        read_lines(chunks(b"x" * (MAX_LINE_BYTES + 1), b"x\nShort,Line\n"))
+    )
+
+    assert lines == [None, "Short,Line"]
+
+
+@pytest.mark.asyncio
+async def test_csv_pairs_skip_header_and_report_bad_rows():
+    lines = chunks(
+        b"address1,address2\n"
+        b'"New York, NY","Los Angeles, CA"\n'
+        b"\n"
+        b"only one column\n"
+        b"Paris,DROP TABLE\n"
+    )
+
+    pairs = await collect(parse_pairs(read_lines(lines), "csv"))
+
+    assert pairs[0] == (2, "New York, NY", "Los Angeles, CA")
+    assert pairs[1][0] == 4 and "two columns" in pairs[1][1]
+    assert pairs[2][0] == 5 and "Invalid row" in pairs[2][1]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_pairs():
+    lines = chunks(
+        b'{"address1": "Paris", "address2": "Berlin"}\n'
+        b'{"address1": "Paris"}\n'
+        b"not json\n"
+    )
+
+    pairs = await collect(parse_pairs(read_lines(lines), "ndjson"))
+
+    assert pairs[0] == (1, "Paris", "Berlin")
+    assert [pair[0] for pair in pairs[1:]] == [2, 3]
+    assert all(len(pair) == 2 for pair in pairs[1:])
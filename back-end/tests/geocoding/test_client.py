@@ -1,43 +1,63 @@
+import httpx
 import pytest
-from unittest.mock import patch, AsyncMock
-from src.geocoding.client import NominatimClient
-from src.geocoding.exceptions import GeocodingError
+from src.core.clients.geocoding.client import NominatimClient
+from src.core.clients.geocoding.exceptions import (
+    GeocodingError,
+    RetryableGeocodingError,
+)
 
 
-@pytest.fixture
-def geocoding_client():
-    return NominatimClient()
+def make_client(handler) -> NominatimClient:
+    return NominatimClient(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        base_url="http://nominatim.test",
+    )
 
 
 @pytest.mark.asyncio
-async def test_successful_geocoding(geocoding_client):
-    mock_response = AsyncMock()
-    mock_response.json.return_value = [
-        {"lat": "40.7128", "lon": "-74.0060", "display_name": "New York, NY, USA"}
-    ]
-    mock_response.raise_for_status = AsyncMock()
+async def test_successful_geocoding():
+    def handler(request):
+        return httpx.Response(
+            200,
+            json=[
+                {
+                    "lat": "40.7128",
+                    "lon": "-74.0060",
+                    "display_name": "New York, NY, USA",
+                }
+            ],
+        )
+
+    result = await make_client(handler).geocode("New York, NY")
+
+    assert result.latitude == 40.7128
+    assert result.longitude == -74.0060
+    assert result.address == "New York, NY, USA"
 
-    with patch("httpx.AsyncClient.get", return_value=mock_response):
-        result = await geocoding_client.geocode("New York, NY")
 
-        assert result["latitude"] == 40.7128
-        assert result["longitude"] == -74.0060
-        assert result["address"] == "New York, NY, USA"
+@pytest.mark.asyncio
+async def test_no_results():
+    geocoding_client = make_client(lambda request: httpx.Response(200, json=[]))
+
+    with pytest.raises(GeocodingError, match="No results found"):
+        await geocoding_client.geocode("Invalid Address")
 
 
 @pytest.mark.asyncio
-async def test_no_results(geocoding_client):
-    mock_response = AsyncMock()
-    mock_response.json.return_value = []
-    mock_response.raise_for_status = AsyncMock()
+async def test_http_error():
+    def handler(request):
+        raise httpx.ConnectError("HTTP Error")
 
-    with patch("httpx.AsyncClient.get", return_value=mock_response):
-        with pytest.raises(GeocodingError, match="No results found"):
-            await geocoding_client.geocode("Invalid Address")
+    with pytest.raises(GeocodingError, match="Geocoding service error"):
+        await make_client(handler).geocode("New York, NY")
 
 
 @pytest.mark.asyncio
-async def test_http_error(geocoding_client):
-    with patch("httpx.AsyncClient.get", side_effect=Exception("HTTP Error")):
-        with pytest.raises(GeocodingError, match="Geocoding service error"):
-            await geocoding_client.geocode("New York, NY")
+async def test_rate_limited_response_is_retryable():
+    def handler(request):
+        return httpx.Response(429, headers={"Retry-After": "7"})
+
+    with pytest.raises(RetryableGeocodingError) as error:
+        await make_client(handler).geocode("New York, NY")
+
+    assert error.value.retry_after == 7
@@ -0,0 +1,104 @@
+import pytest
+from src.core.clients.geocoding.base import GeocodingClient
+from src.core.clients.geocoding.fuzzy import (
+    FuzzyAddressIndex,
+    FuzzyMatchGeocodingClient,
+    similarity,
+)
+from src.distance.schemas import GeoLocation
+
+
+def location(address: str) -> GeoLocation:
+    return GeoLocation(latitude=1.0, longitude=2.0, address=address)
+
+
+class CountingGeocodingClient(GeocodingClient):
+    def __init__(self):
+        self.calls = 0
+
+    async def geocode(self, address: str) -> GeoLocation:
+        self.calls += 1
+        return location(address)
+
+
+def test_similarity():
+    assert similarity("los angeles", "los angeles") == 1.0
+    assert similarity("los angles", "los angeles") == pytest.approx(1 - 1 / 11)
+    assert similarity("paris", "berlin", minimum=0.9) == 0.0
+
+
+def test_lookup_reuses_near_duplicates():
+    index = FuzzyAddressIndex(threshold=0.85)
+    index.insert("los angeles california", location("Los Angeles"))
+
+    assert index.lookup("los angles california").address == "Los Angeles"
+    assert index.lookup("san francisco california") is None
+
+
+def test_numbers_must_match_exactly():
+    index = FuzzyAddressIndex(threshold=0.85)
+    index.insert("10 main street boston", location("10 Main Street"))
+
+    assert index.lookup("12 main street boston") is None
+    assert index.lookup("10 mian street boston").address == "10 Main Street"
+
+
+def test_directionals_units_and_street_types_must_match():
+    index = FuzzyAddressIndex(threshold=0.8)
+    index.insert("100 n main street springfield", location("100 N Main Street"))
+    index.insert("5 ne 2nd avenue miami", location("5 NE 2nd Avenue"))
+    index.insert("10 elm street apt 4 boston", location("10 Elm Street Apt 4"))
+
+    assert index.lookup("100 s main street springfield") is None
+    assert index.lookup("5 nw 2nd avenue miami") is None
+    assert index.lookup("10 elm road apt 4 boston") is None
+    assert index.lookup("10 elm street unit 4 boston") is None
+    assert index.lookup("100 n mian street springfield").address == (
+        "100 N Main Street"
+    )
+
+
+def test_least_recently_used_entries_are_evicted():
+    index = FuzzyAddressIndex(max_entries=2)
+    index.insert("paris", location("Paris"))
+    index.insert("berlin", location("Berlin"))
+    index.lookup("paris")
+    index.insert("madrid", location("Madrid"))
+
+    assert len(index) == 2
+    assert index.lookup("berlin") is None
+    assert index.lookup("paris").address == "Paris"
+
+
+@pytest.mark.asyncio
+async def test_client_skips_upstream_for_typos():
+    inner = CountingGeocodingClient()
+    client = FuzzyMatchGeocodingClient(inner, FuzzyAddressIndex(threshold=0.85))
+
+    await client.geocode("Los Angeles, CA")
+    result = await client.geocode("Los Angles, CA")
+
+    assert inner.calls == 1
+    assert result.address == "Los Angeles, CA"
+    assert client.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+
+@pytest.mark.asyncio
+async def test_exact_cache_entry_beats_fuzzy_match(monkeypatch, tmp_path):
+    from src.core import dependencies
+    from src.core.clients.cache.sqlite import SQLiteCacheClient
+    from src.core.clients.geocoding.cached import CACHE_NAMESPACE, cache_key
+
+    inner = CountingGeocodingClient()
+    cache = SQLiteCacheClient(str(tmp_path / "geocode.db"))
+    monkeypatch.setattr(dependencies.settings, "GEOCODE_FUZZY_ENABLED", True)
+    monkeypatch.setattr(dependencies, "create_upstream_client", lambda: inner)
+    monkeypatch.setattr(dependencies, "get_geocode_cache", lambda: cache)
+    client = dependencies.create_geocoding_client("nominatim")
+
+    await client.geocode("Los Angeles, CA")
+    exact = location("Los Angles exactly")
+    await cache.set(cache_key("Los Angles, CA"), exact.model_dump(), CACHE_NAMESPACE)
+
+    assert (await client.geocode("Los Angles, CA")).address == "Los Angles exactly"
+    assert inner.calls == 1
@@ -0,0 +1,72 @@
+import pytest
+from src.core.clients.geocoding.base import GeocodingClient
+from src.core.clients.geocoding.exceptions import GeocodingError
+from src.core.clients.geocoding.gazetteer import (
+    GazetteerClient,
+    GazetteerIndex,
+    TieredGeocodingClient,
+)
+from src.distance.schemas import GeoLocation
+
+GAZETTEER = """name,lat,lon,display_name,importance
+New York,40.7128,-74.0060,"New York, New York, United States",0.9
+York,53.9590,-1.0815,"York, England, United Kingdom",0.6
+Paris,48.8566,2.3522,"Paris, France",0.9
+Paris,33.6609,-95.5555,"Paris, Texas, United States",0.4
+"""
+
+
+class RemoteGeocodingClient(GeocodingClient):
+    def __init__(self):
+        self.calls = 0
+
+    async def geocode(self, address: str) -> GeoLocation:
+        self.calls += 1
+        return GeoLocation(latitude=0.0, longitude=0.0, address="remote")
+
+
+@pytest.fixture
+def gazetteer_client(tmp_path):
+    path = tmp_path / "gazetteer.csv"
+    path.write_text(GAZETTEER)
+    return GazetteerClient(GazetteerIndex.from_csv(str(path)))
+
+
+@pytest.mark.asyncio
+async def test_every_name_token_must_match(gazetteer_client):
+    assert (await gazetteer_client.geocode("New York, NY")).latitude == 40.7128
+    assert (await gazetteer_client.geocode("York")).latitude == 53.9590
+
+
+@pytest.mark.asyncio
+async def test_candidates_are_ranked_by_coverage_then_importance(gazetteer_client):
+    assert (await gazetteer_client.geocode("Paris")).address == "Paris, France"
+    assert (
+        await gazetteer_client.geocode("Paris, Texas")
+    ).address == "Paris, Texas, United States"
+
+
+@pytest.mark.asyncio
+async def test_street_addresses_are_not_answered_locally(gazetteer_client):
+    with pytest.raises(GeocodingError):
+        await gazetteer_client.geocode("350 5th Ave, New York, NY")
+    with pytest.raises(GeocodingError):
+        await gazetteer_client.geocode("York Avenue, Pittsburgh")
+
+
+@pytest.mark.asyncio
+async def test_unknown_address(gazetteer_client):
+    with pytest.raises(GeocodingError, match="No results found"):
+        await gazetteer_client.geocode("Atlantis")
+
+
+@pytest.mark.asyncio
+async def test_tiered_client_falls_back_to_remote(gazetteer_client):
+    remote = RemoteGeocodingClient()
+    client = TieredGeocodingClient(gazetteer_client, remote)
+
+    assert (await client.geocode("Paris")).address == "Paris, France"
+    assert (await client.geocode("Atlantis")).address == "remote"
+    assert (await client.geocode("350 5th Ave, New York, NY")).address == "remote"
+    assert remote.calls == 2
+    assert client.stats() == {"local_hits": 1, "local_misses": 2}
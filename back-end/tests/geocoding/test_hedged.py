@@ -0,0 +1,121 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import httpx
+import pytest
+from src.core.clients.geocoding.client import NominatimClient
+from src.core.clients.geocoding.exceptions import AddressNotFoundError, GeocodingError
+from src.core.clients.geocoding.hedged import HedgedGeocodingClient
+
+
+def stub_server(name: str, delay: float = 0.0, status: int = 200, found: bool = True):
+    """Start a local Nominatim stub answering every search with ``name``."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(delay)
+            results = [{"lat": "1.0", "lon": "2.0", "display_name": name}]
+            body = json.dumps(results if found else [])
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(body.encode())
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+async def http_client():
+    async with httpx.AsyncClient(timeout=5) as client:
+        yield client
+
+
+@pytest.fixture
+def servers():
+    started = []
+
+    def start(*args, **kwargs):
+        server = stub_server(*args, **kwargs)
+        started.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in started:
+        server.shutdown()
+        server.server_close()
+
+
+def hedged(http_client, urls, **kwargs) -> HedgedGeocodingClient:
+    return HedgedGeocodingClient(
+        [(url, NominatimClient(http_client, base_url=url)) for url in urls], **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_primary_answers_without_hedging(http_client, servers):
+    client = hedged(http_client, [servers("primary"), servers("mirror")])
+
+    result = await client.geocode("Paris")
+
+    assert result.address == "primary"
+    assert client.stats()["hedges"] == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged(http_client, servers):
+    client = hedged(
+        http_client,
+        [servers("primary", delay=1.0), servers("mirror")],
+        initial_hedge_delay=0.05,
+    )
+
+    start = time.monotonic()
+    result = await client.geocode("Paris")
+
+    assert result.address == "mirror"
+    assert time.monotonic() - start < 0.9
+    assert client.stats()["hedges"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failing_primary_fails_over(http_client, servers):
+    primary = servers("primary", status=503)
+    client = hedged(http_client, [primary, servers("mirror")])
+
+    result = await client.geocode("Paris")
+
+    assert result.address == "mirror"
+    assert client.stats()["failovers"] == 1
+    assert client.stats()["providers"][primary]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_all_providers_failing_raises(http_client, servers):
+    client = hedged(
+        http_client, [servers("primary", status=500), servers("mirror", status=500)]
+    )
+
+    with pytest.raises(GeocodingError):
+        await client.geocode("Paris")
+
+
+@pytest.mark.asyncio
+async def test_address_not_found_is_final(http_client, servers):
+    primary = servers("primary", found=False)
+    mirror = servers("mirror")
+    client = hedged(http_client, [primary, mirror])
+
+    with pytest.raises(AddressNotFoundError):
+        await client.geocode("Nowhere")
+
+    stats = client.stats()
+    assert stats["failovers"] == 0
+    assert stats["providers"][primary]["errors"] == 0
+    assert stats["providers"][mirror]["requests"] == 0
@@ -0,0 +1,117 @@
+import pytest
+from src.core.clients.cache.cache import TTLCacheClient
+from src.core.clients.geocoding.base import GeocodingClient
+from src.core.clients.geocoding.cached import CachedGeocodingClient
+from src.core.clients.geocoding.exceptions import (
+    AddressNotFoundError,
+    CircuitOpenError,
+    GeocodingError,
+    RetryableGeocodingError,
+)
+from src.core.clients.geocoding.resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    ResilientGeocodingClient,
+)
+from src.distance.schemas import GeoLocation
+
+
+class ScriptedGeocodingClient(GeocodingClient):
+    """Raises the scripted errors in order, then succeeds."""
+
+    def __init__(self, *errors: Exception):
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def geocode(self, address: str) -> GeoLocation:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return GeoLocation(latitude=1.0, longitude=2.0, address=address)
+
+
+def test_breaker_opens_on_error_rate_and_recovers():
+    breaker = CircuitBreaker(window=4, min_calls=4, error_rate=0.5, reset_timeout=0)
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+def test_open_breaker_fails_fast():
+    breaker = CircuitBreaker(min_calls=1, reset_timeout=60)
+    breaker.record_failure()
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+@pytest.mark.asyncio
+async def test_retry_honors_retry_after(monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("asyncio.sleep", fake_sleep)
+    inner = ScriptedGeocodingClient(RetryableGeocodingError("429", retry_after=3))
+    client = ResilientGeocodingClient(inner, CircuitBreaker(), retries=2)
+
+    await client.geocode("Paris")
+
+    assert inner.calls == 2
+    assert delays == [3]
+
+
+@pytest.mark.asyncio
+async def test_retry_after_beyond_max_delay_is_not_waited():
+    inner = ScriptedGeocodingClient(RetryableGeocodingError("503", retry_after=120))
+    client = ResilientGeocodingClient(inner, CircuitBreaker(), max_delay=10)
+
+    with pytest.raises(RetryableGeocodingError):
+        await client.geocode("Paris")
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_unresolvable_address_does_not_trip_breaker():
+    breaker = CircuitBreaker(min_calls=1)
+    inner = ScriptedGeocodingClient(AddressNotFoundError("No results found"))
+    client = ResilientGeocodingClient(inner, breaker)
+
+    with pytest.raises(AddressNotFoundError):
+        await client.geocode("Nowhere")
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_permanent_errors_are_not_retried():
+    inner = ScriptedGeocodingClient(GeocodingError("Invalid response format"))
+    client = ResilientGeocodingClient(inner, CircuitBreaker())
+
+    with pytest.raises(GeocodingError):
+        await client.geocode("Paris")
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_unresolvable_addresses_are_negatively_cached():
+    inner = ScriptedGeocodingClient(AddressNotFoundError("No results found"))
+    client = CachedGeocodingClient(inner, TTLCacheClient())
+
+    for _ in range(2):
+        with pytest.raises(AddressNotFoundError, match="No results found"):
+            await client.geocode("Nowhere")
+    assert inner.calls == 1
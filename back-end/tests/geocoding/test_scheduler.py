@@ -0,0 +1,76 @@
+import asyncio
+import time
+import pytest
+from src.core.clients.geocoding.exceptions import SchedulerRejectedError
+from src.core.clients.geocoding.scheduler import Priority, RateScheduler
+
+
+def deadline(seconds: float) -> float:
+    return time.monotonic() + seconds
+
+
+@pytest.mark.asyncio
+async def test_burst_is_granted_immediately():
+    scheduler = RateScheduler(rate=1, burst=2)
+
+    await scheduler.acquire(Priority.INTERACTIVE, deadline(1))
+    await scheduler.acquire(Priority.INTERACTIVE, deadline(1))
+
+    assert scheduler.stats()["granted"] == 2
+    assert scheduler.stats()["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_interactive_calls_go_ahead_of_batch():
+    scheduler = RateScheduler(rate=50, burst=1)
+    await scheduler.acquire(Priority.INTERACTIVE, deadline(1))
+    order = []
+
+    async def call(priority: Priority):
+        await scheduler.acquire(priority, deadline(1))
+        order.append(priority)
+
+    batch = asyncio.create_task(call(Priority.BATCH))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(call(Priority.INTERACTIVE))
+    await asyncio.gather(batch, interactive)
+
+    assert order == [Priority.INTERACTIVE, Priority.BATCH]
+
+
+@pytest.mark.asyncio
+async def test_deadline_that_cannot_be_met_is_rejected_early():
+    scheduler = RateScheduler(rate=1, burst=1)
+    await scheduler.acquire(Priority.INTERACTIVE, deadline(1))
+
+    with pytest.raises(SchedulerRejectedError, match="deadline"):
+        await scheduler.acquire(Priority.INTERACTIVE, deadline(0.1))
+
+    assert scheduler.stats()["rejected_deadline"] == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_callers():
+    scheduler = RateScheduler(rate=10, burst=1, max_queue=1)
+    await scheduler.acquire(Priority.INTERACTIVE, deadline(1))
+    waiter = asyncio.create_task(scheduler.acquire(Priority.BATCH, deadline(1)))
+    await asyncio.sleep(0)
+
+    with pytest.raises(SchedulerRejectedError, match="full"):
+        await scheduler.acquire(Priority.BATCH, deadline(1))
+
+    await waiter
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiters_do_not_fill_the_queue():
+    scheduler = RateScheduler(rate=10, burst=1, max_queue=1)
+    await scheduler.acquire(Priority.INTERACTIVE, deadline(1))
+    waiter = asyncio.create_task(scheduler.acquire(Priority.BATCH, deadline(1)))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+
+    assert scheduler.stats()["queue_depth"] == 0
+    await scheduler.acquire(Priority.INTERACTIVE, deadline(1))
+    assert scheduler.stats()["granted"] == 2
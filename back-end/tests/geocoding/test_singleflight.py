@@ -0,0 +1,101 @@
+import asyncio
+import pytest
+from src.core.clients.geocoding.base import GeocodingClient
+from src.core.clients.geocoding.exceptions import (
+    GeocodingError,
+    SchedulerRejectedError,
+)
+from src.core.clients.geocoding.scheduler import Priority, geocode_priority
+from src.core.clients.geocoding.singleflight import SingleFlightGeocodingClient
+from src.distance.schemas import GeoLocation
+
+
+class SlowGeocodingClient(GeocodingClient):
+    def __init__(self, error: Exception = None, delay: float = 0.01):
+        self.calls = 0
+        self.error = error
+        self.delay = delay
+
+    async def geocode(self, address: str) -> GeoLocation:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return GeoLocation(latitude=1.0, longitude=2.0, address=address)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_are_coalesced():
+    inner = SlowGeocodingClient()
+    client = SingleFlightGeocodingClient(inner)
+
+    results = await asyncio.gather(
+        *(client.geocode(address) for address in ["Paris", "paris", " PARIS "])
+    )
+
+    assert inner.calls == 1
+    assert len({result.address for result in results}) == 1
+    assert client.stats() == {
+        "calls": 3,
+        "coalesced": 2,
+        "expired": 0,
+        "in_flight": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_all_waiters():
+    inner = SlowGeocodingClient(error=GeocodingError("No results found"))
+    client = SingleFlightGeocodingClient(inner)
+
+    results = await asyncio.gather(
+        client.geocode("Nowhere"), client.geocode("Nowhere"), return_exceptions=True
+    )
+
+    assert inner.calls == 1
+    assert all(isinstance(result, GeocodingError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_sequential_lookups_are_not_coalesced():
+    inner = SlowGeocodingClient()
+    client = SingleFlightGeocodingClient(inner)
+
+    await client.geocode("Paris")
+    await client.geocode("Paris")
+
+    assert inner.calls == 2
+
+
+async def geocode_as(client, address, priority):
+    geocode_priority.set(priority)
+    return await client.geocode(address)
+
+
+@pytest.mark.asyncio
+async def test_lookups_are_not_shared_across_priorities():
+    inner = SlowGeocodingClient()
+    client = SingleFlightGeocodingClient(inner)
+
+    await asyncio.gather(
+        geocode_as(client, "Paris", Priority.BATCH),
+        geocode_as(client, "Paris", Priority.INTERACTIVE),
+        geocode_as(client, "Paris", Priority.INTERACTIVE),
+    )
+
+    assert inner.calls == 2
+    assert client.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_joining_caller_gives_up_at_its_own_deadline():
+    inner = SlowGeocodingClient(delay=0.2)
+    client = SingleFlightGeocodingClient(inner, max_wait={Priority.INTERACTIVE: 0.01})
+
+    first = asyncio.create_task(client.geocode("Paris"))
+    await asyncio.sleep(0)
+    with pytest.raises(SchedulerRejectedError):
+        await client.geocode("Paris")
+
+    assert (await first).address == "Paris"
+    assert client.stats()["expired"] == 1
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from pydantic import ValidationError
+from src.history.schemas import HistoryFilters
+from src.history.service import build_query
+
+
+def test_no_filters_build_an_empty_query():
+    assert build_query(None) == {}
+    assert build_query(HistoryFilters()) == {}
+
+
+def test_filters_map_to_indexed_conditions():
+    since = datetime(2024, 1, 1)
+    query = build_query(
+        HistoryFilters(
+            address="123 Main Street",
+            search="Springfield",
+            min_km=10,
+            max_km=20.5,
+            since=since,
+            ip_address=" 203.0.113.7 ",
+        )
+    )
+
+    prefix = {"$regex": r"^123\ main\ street"}
+    assert query == {
+        "$or": [{"address1_key": prefix}, {"address2_key": prefix}],
+        "$text": {"$search": "springfield"},
+        "kilometers": {"$gte": 10, "$lte": 20.5},
+        "timestamp": {"$gte": since},
+        "ip_address": "203.0.113.7",
+    }
+
+
+def test_address_prefix_is_escaped():
+    query = build_query(HistoryFilters(address="a.b*"))
+
+    assert query["$or"][0]["address1_key"]["$regex"].startswith("^a")
+    assert "*" not in query["$or"][0]["address1_key"]["$regex"].replace("\\*", "")
+
+
+def test_address_prefix_keeps_a_partial_last_word():
+    assert HistoryFilters(address="Main S").address == "main s"
+    assert HistoryFilters(address="10 Main St").address == "10 main st"
+    assert HistoryFilters(address="10 Main St,").address == "10 main street"
+    assert HistoryFilters(address="Ave Maria Rd").address == "avenue maria rd"
+
+
+def test_equivalent_filters_share_a_signature():
+    first = HistoryFilters(
+        address="Main Street Springfield",
+        search="New  York",
+        min_km=1.0,
+        ip_address="1.2.3.4",
+    )
+    second = HistoryFilters(
+        address="main st, springfield",
+        search="new york",
+        min_km=1,
+        ip_address=" 1.2.3.4",
+    )
+
+    assert first.signature() == second.signature()
+    assert first.signature() != HistoryFilters(address="main").signature()
+
+
+def test_aware_times_are_compared_as_naive_utc():
+    filters = HistoryFilters(
+        since=datetime(2024, 1, 1, 12, tzinfo=timezone(timedelta(hours=2)))
+    )
+
+    assert filters.since == datetime(2024, 1, 1, 10)
+
+
+def test_inverted_ranges_are_rejected():
+    with pytest.raises(ValidationError):
+        HistoryFilters(min_km=5, max_km=1)
+    with pytest.raises(ValidationError):
+        HistoryFilters(since=datetime(2024, 2, 1), until=datetime(2024, 1, 1))
@@ -0,0 +1,104 @@
+import pytest
+from src.history.cursor import InvalidCursorError, decode_cursor, encode_cursor
+from src.history.page import HISTORY_FIELDS
+from src.history.schemas import HistoryListResponse
+from src.history.service import HistoryService
+
+
+def query_id(index):
+    return f"{index:024x}"
+
+
+async def add_queries(database_client, total):
+    await database_client.create_many(
+        [
+            {
+                "_id": query_id(index),
+                "kilometers": float(index),
+                "miles": float(index),
+                "address1": f"From {index}",
+                "address2": f"To {index}",
+            }
+            for index in range(total)
+        ]
+    )
+    return database_client
+
+
+def ids(response):
+    return [int(item.query_id, 16) for item in response.items]
+
+
+def test_cursor_round_trip_and_invalid_token():
+    record_id = "65f1c0ffee0000000000beef"
+    assert decode_cursor(encode_cursor(record_id)) == record_id
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("!!!")
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor("not-an-object-id"))
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_walk_forward_and_back_by_id_range(database_client):
+    await add_queries(database_client, total=7)
+    service = HistoryService(database_client)
+
+    first = await service.get_history_page(page_size=3)
+    assert ids(first) == [6, 5, 4]
+    assert first.cursor["previous"] is None
+    assert first.cursor["total"] is None
+
+    second = await service.get_history_page(after=first.cursor["next"], page_size=3)
+    assert ids(second) == [3, 2, 1]
+
+    last = await service.get_history_page(after=second.cursor["next"], page_size=3)
+    assert ids(last) == [0]
+    assert last.cursor["next"] is None
+
+    back = await service.get_history_page(before=last.cursor["previous"], page_size=3)
+    assert ids(back) == [3, 2, 1]
+    back = await service.get_history_page(before=back.cursor["previous"], page_size=3)
+    assert ids(back) == [6, 5, 4]
+    assert back.cursor["previous"] is None
+
+    finds = database_client.called("find_many")
+    assert finds and all(call.get("skip", 0) == 0 for call in finds)
+
+
+@pytest.mark.asyncio
+async def test_cursor_page_total_is_optional_estimate(database_client):
+    service = HistoryService(await add_queries(database_client, total=4))
+
+    response = await service.get_history_page(page_size=2, include_total=True)
+
+    assert response.cursor["total"] == 4
+    assert len(database_client.called("estimated_count")) == 1
+    assert response.pagination is None
+
+
+@pytest.mark.asyncio
+async def test_page_mode_returns_cursor_to_continue_by_keyset(database_client):
+    service = HistoryService(await add_queries(database_client, total=5))
+
+    page = await service.get_history(page=2, page_size=2)
+    assert ids(page) == [2, 1]
+    assert page.pagination["total"] == 5
+    assert page.pagination["total_pages"] == 3
+
+    following = await service.get_history_page(after=page.cursor["next"], page_size=2)
+    assert ids(following) == [0]
+
+
+@pytest.mark.asyncio
+async def test_page_is_projected_and_renders_the_response_schema(database_client):
+    await add_queries(database_client, total=3)
+    service = HistoryService(database_client)
+
+    page = await service.get_history(page=1, page_size=2)
+    body = HistoryListResponse.model_validate_json(page.to_json())
+
+    assert database_client.called("find_many")[0]["projection"] == HISTORY_FIELDS
+    assert [item.query_id for item in body.items] == [query_id(2), query_id(1)]
+    assert body.items[0].kilometers == 2.0
+    assert body.pagination.total == 3
+    assert body.cursor.next == page.cursor["next"]
@@ -55,3 +55,13 @@ async def test_get_history_with_limit(client):
     assert response.status_code == 200
     data = response.json()
     assert len(data["queries"]) <= 5
+
+
+@pytest.mark.asyncio
+async def test_get_history_rejects_after_and_before_together(client):
+    token = "NjVmMWMwZmZlZTAwMDAwMDAwMDBiZWVm"
+    response = await client.get(
+        f"{settings.API_PREFIX}/history", params={"after": token, "before": token}
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,326 @@
+import asyncio
+import itertools
+from datetime import datetime, timedelta
+from typing import Any, Dict
+import pytest
+from bson import ObjectId
+from src.core.clients.cache.cache import TTLCacheClient
+from src.core.clients.database.base import DatabaseClient
+from src.core.clients.geocoding.base import GeocodingClient
+from src.core.clients.geocoding.exceptions import AddressNotFoundError
+from src.distance.schemas import GeoLocation
+from src.distance.service import DistanceService
+from src.jobs.exceptions import JobNotFoundError
+from src.jobs.schemas import JobStatus
+from src.jobs.service import JobService
+
+LOCATIONS = {
+    "New York, NY": (40.7128, -74.0060),
+    "Los Angeles, CA": (34.0522, -118.2437),
+    "Chicago, IL": (41.8781, -87.6298),
+}
+
+PAIRS = [
+    ("New York, NY", "Los Angeles, CA"),
+    ("Chicago, IL", "Nowhere"),
+    ("Los Angeles, CA", "Chicago, IL"),
+]
+
+
+def matches(record: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    for field, condition in filters.items():
+        value = record.get(field)
+        if field == "$or":
+            if not any(matches(record, part) for part in condition):
+                return False
+        elif isinstance(condition, dict):
+            if "$in" in condition and value not in condition["$in"]:
+                return False
+            if "$gte" in condition and not value >= condition["$gte"]:
+                return False
+            if "$lt" in condition and (value is None or value >= condition["$lt"]):
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+class MockGeocodingClient(GeocodingClient):
+    async def geocode(self, address: str) -> GeoLocation:
+        if address not in LOCATIONS:
+            raise AddressNotFoundError(f"No results found for address: {address}")
+        latitude, longitude = LOCATIONS[address]
+        return GeoLocation(latitude=latitude, longitude=longitude, address=address)
+
+
+class InMemoryDatabaseClient(DatabaseClient):
+    def __init__(self):
+        self.records = {}
+        self.ids = itertools.count()
+
+    async def create(self, data):
+        record_id = str(data.get("_id") or next(self.ids))
+        self.records.setdefault(record_id, {**data, "_id": record_id})
+        return record_id
+
+    async def create_many(self, data):
+        return [await self.create(record) for record in data]
+
+    async def find_many(
+        self,
+        skip=0,
+        limit=10,
+        sort_by="_id",
+        sort_order="desc",
+        filters=None,
+        projection=None,
+    ):
+        records = sorted(
+            (r for r in self.records.values() if matches(r, filters or {})),
+            key=lambda record: record[sort_by],
+            reverse=sort_order == "desc",
+        )
+        records = records[skip : skip + limit] if limit else records[skip:]
+        if projection is not None:
+            fields = ["_id", *projection]
+            records = [
+                {field: record[field] for field in fields if field in record}
+                for record in records
+            ]
+        return records
+
+    async def find_by_id(self, record_id):
+        record = self.records.get(record_id)
+        return dict(record) if record else None
+
+    async def update(self, record_id, data):
+        self.records[record_id].update(data)
+
+    async def update_if(self, record_id, filters, data):
+        record = self.records.get(record_id)
+        if record is None or not matches(record, filters):
+            return False
+        record.update(data)
+        return True
+
+    async def delete_many(self, filters):
+        doomed = [k for k, r in self.records.items() if matches(r, filters)]
+        for key in doomed:
+            del self.records[key]
+        return len(doomed)
+
+    async def increment_many(self, updates):
+        pass
+
+    async def upsert_many(self, updates):
+        pass
+
+    async def count(self, filters=None):
+        return len(await self.find_many(limit=0, filters=filters))
+
+    async def close(self):
+        pass
+
+
+def create_job_service(jobs=None, results=None, **kwargs) -> JobService:
+    return JobService(
+        jobs or InMemoryDatabaseClient(),
+        results or InMemoryDatabaseClient(),
+        lambda: DistanceService(MockGeocodingClient(), InMemoryDatabaseClient()),
+        **kwargs,
+    )
+
+
+async def wait_until_finished(service: JobService, job_id: str):
+    for _ in range(200):
+        job = await service.get_job(job_id)
+        if job.status.finished:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+@pytest.mark.asyncio
+async def test_job_processes_pairs_in_chunks_and_persists_results():
+    service = create_job_service(chunk_size=2)
+    await service.start()
+    try:
+        job_id = await service.submit(PAIRS)
+        job = await wait_until_finished(service, job_id)
+    finally:
+        await service.stop()
+
+    assert job.status == JobStatus.COMPLETED
+    assert (job.total, job.processed, job.succeeded, job.failed) == (3, 3, 2, 1)
+
+    job = await service.get_job(job_id, limit=10)
+    assert [item.index for item in job.results] == [0, 1, 2]
+    assert job.results[0].result.kilometers > 3900
+    assert job.results[1].result is None
+    assert "Nowhere" in job.results[1].errors[0]
+
+
+@pytest.mark.asyncio
+async def test_each_chunk_clears_cached_history_pages():
+    cache = TTLCacheClient()
+    service = create_job_service(chunk_size=2, cache=cache)
+    service._queue = asyncio.Queue()
+    job_id = await service.submit(PAIRS[:2])
+    await cache.set("page", {"items": []}, "history")
+
+    await service.run(job_id)
+
+    assert await cache.get("page", "history") is None
+
+
+@pytest.mark.asyncio
+async def test_job_resumes_from_last_chunk_after_restart():
+    jobs, results = InMemoryDatabaseClient(), InMemoryDatabaseClient()
+    service = create_job_service(jobs, results, chunk_size=2)
+    service._queue = asyncio.Queue()
+    job_id = await service.submit(PAIRS)
+
+    # Simulate a crash part-way through the second chunk: the first chunk is
+    # recorded, and one stray result of the second was written.
+    await jobs.update(
+        job_id,
+        {"status": "running", "processed": 2, "succeeded": 1, "failed": 1},
+    )
+    await results.create_many(
+        [{"job_id": job_id, "index": i, "result": None, "errors": []} for i in (0, 1, 2)]
+    )
+
+    restarted = create_job_service(jobs, results, chunk_size=2)
+    await restarted.start()
+    try:
+        job = await wait_until_finished(restarted, job_id)
+    finally:
+        await restarted.stop()
+
+    assert job.status == JobStatus.COMPLETED
+    assert (job.processed, job.succeeded, job.failed) == (3, 2, 1)
+    job = await restarted.get_job(job_id, limit=10)
+    assert [item.index for item in job.results] == [0, 1, 2]
+    assert job.results[2].result is not None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_job_stops_before_next_chunk():
+    service = create_job_service(chunk_size=1)
+    service._queue = asyncio.Queue()
+    job_id = await service.submit(PAIRS)
+
+    job = await service.cancel(job_id)
+    await service.run(job_id)
+
+    assert job.status == JobStatus.CANCELLED
+    job = await service.get_job(job_id, limit=10)
+    assert job.status == JobStatus.CANCELLED
+    assert job.processed == 0
+    assert job.results == []
+
+
+@pytest.mark.asyncio
+async def test_watch_yields_progress_until_finished():
+    service = create_job_service(chunk_size=1)
+    await service.start()
+    try:
+        job_id = await service.submit(PAIRS)
+        updates = [job async for job in service.watch(job_id, interval=0.001)]
+    finally:
+        await service.stop()
+
+    assert updates[-1].status == JobStatus.COMPLETED
+    assert [job.processed for job in updates] == sorted(
+        job.processed for job in updates
+    )
+
+
+@pytest.mark.asyncio
+async def test_unknown_job_raises():
+    service = create_job_service()
+
+    with pytest.raises(JobNotFoundError):
+        await service.get_job("missing")
+
+
+@pytest.mark.asyncio
+async def test_interrupted_chunk_is_not_recorded_twice():
+    jobs, results, history = (
+        InMemoryDatabaseClient(),
+        InMemoryDatabaseClient(),
+        InMemoryDatabaseClient(),
+    )
+    service = JobService(
+        jobs,
+        results,
+        lambda: DistanceService(MockGeocodingClient(), history),
+        chunk_size=2,
+    )
+    service._queue = asyncio.Queue()
+    job_id = await service.submit(PAIRS)
+    query_ids = [str(ObjectId()) for _ in range(2)]
+
+    # Simulate a crash after the first chunk's history was written but
+    # before its progress was recorded.
+    await jobs.update(
+        job_id,
+        {"status": "running", "chunk": {"start": 0, "query_ids": query_ids}},
+    )
+    await history.create({"_id": query_ids[0], "address1": "New York, NY"})
+
+    await service.run(job_id)
+
+    job = await service.get_job(job_id)
+    assert job.status == JobStatus.COMPLETED
+    assert (job.processed, job.succeeded, job.failed) == (3, 2, 1)
+    assert len(history.records) == 2
+    assert query_ids[0] in history.records
+
+
+@pytest.mark.asyncio
+async def test_job_leased_by_another_instance_is_not_claimed():
+    jobs = InMemoryDatabaseClient()
+    service = create_job_service(jobs)
+    service._queue = asyncio.Queue()
+    job_id = await service.submit(PAIRS)
+    await jobs.update(
+        job_id,
+        {
+            "status": "running",
+            "owner": "other",
+            "lease_until": datetime.utcnow() + timedelta(minutes=1),
+        },
+    )
+
+    await service.run(job_id)
+    assert (await service.get_job(job_id)).processed == 0
+
+    expired = datetime.utcnow() - timedelta(seconds=1)
+    await jobs.update(job_id, {"lease_until": expired})
+    await service.run(job_id)
+    assert (await service.get_job(job_id)).status == JobStatus.COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_cancel_during_a_chunk_is_not_overwritten():
+    jobs = InMemoryDatabaseClient()
+
+    class CancellingGeocodingClient(MockGeocodingClient):
+        async def geocode(self, address: str) -> GeoLocation:
+            await jobs.update(job_id, {"status": "cancelled"})
+            return await super().geocode(address)
+
+    service = JobService(
+        jobs,
+        InMemoryDatabaseClient(),
+        lambda: DistanceService(CancellingGeocodingClient(), InMemoryDatabaseClient()),
+    )
+    service._queue = asyncio.Queue()
+    job_id = await service.submit(PAIRS)
+
+    await service.run(job_id)
+
+    job = await service.get_job(job_id)
+    assert job.status == JobStatus.CANCELLED
+    assert job.processed == 0
@@ -0,0 +1,187 @@
+import gzip
+import os
+from datetime import datetime, timedelta
+import pytest
+from bson import json_util
+from src.analytics.service import AnalyticsService
+from src.core.clients.cache.cache import TTLCacheClient
+from src.core.clients.database.lease import Lease
+from src.core.clients.database.sqlite import SQLiteDatabaseClient
+from src.retention.service import ArchiveWriter, RetentionService
+
+NOW = datetime(2024, 6, 1)
+
+
+async def add_days(database_client, days):
+    return await database_client.create_many(
+        [
+            {
+                "address1": f"From {day}",
+                "address2": f"To {day}",
+                "timestamp": NOW - timedelta(days=day),
+            }
+            for day in days
+        ]
+    )
+
+
+def read_archive(directory):
+    records = []
+    for name in sorted(os.listdir(directory)):
+        with gzip.open(os.path.join(directory, name), "rt") as segment:
+            records.extend(json_util.loads(line) for line in segment)
+    return records
+
+
+@pytest.mark.asyncio
+async def test_compaction_deletes_expired_records_in_batches(database_client):
+    await add_days(database_client, [1, 5, 31, 40, 50, 60, 70])
+    service = RetentionService(
+        database_client, max_age_days=30, batch_size=2, duty_cycle=1
+    )
+
+    deleted = await service.compact(now=NOW)
+
+    assert deleted == 5
+    remaining = await database_client.find_many(limit=0, sort_by="timestamp")
+    assert [record["address1"] for record in remaining] == ["From 1", "From 5"]
+    assert service.stats()["deleted_records"] == 5
+    assert await service.compact(now=NOW) == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_records_are_archived_before_deletion(database_client, tmp_path):
+    await add_days(database_client, [1, 40, 50, 60])
+    archive_path = str(tmp_path / "archive")
+    archive = ArchiveWriter(archive_path, "queries", segment_records=2)
+    service = RetentionService(
+        database_client, max_age_days=30, archive=archive, batch_size=2, duty_cycle=1
+    )
+
+    await service.compact(now=NOW)
+
+    archived = read_archive(archive_path)
+    assert len(os.listdir(archive_path)) == 2
+    assert [record["address1"] for record in archived] == [
+        "From 60",
+        "From 50",
+        "From 40",
+    ]
+    assert archived[0]["timestamp"] == NOW - timedelta(days=60)
+    assert await database_client.count() == 1
+
+
+@pytest.mark.asyncio
+async def test_records_touched_after_they_were_read_are_kept(database_client):
+    pairs = database_client
+    ids = await pairs.create_many(
+        [
+            {"address1": f"From {day}", "last_seen": NOW - timedelta(days=day)}
+            for day in (40, 50)
+        ]
+    )
+    delete_many = pairs.delete_many
+
+    async def query_again_then_delete(filters):
+        # The pair is queried again after it was read and archived.
+        await pairs.update(ids[0], {"last_seen": NOW})
+        return await delete_many(filters)
+
+    pairs.delete_many = query_again_then_delete
+    service = RetentionService(pairs, field="last_seen", max_age_days=30)
+
+    assert await service.compact(now=NOW) == 1
+    assert [record["_id"] for record in await pairs.find_many(limit=0)] == [ids[0]]
+    assert service.stats()["deleted_records"] == 1
+
+
+@pytest.mark.asyncio
+async def test_only_the_lease_holder_compacts(database_client):
+    await add_days(database_client, [40, 50])
+    leases = SQLiteDatabaseClient(database_client.database, "leases")
+    holder = Lease(leases, "retention:queries")
+    await holder.acquire()
+    service = RetentionService(
+        database_client, max_age_days=30, lease=Lease(leases, "retention:queries")
+    )
+
+    assert await service.compact(now=NOW) == 0
+    assert await database_client.count() == 2
+
+    await holder.release()
+    assert await service.compact(now=NOW) == 2
+    assert await holder.acquire()
+
+
+@pytest.mark.asyncio
+async def test_compaction_clears_cached_history_pages(database_client):
+    await add_days(database_client, [1, 40])
+    cache = TTLCacheClient()
+    await cache.set("page:1", b"[]", "history")
+    service = RetentionService(database_client, max_age_days=30, cache=cache)
+
+    await service.compact(now=NOW)
+
+    assert await cache.get("page:1", "history") is None
+
+
+@pytest.mark.asyncio
+async def test_compaction_expires_daily_rollups(database_client):
+    rollups = SQLiteDatabaseClient(database_client.database, "rollups")
+    analytics = AnalyticsService(rollups)
+    await analytics.record(
+        [
+            {
+                "address1": "A",
+                "address2": "B",
+                "address1_key": "a",
+                "address2_key": "b",
+                "kilometers": 1.0,
+                "timestamp": NOW - timedelta(days=day),
+            }
+            for day in (1, 40)
+        ]
+    )
+    service = RetentionService(database_client, max_age_days=30, analytics=analytics)
+
+    await service.compact(now=NOW)
+
+    remaining = await analytics.database_client.find_many(limit=0, sort_by="_id")
+    assert sorted(record["kind"] for record in remaining) == [
+        "day",
+        "distance",
+        "pair",
+        "pair_day",
+    ]
+    assert service.stats()["expired_rollups"] == 2
+
+
+@pytest.mark.asyncio
+async def test_ttl_index_follows_the_settings(database_client):
+    client = database_client
+
+    await RetentionService(client, max_age_days=7, ttl_index=True).sync_ttl_index()
+    await RetentionService(client, max_age_days=7).sync_ttl_index()
+
+    [ensured] = client.called("ensure_indexes")
+    assert ensured["indexes"][0].name == "timestamp_ttl"
+    assert ensured["indexes"][0].options == {"expireAfterSeconds": 7 * 86400}
+    assert client.called("drop_indexes") == [{"names": ["timestamp_ttl"]}]
+
+
+def test_ttl_index_cannot_skip_the_archive(database_client, tmp_path):
+    with pytest.raises(ValueError):
+        RetentionService(
+            database_client,
+            max_age_days=7,
+            archive=ArchiveWriter(str(tmp_path), "queries"),
+            ttl_index=True,
+        )
+
+
+def test_history_is_kept_forever_by_default(database_client):
+    service = RetentionService(database_client)
+
+    service.start()
+
+    assert service._task is None